@@ -10,6 +10,7 @@ cd src/
 
 python manage.py collectstatic --no-input
 python manage.py migrate
+python manage.py createcachetable
 python manage.py makesuperuser
 python manage.py importlanguages --import_images
 python manage.py importwordtypes
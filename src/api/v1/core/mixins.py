@@ -1,17 +1,20 @@
 """API views mixins."""
 
+import hashlib
 import operator
 import logging
-from functools import reduce
-from typing import Type
+from functools import reduce, wraps
+from typing import Callable, Type
 
+from django.core.cache import cache
 from django.db import transaction
 from django.core.exceptions import ObjectDoesNotExist
-from django.utils.translation import gettext as _
+from django.utils.translation import get_language, gettext as _
 from django.db.models import Q, Model
 from django.db.models.query import QuerySet
 from django.http import HttpRequest, HttpResponse
 
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.exceptions import NotFound
@@ -20,6 +23,7 @@ from rest_framework.serializers import Serializer
 from rest_framework.viewsets import GenericViewSet
 
 from api.v1.core.exceptions import ObjectAlreadyExist, AmountLimitExceeded
+from api.v1.core.serializers_mixins import SparseFieldsetsSerializerMixin
 from utils.checkers import check_amount_limit
 
 logger = logging.getLogger(__name__)
@@ -118,15 +122,17 @@ class ActionsWithRelatedObjectsMixin:
                 ]
                 search_term = request.query_params.get('search', '')
                 queries = [Q(**{orm_lookup: search_term}) for orm_lookup in orm_lookups]
+                # objects matched by several related objects are not repeated
                 objs = (
                     instance.__getattribute__(objs_related_name)
                     .filter((reduce(operator.or_, queries)))
                     .order_by(*ordering)
+                    .distinct()
                 )
             else:
                 objs = instance.__getattribute__(objs_related_name).order_by(*ordering)
 
-        logger.debug(f'Obtained objects: {objs}')
+        logger.debug('Obtained objects: %s', objs)
 
         serializer_class = (
             serializer_class if serializer_class else self.get_serializer_class()
@@ -167,9 +173,13 @@ class ActionsWithRelatedObjectsMixin:
         page = self.paginate_queryset(objs)
 
         serializer = (
-            serializer_class(page or objs, many=True, context={'request': request})
+            serializer_class(
+                page if page is not None else objs,
+                many=True,
+                context={'request': request},
+            )
             if serializer_class
-            else self.get_serializer(page or objs, many=True)
+            else self.get_serializer(page if page is not None else objs, many=True)
         )
 
         if page:
@@ -206,10 +216,10 @@ class ActionsWithRelatedObjectsMixin:
         logger.debug(
             f'Paginating related objects with pagination class: {type(paginator)}'
         )
-        page = paginator.paginate_queryset(objs, request, self)
+        page = paginator.paginate_queryset(objs, request, view)
 
         _objs_serializer_data = serializer_class(
-            page or objs, many=True, context={'request': request}
+            page if page is not None else objs, many=True, context={'request': request}
         ).data
 
         if page is not None:
@@ -458,6 +468,116 @@ class ActionsWithRelatedObjectsMixin:
                 return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+class SparseFieldsetsMixin:
+    """
+    Custom mixin to pass sparse fieldsets from `fields`, `expand` query params
+    (comma separated fields names) to serializer context for safe methods and to
+    prefetch only related objects needed for requested fields.
+    """
+
+    fields_query_param = 'fields'
+    expand_query_param = 'expand'
+
+    def get_fieldset(self, query_param: str) -> set[str] | None:
+        """Returns fields names passed in query param or None if not passed."""
+        value = self.request.query_params.get(query_param, None)
+        if value is None or self.request.method not in SAFE_METHODS:
+            return None
+        return {field_name.strip() for field_name in value.split(',')} - {''}
+
+    def get_serializer_context(self) -> dict:
+        return {
+            **super().get_serializer_context(),
+            'fields': self.get_fieldset(self.fields_query_param),
+            'expand': self.get_fieldset(self.expand_query_param),
+        }
+
+    def prefetch_represented(self, queryset: QuerySet, *lookups) -> QuerySet:
+        """
+        Returns queryset with passed lookups prefetched, lookups needed only for
+        fields omitted by sparse fieldsets are skipped.
+        """
+        serializer = self.get_serializer()
+        if isinstance(serializer, SparseFieldsetsSerializerMixin):
+            lookups = serializer.filter_prefetch_related(lookups)
+        return queryset.prefetch_related(*lookups)
+
+
+class VersionedResponseCacheMixin:
+    """
+    Custom mixin to cache authenticated users safe requests responses data. Cache
+    keys contain version returned by `get_cache_version`, which must change on any
+    write to represented data, so outdated responses are never deleted one by one
+    but are not reachable anymore and expire. Actions listed in
+    `conditional_actions` are wrapped with `get_conditional_handler`, so
+    conditional requests are answered before cached responses are used.
+    """
+
+    response_cache_key = 'responses-{user_id}-{version}-{request_hash}'
+    response_cache_timeout = 60 * 60
+    non_cached_actions: tuple[str] = ()
+    conditional_actions: tuple[str] = ()
+
+    def get_cache_version(self, request: HttpRequest) -> str | None:
+        """Returns version of data represented by view, None disables caching."""
+        return None
+
+    def get_conditional_handler(self, handler: Callable) -> Callable:
+        """Returns handler wrapped with conditional requests processing."""
+        return handler
+
+    def get_response_cache_key(self, request: HttpRequest) -> str | None:
+        """
+        Returns current request response cache key or None if response must not
+        be cached.
+        """
+        if (
+            request.method not in SAFE_METHODS
+            or not request.user.is_authenticated
+            or self.action in self.non_cached_actions
+        ):
+            return None
+        version = self.get_cache_version(request)
+        if version is None:
+            return None
+        request_hash = hashlib.md5(
+            f'{request.build_absolute_uri()}:{get_language()}'.encode()
+        ).hexdigest()
+        return self.response_cache_key.format(
+            user_id=request.user.pk, version=version, request_hash=request_hash
+        )
+
+    def cache_handler(self, handler: Callable, cache_key: str) -> Callable:
+        """Returns handler wrapped to return cached response data if exists."""
+
+        @wraps(handler)
+        def cached_handler(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+            data = cache.get(cache_key)
+            if data is not None:
+                logger.debug(f'Returning cached response: {cache_key}')
+                return Response(data)
+            response = handler(request, *args, **kwargs)
+            if response.status_code == status.HTTP_200_OK and response.data is not None:
+                cache.set(cache_key, response.data, self.response_cache_timeout)
+            return response
+
+        return cached_handler
+
+    def initial(self, request: HttpRequest, *args, **kwargs) -> None:
+        """Wrap request method handler after authentication, permissions checks."""
+        super().initial(request, *args, **kwargs)
+        method = request.method.lower()
+        handler = getattr(self, method, None)
+        if handler is None:
+            return
+        cache_key = self.get_response_cache_key(request)
+        if cache_key is not None:
+            handler = self.cache_handler(handler, cache_key)
+        if self.action in self.conditional_actions:
+            handler = self.get_conditional_handler(handler)
+        setattr(self, method, handler)
+
+
 class DestroyReturnListMixin:
     """Custom mixin to return remain objects list after deleting current object."""
 
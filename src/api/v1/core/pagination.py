@@ -1,6 +1,23 @@
 """Custom pagination."""
 
-from rest_framework.pagination import PageNumberPagination
+import datetime
+import json
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, Q, Value
+from django.db.models.functions import Coalesce
+from django.db.models.query import QuerySet
+from django.http import HttpRequest, HttpResponse
+
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import (
+    CursorPagination,
+    PageNumberPagination,
+    _reverse_ordering,
+)
+from rest_framework.settings import api_settings
+
+from apps.core.constants import ExceptionDetails
 
 
 class LimitPagination(PageNumberPagination):
@@ -8,3 +25,226 @@ class LimitPagination(PageNumberPagination):
     page_query_param = 'page'
     page_size_query_param = 'limit'
     max_page_size = 1056
+
+
+class LimitCursorPagination(CursorPagination):
+    """
+    Keyset pagination with stable keys, does not count objects amount and does not
+    use offset scan to get deep pages. Requested ordering is followed by unique
+    tie-breaker keys and cursor position holds values of all ordering keys, so
+    objects with equal values of requested field are not skipped or duplicated
+    between pages.
+    """
+
+    page_size = LimitPagination.page_size
+    page_size_query_param = LimitPagination.page_size_query_param
+    max_page_size = LimitPagination.max_page_size
+    ordering = ('-created', '-id')
+    # keys appended to requested ordering to make objects positions unique
+    tie_breakers = ('-created', '-id')
+    # nullable keys are replaced with default values, as position can not be
+    # compared with null
+    nullable_keys_defaults = {
+        'DateTimeField': datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc),
+    }
+    nullable_key_alias = 'cursor_{key}'
+
+    def get_ordering(self, request: HttpRequest, queryset: QuerySet, view) -> tuple:
+        """
+        Returns ordering passed in query params followed by tie-breaker keys or
+        default stable keys ordering (view default ordering is ignored, it may
+        start with nullable field).
+        """
+        if view is None or not request.query_params.get(api_settings.ORDERING_PARAM):
+            return self.ordering
+        ordering = super().get_ordering(request, queryset, view)
+        keys = {order.lstrip('-') for order in ordering}
+        return (
+            *ordering,
+            *(order for order in self.tie_breakers if order.lstrip('-') not in keys),
+        )
+
+    def get_keys_queryset(self, queryset: QuerySet) -> QuerySet:
+        """
+        Annotates queryset with nullable ordering keys replaced with default
+        values, replaces these keys in ordering with annotated ones.
+        """
+        ordering = []
+        annotations = {}
+        for order in self.ordering:
+            key = order.lstrip('-')
+            try:
+                field = queryset.model._meta.get_field(key)
+            except (AttributeError, FieldDoesNotExist):
+                # annotated keys and merged querysets keys are not nullable
+                ordering.append(order)
+                continue
+            if not field.null:
+                ordering.append(order)
+                continue
+            try:
+                default = self.nullable_keys_defaults[field.get_internal_type()]
+            except KeyError:
+                raise ValidationError(
+                    {
+                        api_settings.ORDERING_PARAM: [
+                            ExceptionDetails.Pagination.CURSOR_ORDERING_NOT_SUPPORTED
+                        ]
+                    }
+                )
+            alias = self.nullable_key_alias.format(key=key)
+            annotations[alias] = Coalesce(key, Value(default))
+            ordering.append(order.replace(key, alias))
+        self.ordering = tuple(ordering)
+        return queryset.annotate(**annotations) if annotations else queryset
+
+    def get_position_filter(self, position: list[str], reverse: bool) -> Q:
+        """
+        Returns filter of objects following position: objects with greater
+        (lesser for descending keys) first key or with equal first key and
+        following position of next keys.
+        """
+        position_filter = None
+        for order, value in zip(reversed(self.ordering), reversed(position)):
+            key = order.lstrip('-')
+            lookup = 'lt' if order.startswith('-') != reverse else 'gt'
+            key_filter = Q(**{f'{key}__{lookup}': value})
+            position_filter = (
+                key_filter
+                if position_filter is None
+                else key_filter | (Q(**{key: value}) & position_filter)
+            )
+        return position_filter
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: HttpRequest, view=None
+    ) -> list | None:
+        """
+        Returns page of objects following cursor position (filtered by all
+        ordering keys values, base class filters by first key value only).
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        queryset = self.get_keys_queryset(queryset)
+
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            offset, reverse, current_position = 0, False, None
+        else:
+            offset, reverse, current_position = self.cursor
+
+        if reverse:
+            queryset = queryset.order_by(*_reverse_ordering(self.ordering))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        if current_position is not None:
+            try:
+                position = json.loads(current_position)
+            except ValueError:
+                raise NotFound(self.invalid_cursor_message)
+            if not isinstance(position, list) or len(position) != len(self.ordering):
+                raise NotFound(self.invalid_cursor_message)
+            queryset = queryset.filter(self.get_position_filter(position, reverse))
+
+        # extra object is fetched to check if following page exists
+        results = list(queryset[offset : offset + self.page_size + 1])
+        self.page = results[: self.page_size]
+
+        if len(results) > len(self.page):
+            has_following_position = True
+            following_position = self._get_position_from_instance(
+                results[-1], self.ordering
+            )
+        else:
+            has_following_position = False
+            following_position = None
+
+        if reverse:
+            # reversed page objects are reversed back to requested ordering
+            self.page.reverse()
+            self.has_next = current_position is not None or offset > 0
+            self.has_previous = has_following_position
+            if self.has_next:
+                self.next_position = current_position
+            if self.has_previous:
+                self.previous_position = following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = current_position is not None or offset > 0
+            if self.has_next:
+                self.next_position = following_position
+            if self.has_previous:
+                self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+    def _get_position_from_instance(
+        self, instance: Model | dict, ordering: tuple
+    ) -> str:
+        """Returns object position with values of all ordering keys."""
+        keys = [order.lstrip('-') for order in ordering]
+        if isinstance(instance, dict):
+            return json.dumps([str(instance[key]) for key in keys])
+        return json.dumps([str(getattr(instance, key)) for key in keys])
+
+
+class LimitOrCursorPagination(LimitPagination):
+    """
+    Page number pagination which switches to keyset pagination if
+    `pagination=cursor` or `cursor` query param is passed.
+    Keeps `results`, `next`, `previous` response fields in both modes.
+    """
+
+    pagination_mode_query_param = 'pagination'
+    cursor_pagination_class = LimitCursorPagination
+
+    cursor_paginator = None
+
+    def is_cursor_requested(self, request: HttpRequest) -> bool:
+        return (
+            request.query_params.get(self.pagination_mode_query_param) == 'cursor'
+            or self.cursor_pagination_class.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: HttpRequest, view=None
+    ) -> list | None:
+        if self.is_cursor_requested(request):
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data: list) -> HttpResponse:
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_schema_operation_parameters(self, view) -> list[dict]:
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                'name': self.pagination_mode_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Pass `cursor` to use keyset pagination.',
+                'schema': {'type': 'string', 'enum': ['cursor']},
+            },
+            {
+                'name': self.cursor_pagination_class.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': str(
+                    self.cursor_pagination_class.cursor_query_description
+                ),
+                'schema': {'type': 'string'},
+            },
+        ]
@@ -117,6 +117,23 @@ class KwargsMethodField(serializers.SerializerMethodField):
         return method(value, **self.func_kwargs)
 
 
+class PresentableManyRelatedField(serializers.ManyRelatedField):
+    """
+    Custom ManyRelatedField to represent all related objects with single
+    presentation serializer call (`child_relation` must be presentable related
+    field), so presentation list serializer can fetch related data at once.
+    """
+
+    def to_representation(self, iterable: QuerySet) -> list:
+        relation = self.child_relation
+        return relation.presentation_serializer(
+            iterable,
+            many=True,
+            context=self.context,
+            **relation.presentation_serializer_kwargs,
+        ).data
+
+
 class CapitalizedCharField(serializers.CharField):
     """Custom CharField to represent with capital letter."""
 
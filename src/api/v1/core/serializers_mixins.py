@@ -1,12 +1,13 @@
 """API serializers mixins."""
 
 import logging
-from typing import Any, Type
-from collections import OrderedDict
+from typing import Any, Iterable, Type
+from collections import OrderedDict, defaultdict
 
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
 from django.db.models import Model
+from django.db.models.manager import BaseManager
 from django.db.models.query import QuerySet
 from django.db.models.fields.files import ImageFieldFile
 
@@ -19,7 +20,7 @@ from api.v1.core.exceptions import (
     AmountLimitExceeded,
 )
 from apps.core.constants import MAX_IMAGE_SIZE, ExceptionDetails
-from utils.getters import get_object_by_pk
+from utils.getters import get_object_by_pk, prefetch_top_n
 
 from .serializers_fields import ReadWriteSerializerMethodField, CustomHybridImageField
 
@@ -34,6 +35,40 @@ class AlreadyExistSerializerHandler:
 
     already_exist_detail = ObjectAlreadyExist.default_detail
 
+    # existing objects by `get_object_key` keys, set by ListUpdateSerializer to
+    # check all nested objects with one query instead of query per object
+    existing_objs = None
+
+    def get_existing_obj(
+        self: serializers.ModelSerializer,
+        data: dict | OrderedDict,
+        instance: Type[Model] | None = None,
+    ) -> Type[Model] | None:
+        """
+        Returns object matching passed data unique fields from fetched existing
+        objects or gets it with `get_object` model method.
+        """
+        meta_model = self.Meta.model
+        if self.existing_objs is not None:
+            return self.existing_objs.get(meta_model.get_object_key(data, instance))
+        if instance is None:
+            return meta_model.get_object(data)
+        return meta_model.get_object(data, instance)
+
+    def remember_existing_obj(
+        self: serializers.ModelSerializer, data: dict | OrderedDict, obj: Type[Model]
+    ) -> None:
+        """
+        Updates fetched existing objects with created or updated object, so next
+        nested objects are checked for conflicts with it too.
+        """
+        if self.existing_objs is None:
+            return
+        for key, existing_obj in list(self.existing_objs.items()):
+            if existing_obj == obj:
+                del self.existing_objs[key]
+        self.existing_objs[self.Meta.model.get_object_key(data, obj)] = obj
+
     def check_existing_obj(
         self: serializers.ModelSerializer, data: dict | OrderedDict, *args, **kwargs
     ) -> Type[Model] | None:
@@ -51,7 +86,7 @@ class AlreadyExistSerializerHandler:
         if hasattr(meta_model, 'get_object'):
             logger.debug('Method used: get_object')
 
-            _existing_obj = meta_model.get_object(data)
+            _existing_obj = self.get_existing_obj(data)
             logger.debug(f'Obtained existing object: {_existing_obj}')
 
             if _existing_obj:
@@ -97,11 +132,12 @@ class AlreadyExistSerializerHandler:
         """
         logger.debug(f'Check if object with passed data exist: {validated_data}')
         _existing_obj = self.check_existing_obj(validated_data)
-        return (
-            _existing_obj
-            if _existing_obj
-            else super().create(validated_data, *args, **kwargs)
-        )
+        if _existing_obj:
+            return _existing_obj
+        obj = super().create(validated_data, *args, **kwargs)
+        if hasattr(self.Meta.model, 'get_object'):
+            self.remember_existing_obj(validated_data, obj)
+        return obj
 
     def update(
         self: serializers.ModelSerializer,
@@ -118,7 +154,7 @@ class AlreadyExistSerializerHandler:
         logger.debug(f'Check if object with passed data exist: {validated_data}')
         meta_model = self.Meta.model
         if hasattr(meta_model, 'get_object'):
-            _existing_obj = meta_model.get_object(validated_data, instance)
+            _existing_obj = self.get_existing_obj(validated_data, instance)
             if _existing_obj and instance != _existing_obj:
                 logger.error('ObjectAlreadyExist exception occured.')
                 model_name = str(meta_model._meta.model_name).lower()
@@ -129,6 +165,9 @@ class AlreadyExistSerializerHandler:
                     new_object_data=self.initial_data,
                     serializer_class=self.__class__,
                 )
+            instance = super().update(instance, validated_data)
+            self.remember_existing_obj(validated_data, instance)
+            return instance
         return super().update(instance, validated_data)
 
 
@@ -156,7 +195,22 @@ class AmountLimitsSerializerHandler:
         return super().validate(attrs)
 
 
-class ListUpdateSerializer(serializers.ListSerializer):
+class BulkFetchListSerializer(serializers.ListSerializer):
+    """
+    Custom list serializer to fetch related data for all listed objects at once.
+    Child serializer `bulk_fetch` method (if defined) is called with list of objects
+    before representation, so child serializer methods can use fetched data instead
+    of querying database for every object.
+    """
+
+    def to_representation(self, data: QuerySet | list) -> list:
+        objs = list(data.all() if isinstance(data, BaseManager) else data)
+        if hasattr(self.child, 'bulk_fetch'):
+            self.child.bulk_fetch(objs)
+        return super().to_representation(objs)
+
+
+class ListUpdateSerializer(BulkFetchListSerializer):
     """
     Custom list serializer with implemented update method,
     IntegrityError handling (use when nested serializers is needed with
@@ -196,17 +250,23 @@ class ListUpdateSerializer(serializers.ListSerializer):
         (to avoid IntegrityError for some passed nested objects).
         If invalid id passed, ObjectDoesNotExist exception may be raised.
         """
+        passed_objs = self.get_passed_objs(validated_data)
+        self.fetch_existing_objs(validated_data, passed_objs)
+        try:
+            return self.save_child_objects(validated_data, passed_objs)
+        finally:
+            self.child.existing_objs = None
+
+    def save_child_objects(
+        self, validated_data: OrderedDict, passed_objs: dict[Any, Type[Model]]
+    ) -> list[Type[Model]]:
+        """Updates objects with passed ids, creates other objects."""
         child_objects = []
         for data_index, data in enumerate(validated_data):
             self.child.initial_data = self.initial_data[data_index]
             if data.get('id', None):
                 # perform update
-                pk = data['id']
-                other_args = {}
-                author = data.get('author', None)
-                if author:
-                    other_args = {'author': author}
-                obj = get_object_by_pk(self.child.Meta.model, pk, other_args=other_args)
+                obj = self.get_passed_obj(passed_objs, data)
                 try:
                     child_objects.append(self.child.update(obj, data))
                 except ObjectAlreadyExist as exception:
@@ -262,47 +322,80 @@ class ListUpdateSerializer(serializers.ListSerializer):
                 id__in=set(obj_mapping.keys()) - set(passed_pks)
             ).delete()
 
-        child_objects = []
-        for data_index, data in enumerate(validated_data):
-            self.child.initial_data = self.initial_data[data_index]
+        # fetch passed objects not related to parent yet
+        passed_objs = self.get_passed_objs(validated_data, obj_mapping)
+
+        # handle defaults in nested data of objects to create
+        for data in validated_data:
+            if not data.get('id', None):
+                self.fill_default_values(data)
+
+        self.fetch_existing_objs(validated_data, passed_objs)
+        try:
+            return self.save_child_objects(validated_data, passed_objs)
+        finally:
+            self.child.existing_objs = None
+
+    def fetch_existing_objs(
+        self, validated_data: OrderedDict, passed_objs: dict[Any, Type[Model]]
+    ) -> None:
+        """
+        Fetches existing objects matching nested objects unique fields (slugs or
+        `get_object_by_fields`) with one query and passes them to child serializer
+        to check conflicts without query per nested object.
+        """
+        model = self.child.Meta.model
+        if not (
+            isinstance(self.child, AlreadyExistSerializerHandler)
+            and hasattr(model, 'get_objects')
+        ):
+            return
+        keys = [
+            model.get_object_key(
+                data,
+                self.get_passed_obj(passed_objs, data)
+                if data.get('id', None)
+                else None,
+            )
+            for data in validated_data
+        ]
+        self.child.existing_objs = model.get_objects(keys)
+
+    def get_passed_objs(
+        self, validated_data: OrderedDict, fetched_objs: dict | None = None
+    ) -> dict[Any, Type[Model]]:
+        """
+        Returns objects with ids passed in data by their ids. Objects not found in
+        `fetched_objs` are fetched with one query per passed author (nested objects
+        data usually have one author).
+        """
+        model = self.child.Meta.model
+        objs = dict(fetched_objs or {})
+        pks_by_author = defaultdict(set)
+        for data in validated_data:
             if data.get('id', None):
-                # perform update
-                pk = data['id']
-                other_args = {}
-                author = data.get('author', None)
-                if author:
-                    other_args = {'author': author}
-                obj = obj_mapping.get(
-                    pk,
-                    get_object_by_pk(self.child.Meta.model, pk, other_args=other_args),
-                )
-                try:
-                    child_objects.append(self.child.update(obj, data))
-                except ObjectAlreadyExist as exception:
-                    raise ObjectAlreadyExist(
-                        detail=exception.detail,
-                        code=exception.code,
-                        existing_object=exception.existing_object,
-                        new_object_data=exception.new_object_data,
-                        serializer_class=exception.serializer_class,
-                        conflict_object_index=data_index,
-                    )
-            else:
-                # handle defaults in nested data and perform create
-                data = self.fill_default_values(data)
-                try:
-                    child_objects.append(self.child.create(data))
-                except ObjectAlreadyExist as exception:
-                    raise ObjectAlreadyExist(
-                        detail=exception.detail,
-                        code=exception.code,
-                        existing_object=exception.existing_object,
-                        new_object_data=exception.new_object_data,
-                        serializer_class=exception.serializer_class,
-                        conflict_object_index=data_index,
-                    )
+                pk = model._meta.pk.to_python(data['id'])
+                if pk not in objs:
+                    pks_by_author[data.get('author', None)].add(pk)
 
-        return child_objects
+        for author, pks in pks_by_author.items():
+            other_args = {'author': author} if author else {}
+            objs |= model.objects.filter(pk__in=pks, **other_args).in_bulk()
+        return objs
+
+    def get_passed_obj(
+        self, passed_objs: dict[Any, Type[Model]], data: dict
+    ) -> Type[Model]:
+        """Returns object with passed id, raises NotFound if it was not fetched."""
+        model = self.child.Meta.model
+        obj = passed_objs.get(model._meta.pk.to_python(data['id']))
+        if obj is None:
+            author = data.get('author', None)
+            # raises NotFound
+            obj = get_object_by_pk(
+                model, data['id'], other_args={'author': author} if author else {}
+            )
+        return obj
 
     def fill_default_values(self, data: dict) -> dict:
         """
@@ -486,6 +579,10 @@ class FavoriteSerializerMixin(serializers.ModelSerializer):
         method_name='get_favorite', required=False
     )
 
+    # set by `fetch_favorites` to get favorite values without per object queries
+    favorite_objs_ids = None
+    fetched_favorites_ids = None
+
     def check_meta(self) -> None:
         assert hasattr(self.Meta, 'favorite_model'), (
             'Using FavoriteSerializerMixin requires `favorite_model` '
@@ -512,6 +609,8 @@ class FavoriteSerializerMixin(serializers.ModelSerializer):
         """
         self.check_meta()
         self.check_context()
+        if self.fetched_favorites_ids and obj.pk in self.fetched_favorites_ids:
+            return obj.pk in self.favorite_objs_ids
         user = self.context['request'].user
         return (
             user.is_authenticated
@@ -520,6 +619,33 @@ class FavoriteSerializerMixin(serializers.ModelSerializer):
             ).exists()
         )
 
+    def fetch_favorites(self, objs: list[Type[Model]]) -> None:
+        """
+        Gets favorite objects ids for all passed objects with one query,
+        so `get_favorite` does not query database for every object
+        (skipped if `favorite` field is omitted). Objects fetched before are
+        skipped, so nested serializers can be fetched by parent in advance.
+        """
+        if 'favorite' not in self.fields:
+            return None
+        self.check_meta()
+        self.check_context()
+        if self.fetched_favorites_ids is None:
+            self.favorite_objs_ids, self.fetched_favorites_ids = set(), set()
+        objs = [obj for obj in objs if obj.pk not in self.fetched_favorites_ids]
+        if not objs:
+            return None
+        self.fetched_favorites_ids.update(obj.pk for obj in objs)
+        user = self.context['request'].user
+        if not user.is_authenticated:
+            return None
+        self.favorite_objs_ids.update(
+            self.Meta.favorite_model.objects.filter(
+                **{f'{self.Meta.favorite_model_field}__in': objs}, user=user
+            ).values_list(self.Meta.favorite_model_field, flat=True)
+        )
+        return None
+
     @transaction.atomic
     def create(self, validated_data: OrderedDict, *args, **kwargs) -> Type[Model]:
         """
@@ -565,23 +691,104 @@ class CountObjsSerializerMixin:
     Custom mixin to add method for getting related objects amount.
     Using within KwargsMethodField (custom field from SerializerMethodField).
     `objs_related_name` keyword argument must be passed
-    (related name for objects that need to be counted).
+    (related name for objects that need to be counted), `annotation_name`
+    keyword argument can be passed to use amount annotated by queryset.
     """
 
     @extend_schema_field({'type': 'integer'})
     def get_objs_count(
-        self, obj: Type[Model], objs_related_name: str = ''
+        self, obj: Type[Model], objs_related_name: str = '', annotation_name: str = ''
     ) -> int | None:
         """
-        Returns related objects amount or None if invalid `objs_related_name`
-        was passed.
+        Returns related objects amount (annotated amount if object is annotated
+        with `annotation_name`) or None if invalid `objs_related_name` was passed.
         """
         assert objs_related_name, '`objs_related_name` must be passed.'
+        # annotated values are set to instance, not to model (models may have
+        # methods with the same name)
+        if annotation_name and annotation_name in vars(obj):
+            return vars(obj)[annotation_name]
         if hasattr(obj, objs_related_name):
             return obj.__getattribute__(objs_related_name).count()
         return None
 
 
+class SparseFieldsetsSerializerMixin:
+    """
+    Custom mixin to represent only fields requested with sparse fieldsets
+    (`fields`, `expand` sets passed in context by SparseFieldsetsMixin view).
+    `fields` limits all fields, `expand` limits `expandable_fields` only (related
+    objects lists and other heavy fields). Only top level serializer fields are
+    limited, omitted fields are not computed.
+    `prefetch_related_fields` attribute maps related lookups to fields they are
+    needed for, so lookups of omitted fields can be skipped.
+    """
+
+    expandable_fields: tuple[str] = ()
+    prefetch_related_fields: dict[str, tuple[str]] = {}
+
+    def is_top_level(self) -> bool:
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        return parent is None
+
+    def get_fields(self) -> dict:
+        fields = super().get_fields()
+        if not self.is_top_level():
+            return fields
+        requested = self.context.get('fields', None)
+        expanded = self.context.get('expand', None)
+        for field_name in list(fields):
+            if (requested is not None and field_name not in requested) or (
+                expanded is not None
+                and field_name in self.expandable_fields
+                and field_name not in expanded
+            ):
+                fields.pop(field_name)
+        return fields
+
+    def filter_prefetch_related(self, lookups: Iterable) -> list:
+        """Returns passed lookups without lookups needed only for omitted fields."""
+        filtered_lookups = []
+        for lookup in lookups:
+            prefetch_to = getattr(lookup, 'prefetch_to', lookup)
+            if prefetch_to not in self.prefetch_related_fields or any(
+                field_name in self.fields
+                for field_name in self.prefetch_related_fields[prefetch_to]
+            ):
+                filtered_lookups.append(lookup)
+        return filtered_lookups
+
+
+class LastObjsSerializerMixin:
+    """
+    Custom mixin to fetch last added related objects for all listed objects with
+    one query per objects type (using within BulkFetchListSerializer).
+    `last_objs` attribute must be set: dict of objects attribute names to set
+    fetched objects lists to and `prefetch_top_n` keyword arguments.
+    """
+
+    last_objs: dict[str, dict[str, Any]] = {}
+
+    def bulk_fetch(self, objs: list[Type[Model]]) -> None:
+        """
+        Sets last related objects lists for all passed objects (objects with
+        lists set before are skipped).
+        """
+        parent_bulk_fetch = getattr(super(), 'bulk_fetch', None)
+        if parent_bulk_fetch is not None:
+            parent_bulk_fetch(objs)
+        filter_prefetch_related = getattr(self, 'filter_prefetch_related', list)
+        for to_attr in filter_prefetch_related(self.last_objs):
+            prefetch_top_n(
+                [obj for obj in objs if not hasattr(obj, to_attr)],
+                to_attr=to_attr,
+                **self.last_objs[to_attr],
+            )
+        return None
+
+
 class UpdateSerializerMixin:
     """
     Custom mixin to add update by passed pk within create method
@@ -0,0 +1,254 @@
+"""Exercises app finished approaches results recording."""
+
+import logging
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Prefetch
+from django.utils import timezone
+
+from rest_framework.exceptions import ValidationError
+
+from apps.core.constants import ExceptionDetails
+from apps.core.models import ActivityStatusModel
+from apps.exercises.models import (
+    Exercise,
+    UsersExercisesHistory,
+    ExerciseHistoryDetails,
+    WordsUpdateHistory,
+)
+from apps.vocabulary.models import (
+    Word,
+    MainPageSnapshot,
+    mark_vocabulary_modified,
+)
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+
+class ApproachRecorder:
+    """
+    Records user's finished exercise approach: approach, answers details, used
+    hints and words activity status changes are saved with bulk inserts, words
+    statuses, exercise dates and repetitions schedules are changed with single
+    update query in one transaction. Bulk queries bypass signals, so user's
+    vocabulary caches and main page snapshots are invalidated explicitly.
+    """
+
+    # answer verdict - answer quality used to schedule next word exercise
+    verdicts_qualities = {
+        ExerciseHistoryDetails.CORRECT: 5,
+        ExerciseHistoryDetails.SEMI_CORRECT: 3,
+        ExerciseHistoryDetails.INCORRECT: 1,
+    }
+    updated_words_fields = (
+        'activity_status',
+        'last_exercise_date',
+        'next_exercise_date',
+        'exercise_interval',
+        'exercise_ease',
+        'exercise_repetitions',
+    )
+
+    def __init__(self, user: User, exercise: Exercise) -> None:
+        self.user = user
+        self.exercise = exercise
+
+    def get_objs(self, answers: list[dict]) -> tuple[dict, dict, dict]:
+        """
+        Returns answered user's words, translations and used hints by their
+        lookups, raises validation error if some of them are not found.
+        """
+        words_slugs = {answer['word'] for answer in answers}
+        words = {
+            word.slug: word for word in self.user.words.filter(slug__in=words_slugs)
+        }
+        if len(words) != len(words_slugs):
+            raise ValidationError(
+                {'answers': [ExceptionDetails.Exercises.APPROACH_WORDS_NOT_FOUND]}
+            )
+
+        translations_slugs = {
+            answer['translation'] for answer in answers if answer.get('translation')
+        }
+        translations = {}
+        if translations_slugs:
+            translations = {
+                translation.slug: translation
+                for translation in self.user.wordtranslations.filter(
+                    slug__in=translations_slugs
+                )
+            }
+            if len(translations) != len(translations_slugs):
+                raise ValidationError(
+                    {
+                        'answers': [
+                            ExceptionDetails.Exercises.APPROACH_TRANSLATIONS_NOT_FOUND
+                        ]
+                    }
+                )
+
+        hints = {hint.code: hint for hint in self.exercise.hints_available.all()}
+        used_hints = {code for answer in answers for code in answer['hints_used']}
+        if not used_hints <= hints.keys():
+            raise ValidationError(
+                {'answers': [ExceptionDetails.Exercises.APPROACH_HINTS_NOT_AVAILABLE]}
+            )
+        return words, translations, hints
+
+    def get_new_activity_status(self, word: Word, verdicts: list[str]) -> str:
+        """
+        Returns word activity status after approach: inactive words become
+        active, active words answered correctly every time become mastered,
+        mastered words answered incorrectly become active again.
+        """
+        all_correct = all(
+            verdict == ExerciseHistoryDetails.CORRECT for verdict in verdicts
+        )
+        match word.activity_status:
+            case ActivityStatusModel.INACTIVE:
+                return ActivityStatusModel.ACTIVE
+            case ActivityStatusModel.ACTIVE if all_correct:
+                return ActivityStatusModel.MASTERED
+            case ActivityStatusModel.MASTERED if not all_correct:
+                return ActivityStatusModel.ACTIVE
+            case _:
+                return word.activity_status
+
+    def get_quality(self, answer: dict) -> int:
+        """
+        Returns answer quality from 0 to 5 to schedule word next exercise, used
+        hints decrease quality.
+        """
+        quality = self.verdicts_qualities[answer['verdict']]
+        if answer['hints_used']:
+            quality -= 1
+        return max(0, quality)
+
+    def update_words(
+        self, approach: UsersExercisesHistory, words: dict, answers: list[dict]
+    ) -> list[WordsUpdateHistory]:
+        """
+        Updates answered words activity statuses, last and next exercise dates
+        and repetitions schedules with single query, returns words statuses
+        changes history.
+        """
+        verdicts = {slug: [] for slug in words}
+        qualities = {slug: [] for slug in words}
+        for answer in answers:
+            verdicts[answer['word']].append(answer['verdict'])
+            qualities[answer['word']].append(self.get_quality(answer))
+
+        exercise_date = timezone.now()
+        updates = []
+        for slug, word in words.items():
+            new_status = self.get_new_activity_status(word, verdicts[slug])
+            if new_status != word.activity_status:
+                updates.append(
+                    WordsUpdateHistory(
+                        word=word,
+                        approach=approach,
+                        activity_status=word.activity_status,
+                        new_activity_status=new_status,
+                    )
+                )
+            word.activity_status = new_status
+            word.last_exercise_date = exercise_date
+            # word is scheduled by its worst answer in the approach
+            word.schedule_next_exercise(min(qualities[slug]), exercise_date)
+
+        Word.objects.bulk_update(words.values(), self.updated_words_fields)
+        return WordsUpdateHistory.objects.bulk_create(updates)
+
+    def create_approach(self, data: dict) -> UsersExercisesHistory:
+        """Saves approach with all its details in single transaction."""
+        answers = data['answers']
+        words, translations, hints = self.get_objs(answers)
+
+        approach = UsersExercisesHistory.objects.create(
+            user=self.user,
+            exercise=self.exercise,
+            words_amount=len(words),
+            corrects_amount=sum(
+                answer['verdict'] == ExerciseHistoryDetails.CORRECT
+                for answer in answers
+            ),
+            incorrects_amount=sum(
+                answer['verdict'] == ExerciseHistoryDetails.INCORRECT
+                for answer in answers
+            ),
+            answer_time_limit=data.get('answer_time_limit'),
+            complete_time=data.get('complete_time'),
+            mode=data['mode'],
+        )
+        UsersExercisesHistory.hints_available.through.objects.bulk_create(
+            [
+                UsersExercisesHistory.hints_available.through(
+                    usersexerciseshistory=approach, hint=hint
+                )
+                for hint in hints.values()
+            ]
+        )
+
+        details = [
+            ExerciseHistoryDetails(
+                approach=approach,
+                task_word=words[answer['word']],
+                task_translation=translations.get(answer.get('translation')),
+                text_answer=answer['text_answer'],
+                verdict=answer['verdict'],
+                suggested_options=answer.get('suggested_options'),
+                answer_time=answer.get('answer_time'),
+            )
+            for answer in answers
+        ]
+        ExerciseHistoryDetails.objects.bulk_create(details)
+        ExerciseHistoryDetails.hints_used.through.objects.bulk_create(
+            [
+                ExerciseHistoryDetails.hints_used.through(
+                    exercisehistorydetails=detail, hint=hints[code]
+                )
+                for detail, answer in zip(details, answers)
+                for code in dict.fromkeys(answer['hints_used'])
+            ]
+        )
+
+        updates = self.update_words(approach, words, answers)
+        logger.debug(
+            f'Approach of {self.user} saved: {len(details)} answers, '
+            f'{len(updates)} words statuses changed'
+        )
+        return approach
+
+    def run(self, data: dict) -> UsersExercisesHistory:
+        """
+        Records approach, returns it with prefetched details and words updates
+        to be serialized.
+        """
+        with transaction.atomic():
+            approach = self.create_approach(data)
+
+        MainPageSnapshot.invalidate(
+            (*MainPageSnapshot.invalidated_sections[Word], 'due_words'),
+            users_ids=[self.user.pk],
+        )
+        mark_vocabulary_modified(users_ids=[self.user.pk])
+
+        return (
+            UsersExercisesHistory.objects.select_related('exercise')
+            .prefetch_related(
+                Prefetch(
+                    'details',
+                    queryset=ExerciseHistoryDetails.objects.select_related(
+                        'task_word', 'approach__exercise'
+                    ).prefetch_related('hints_used'),
+                ),
+                Prefetch(
+                    'words_updates',
+                    queryset=WordsUpdateHistory.objects.select_related('word'),
+                ),
+            )
+            .get(pk=approach.pk)
+        )
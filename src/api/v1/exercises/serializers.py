@@ -3,6 +3,7 @@
 from datetime import timedelta
 
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Count, prefetch_related_objects
 from django.db.models.query import QuerySet
 
 from rest_framework import serializers
@@ -22,17 +23,24 @@ from apps.exercises.models import (
     TranslatorUserDefaultSettings,
     Hint,
 )
-from apps.exercises.constants import exercises_lookups
+from apps.exercises.constants import (
+    exercises_lookups,
+    MAX_TEXT_ANSWER_LENGTH,
+    TRANSLATOR_SESSION_WORDS_AMOUNT,
+)
 
 from ..core.serializers_mixins import (
     CountObjsSerializerMixin,
     FavoriteSerializerMixin,
     AlreadyExistSerializerHandler,
+    BulkFetchListSerializer,
+    LastObjsSerializerMixin,
 )
 from ..core.serializers_fields import (
     KwargsMethodField,
     ReadableHiddenField,
     CurrentObjectDefault,
+    PresentableManyRelatedField,
 )
 from ..core.exceptions import AmountLimitExceeded
 from ..vocabulary.serializers import (
@@ -85,12 +93,15 @@ class SetSerializer(
     words_count = KwargsMethodField(
         'get_objs_count',
         objs_related_name='words',
+        annotation_name='words_count',
     )
-    words = PresentablePrimaryKeyRelatedField(
-        queryset=Word.objects.all(),
+    # words are represented with cards list serializer to fetch them at once
+    words = PresentableManyRelatedField(
+        child_relation=PresentablePrimaryKeyRelatedField(
+            queryset=Word.objects.all(),
+            presentation_serializer=WordShortCardSerializer,
+        ),
         required=False,
-        many=True,
-        presentation_serializer=WordShortCardSerializer,
     )
     author = ReadableHiddenField(
         default=serializers.CurrentUserDefault(),
@@ -121,12 +132,24 @@ class SetSerializer(
         )
 
 
-class SetListSerializer(SetSerializer):
+class SetListSerializer(LastObjsSerializerMixin, SetSerializer):
     """Serializer to list, create set of words in exercise."""
 
     last_3_words = serializers.SerializerMethodField('get_last_3_words')
 
+    last_objs = {
+        'last_words': {
+            'queryset': WordSet.words.through.objects.select_related('word').order_by(
+                '-word__last_exercise_date'
+            ),
+            'parent_fields': 'wordset',
+            'amount': 3,
+            'related_field': 'word',
+        },
+    }
+
     class Meta(SetSerializer.Meta):
+        list_serializer_class = BulkFetchListSerializer
         fields = (
             'id',
             'slug',
@@ -137,9 +160,26 @@ class SetListSerializer(SetSerializer):
         )
         read_only_fields = fields
 
+    def bulk_fetch(self, word_sets: list[WordSet]) -> None:
+        """
+        Fetches last words, authors, words amounts for all listed sets with fixed
+        amount of queries (called by list serializer).
+        """
+        super().bulk_fetch(word_sets)
+        prefetch_related_objects(word_sets, 'author')
+        words_counts = dict(
+            WordSet.objects.filter(pk__in=[word_set.pk for word_set in word_sets])
+            .annotate(words_count=Count('words', distinct=True))
+            .values_list('pk', 'words_count')
+        )
+        for word_set in word_sets:
+            word_set.words_count = words_counts[word_set.pk]
+
     @extend_schema_field({'type': 'string'})
-    def get_last_3_words(self, obj: WordSet) -> QuerySet[Word]:
+    def get_last_3_words(self, obj: WordSet) -> QuerySet[Word] | list[str]:
         """Returns list of 3 last added words in given set."""
+        if hasattr(obj, 'last_words'):
+            return [word.text for word in obj.last_words]
         return obj.words.order_by('-last_exercise_date').values_list('text', flat=True)[
             :3
         ]
@@ -406,8 +446,8 @@ class TranslatorCollectionsSerializer(CollectionWithAvailableWordsSerializer):
 
     @extend_schema_field({'type': 'integer'})
     def get_available_words_count(self, obj: Collection) -> int:
-        """Count words that have at least one translation."""
-        return obj.words.filter(translations__isnull=False).count()
+        """Returns amount of words that have at least one translation."""
+        return obj.counters.translated_words_count
 
 
 class TranslatorUserDefaultSettingsSerializer(serializers.ModelSerializer):
@@ -478,3 +518,63 @@ class TranslatorUserDefaultSettingsSerializer(serializers.ModelSerializer):
             )
 
         return repetitions_amount
+
+
+class TranslatorSessionParamsSerializer(serializers.Serializer):
+    """
+    Serializer to validate `Translator` exercise session query params: words
+    amount and collection or word set to sample words from.
+    """
+
+    amount = serializers.IntegerField(
+        min_value=1,
+        max_value=AmountLimits.Exercises.EXERCISE_MAX_WORDS_AMOUNT_LIMIT,
+        default=TRANSLATOR_SESSION_WORDS_AMOUNT,
+    )
+    collection = serializers.SlugField(required=False)
+    word_set = serializers.SlugField(required=False)
+
+
+class ApproachAnswerSerializer(serializers.Serializer):
+    """Serializer to validate single answer of submitted exercise approach."""
+
+    word = serializers.SlugField()
+    translation = serializers.SlugField(required=False, allow_null=True)
+    text_answer = serializers.CharField(
+        max_length=MAX_TEXT_ANSWER_LENGTH,
+        allow_blank=True,
+        trim_whitespace=False,
+    )
+    verdict = serializers.ChoiceField(choices=ExerciseHistoryDetails.VERDICT_OPTIONS)
+    suggested_options = serializers.ListField(
+        child=serializers.CharField(max_length=MAX_TEXT_ANSWER_LENGTH),
+        required=False,
+        allow_null=True,
+    )
+    answer_time = serializers.TimeField(required=False, allow_null=True)
+    hints_used = serializers.ListField(
+        child=serializers.CharField(),
+        default=list,
+    )
+
+
+class ApproachSubmitSerializer(serializers.Serializer):
+    """
+    Serializer to validate finished exercise approach: chosen mode, time limit,
+    complete time and all answers given during the approach.
+    """
+
+    mode = serializers.ChoiceField(
+        choices=UsersExercisesHistory.MODE_OPTIONS,
+        default=UsersExercisesHistory.FREE_INPUT,
+    )
+    answer_time_limit = serializers.TimeField(required=False, allow_null=True)
+    complete_time = serializers.TimeField(required=False, allow_null=True)
+    answers = ApproachAnswerSerializer(
+        many=True,
+        allow_empty=False,
+        max_length=(
+            AmountLimits.Exercises.EXERCISE_MAX_WORDS_AMOUNT_LIMIT
+            * AmountLimits.Exercises.MAX_REPETITIONS_AMOUNT_LIMIT
+        ),
+    )
@@ -0,0 +1,242 @@
+"""Exercises app sessions generators."""
+
+import random
+import logging
+
+from django.db.models import Prefetch, prefetch_related_objects
+from django.db.models.query import QuerySet
+from django.http import HttpRequest
+from django.utils import timezone
+
+from utils.getters import get_random_objs
+from apps.exercises.constants import (
+    hints_codes,
+    TRANSLATOR_OPTIONS_AMOUNT,
+)
+from apps.exercises.models import (
+    Exercise,
+    TranslatorUserDefaultSettings,
+    UsersExercisesHistory,
+)
+from apps.vocabulary.models import Word, WordTranslation, ImageAssociation
+
+logger = logging.getLogger(__name__)
+
+
+class TranslatorSessionGenerator:
+    """
+    Builds `Translator` exercise session by user's default settings: every task
+    contains question, correct answers, sampled options for variants mode and
+    precomputed payloads of hints available for the exercise. Words due by their
+    repetitions schedule are asked first. Words, their related objects and
+    options are fetched with fixed amount of queries however many tasks are
+    built.
+    """
+
+    def __init__(
+        self,
+        request: HttpRequest,
+        exercise: Exercise,
+        translator_settings: TranslatorUserDefaultSettings,
+    ) -> None:
+        self.request = request
+        self.user = request.user
+        self.settings = translator_settings
+        self.hints = set(exercise.hints_available.values_list('code', flat=True))
+        self.random = random.Random()
+
+    @property
+    def variants_mode(self) -> bool:
+        return self.settings.mode == UsersExercisesHistory.VARIANTS
+
+    def get_directions(self) -> tuple[str]:
+        """Returns tasks translation directions in order they are alternated."""
+        if self.settings.from_language == TranslatorUserDefaultSettings.ALTERNATELY:
+            return (
+                TranslatorUserDefaultSettings.FROM_LEARNING,
+                TranslatorUserDefaultSettings.FROM_NATIVE,
+            )
+        return (self.settings.from_language,)
+
+    def get_translations(self) -> QuerySet[WordTranslation]:
+        """
+        Returns translations used as answers, only translations to learning
+        languages are used for translation from learning to learning language.
+        """
+        translations = WordTranslation.objects.all()
+        if (
+            self.settings.from_language
+            == TranslatorUserDefaultSettings.FROM_LEARNING_TO_LEARNING
+        ):
+            translations = translations.filter(
+                language__in=self.user.learning_languages.values('pk')
+            )
+        return translations
+
+    def get_words(self, words: QuerySet[Word], amount: int) -> list[Word]:
+        """
+        Returns words with translations due to be exercised in order of next
+        exercise date, fills up passed amount with randomly sampled other words.
+        Prefetches related objects only for available hints.
+        """
+        words = words.filter(counters__translations_count__gt=0)
+        session_words = list(
+            words.filter(next_exercise_date__lte=timezone.now()).order_by(
+                'next_exercise_date'
+            )[:amount]
+        )
+        if len(session_words) < amount:
+            session_words.extend(
+                get_random_objs(
+                    words.exclude(pk__in=[word.pk for word in session_words]),
+                    amount - len(session_words),
+                )
+            )
+
+        lookups = [Prefetch('translations', queryset=self.get_translations())]
+        if hints_codes.SHOW_SYNONYM in self.hints:
+            lookups.append('synonyms')
+        if hints_codes.SHOW_ASSOCIATION in self.hints:
+            lookups.extend(('image_associations', 'quote_associations'))
+        prefetch_related_objects(session_words, *lookups)
+        return session_words
+
+    def get_options_pools(
+        self, directions: tuple[str], words_amount: int
+    ) -> dict[str, list[str]]:
+        """
+        Returns randomly sampled user's translations texts (or words texts for
+        translation from native language) to suggest as incorrect options.
+        """
+        if not self.variants_mode:
+            return {}
+        pools = {}
+        for direction in directions:
+            if direction == TranslatorUserDefaultSettings.FROM_NATIVE:
+                objs = self.user.words.all()
+            else:
+                objs = self.get_translations().filter(author=self.user)
+            pools[direction] = list(
+                {
+                    obj.text
+                    for obj in get_random_objs(
+                        objs.only('text'), words_amount * TRANSLATOR_OPTIONS_AMOUNT
+                    )
+                }
+            )
+        return pools
+
+    def get_association(self, word: Word) -> dict | None:
+        """Returns random word association data to show as hint."""
+        associations = [
+            *word.image_associations.all(),
+            *word.quote_associations.all(),
+        ]
+        if not associations:
+            return None
+        association = self.random.choice(associations)
+        if isinstance(association, ImageAssociation):
+            return {
+                'type': 'image',
+                'image': (
+                    self.request.build_absolute_uri(association.image.url)
+                    if association.image
+                    else association.image_url
+                ),
+            }
+        return {
+            'type': 'quote',
+            'text': association.text,
+            'quote_author': association.quote_author,
+        }
+
+    def get_hints(
+        self, word: Word, answer: str, options: list[str] | None
+    ) -> dict[str, object]:
+        """Returns available hints payloads for task with passed answer."""
+        hints = {}
+        for code in self.hints:
+            match code:
+                case hints_codes.SHOW_FIRST_LETTER:
+                    hints[code] = answer[:1]
+                case hints_codes.SHOW_LETTERS_AMOUNT:
+                    hints[code] = len(answer)
+                case hints_codes.SHOW_SYNONYM:
+                    synonyms = [synonym.text for synonym in word.synonyms.all()]
+                    hints[code] = self.random.choice(synonyms) if synonyms else None
+                case hints_codes.SHOW_ASSOCIATION:
+                    hints[code] = self.get_association(word)
+                case hints_codes.REMOVE_INCORRECT:
+                    incorrect = [option for option in options or () if option != answer]
+                    hints[code] = self.random.choice(incorrect) if incorrect else None
+        return hints
+
+    def make_task(self, word: Word, direction: str, pool: list[str]) -> dict | None:
+        """Returns task data or None if word has no translations to ask."""
+        translations = list(word.translations.all())
+        if direction == TranslatorUserDefaultSettings.FROM_LEARNING_TO_LEARNING:
+            translations = [
+                translation
+                for translation in translations
+                if translation.language_id != word.language_id
+            ]
+        if not translations:
+            return None
+
+        if direction == TranslatorUserDefaultSettings.FROM_NATIVE:
+            translation = self.random.choice(translations)
+            question, answers = translation.text, [word.text]
+        else:
+            translation = None
+            question = word.text
+            answers = [obj.text for obj in translations]
+        answer = self.random.choice(answers)
+
+        options = None
+        if self.variants_mode:
+            incorrect = [text for text in pool if text not in answers]
+            options = [
+                answer,
+                *self.random.sample(
+                    incorrect, min(len(incorrect), TRANSLATOR_OPTIONS_AMOUNT - 1)
+                ),
+            ]
+            self.random.shuffle(options)
+
+        return {
+            'word': word.slug,
+            'translation': translation.slug if translation else None,
+            'direction': direction,
+            'question': question,
+            'answers': answers,
+            'options': options,
+            'hints': self.get_hints(word, answer, options),
+        }
+
+    def run(self, words: QuerySet[Word], amount: int) -> dict:
+        """
+        Returns session settings and tasks for passed amount of randomly sampled
+        words, every word is asked `repetitions_amount` times.
+        """
+        directions = self.get_directions()
+        words = self.get_words(words, amount)
+        pools = self.get_options_pools(directions, len(words))
+
+        tasks = []
+        for _ in range(self.settings.repetitions_amount):
+            self.random.shuffle(words)
+            for word in words:
+                direction = directions[len(tasks) % len(directions)]
+                task = self.make_task(word, direction, pools.get(direction, []))
+                if task is not None:
+                    tasks.append(task)
+        logger.debug(f'{len(tasks)} tasks built for {self.user} session')
+
+        return {
+            'mode': self.settings.mode,
+            'from_language': self.settings.from_language,
+            'answer_time_limit': self.settings.answer_time_limit,
+            'repetitions_amount': self.settings.repetitions_amount,
+            'hints_available': sorted(self.hints),
+            'tasks': tasks,
+        }
@@ -18,14 +18,14 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.serializers import Serializer
 
-from apps.core.constants import AmountLimits
+from apps.core.constants import AmountLimits, ExceptionDetails
 from apps.exercises.models import (
     Exercise,
     FavoriteExercise,
     TranslatorUserDefaultSettings,
 )
 from apps.exercises.constants import exercises_lookups
-from utils.getters import get_admin_user
+from apps.users.preferences import get_translator_settings
 
 from ..core.pagination import LimitPagination
 from ..core.mixins import FavoriteMixin
@@ -40,7 +40,11 @@ from .serializers import (
     LastApproachProfileSerializer,
     TranslatorCollectionsSerializer,
     TranslatorUserDefaultSettingsSerializer,
+    TranslatorSessionParamsSerializer,
+    ApproachSubmitSerializer,
 )
+from .sessions import TranslatorSessionGenerator
+from .approaches import ApproachRecorder
 
 logger = logging.getLogger(__name__)
 
@@ -193,6 +197,39 @@ class ExerciseViewSet(
                 status=status.HTTP_409_CONFLICT,
             )
 
+    @extend_schema(
+        operation_id='exercise_approach_create',
+        methods=('post',),
+        request=ApproachSubmitSerializer,
+        responses=LastApproachProfileSerializer,
+    )
+    @action(
+        methods=('post',),
+        detail=True,
+        url_path='approaches',
+        serializer_class=LastApproachProfileSerializer,
+        permission_classes=(IsAuthenticated,),
+    )
+    def approach_create(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        Records user's finished approach of current exercise with all answers,
+        updates answered words activity statuses, returns approach details.
+        """
+        instance: Exercise = self.get_object()
+        logger.debug(f'Obtained instance: {instance}')
+
+        data_serializer = ApproachSubmitSerializer(data=request.data)
+        data_serializer.is_valid(raise_exception=True)
+
+        approach = ApproachRecorder(request.user, instance).run(
+            data_serializer.validated_data
+        )
+
+        serializer = self.get_serializer(approach)
+        logger.debug(f'Serializer used: {type(serializer)}')
+
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
     @extend_schema(operation_id='exercise_available_words_retrieve', methods=('get',))
     @action(
         methods=('get',),
@@ -212,7 +249,7 @@ class ExerciseViewSet(
                     'Obtaining words available for `Translator` exercise '
                     'from user vocabulary'
                 )
-                words = request.user.words.filter(translations__isnull=False)
+                words = request.user.words.filter(counters__translations_count__gt=0)
             case _:
                 logger.debug(
                     f'Passed {self.lookup_field} has no match with available '
@@ -254,8 +291,8 @@ class ExerciseViewSet(
                     'from user collections'
                 )
                 _collections = request.user.collections.filter(
-                    words__translations__isnull=False
-                ).distinct()
+                    counters__translated_words_count__gt=0
+                ).select_related('counters')
 
                 collections_serializer_class = TranslatorCollectionsSerializer
             case _:
@@ -281,6 +318,50 @@ class ExerciseViewSet(
             }
         )
 
+    @extend_schema(
+        operation_id='exercise_session_retrieve',
+        methods=('get',),
+        parameters=[TranslatorSessionParamsSerializer],
+    )
+    @action(
+        methods=('get',),
+        detail=True,
+        permission_classes=(IsAuthenticated,),
+    )
+    def session(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        Returns exercise session built by user's default settings: tasks with
+        correct answers, options and hints for randomly sampled available words.
+        """
+        instance: Exercise = self.get_object()
+        logger.debug(f'Obtained instance: {instance}')
+
+        if instance.slug != exercises_lookups.TRANSLATOR_EXERCISE_SLUG:
+            return Response(
+                {'detail': ExceptionDetails.Exercises.SESSION_NOT_AVAILABLE},
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        params_serializer = TranslatorSessionParamsSerializer(data=request.query_params)
+        params_serializer.is_valid(raise_exception=True)
+        params = params_serializer.validated_data
+
+        words = request.user.words.all()
+        if 'collection' in params:
+            words = words.filter(collections__slug=params['collection'])
+        if 'word_set' in params:
+            words = words.filter(sets__slug=params['word_set'])
+
+        # Use default (not saved) settings if user and admin user have no settings
+        translator_settings = (
+            get_translator_settings(request.user) or TranslatorUserDefaultSettings()
+        )
+
+        session = TranslatorSessionGenerator(
+            request, instance, translator_settings
+        ).run(words, params['amount'])
+        return Response(session)
+
     @extend_schema(
         operation_id='translator_default_settings_retrieve', methods=('get',)
     )
@@ -295,17 +376,9 @@ class ExerciseViewSet(
         self, request: HttpRequest, *args, **kwargs
     ) -> HttpResponse:
         """Returns user default settings for `Translator` exercise."""
-        # Retrieve user settings or admin user (default) settings if not exist
-        try:
-            translator_settings = request.user.translator_settings
-            logger.debug(f'Obtained user settings: {translator_settings}')
-        except TranslatorUserDefaultSettings.DoesNotExist as exception:
-            logger.debug(f'RelatedObjectDoesNotExist exception occured: {exception}')
-            admin_user = get_admin_user()
-            translator_settings = admin_user.translator_settings
-            logger.debug(
-                f'Obtained admin user (default) settings: {translator_settings}'
-            )
+        # Retrieve cached user settings or admin user (default) settings if not exist
+        translator_settings = get_translator_settings(request.user)
+        logger.debug(f'Obtained settings: {translator_settings}')
 
         serializer = self.get_serializer(translator_settings)
         logger.debug(f'Serializer used: {type(serializer)}')
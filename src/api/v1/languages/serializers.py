@@ -23,6 +23,8 @@ from ..core.serializers_mixins import (
     CountObjsSerializerMixin,
     AlreadyExistSerializerHandler,
     HybridImageSerializerMixin,
+    BulkFetchListSerializer,
+    SparseFieldsetsSerializerMixin,
 )
 
 
@@ -44,7 +46,9 @@ class LanguageSerializer(serializers.ModelSerializer):
 
 
 class LearningLanguageListSerailizer(
-    CountObjsSerializerMixin, serializers.ModelSerializer
+    SparseFieldsetsSerializerMixin,
+    CountObjsSerializerMixin,
+    serializers.ModelSerializer,
 ):
     """Serializer to list users's learning languages."""
 
@@ -64,8 +68,14 @@ class LearningLanguageListSerailizer(
     cover_height = serializers.SerializerMethodField('get_cover_height')
     cover_width = serializers.SerializerMethodField('get_cover_width')
 
+    prefetch_related_fields = {
+        'user': ('user',),
+        'language': ('language',),
+    }
+
     class Meta:
         model = UserLearningLanguage
+        list_serializer_class = BulkFetchListSerializer
         fields = (
             'id',
             'user',
@@ -105,25 +115,54 @@ class LearningLanguageListSerailizer(
         except AttributeError:
             return None
 
+    def bulk_fetch(self, objs: list[UserLearningLanguage]) -> None:
+        """
+        Counts words of all activity statuses for all passed learning languages
+        with single grouped query (if counters are not annotated yet).
+        """
+        counters = UserLearningLanguage.get_words_counters()
+        objs = [obj for obj in objs if not hasattr(obj, 'mastered_words_count')]
+        if not objs:
+            return None
+        counted = {
+            language_counters.pop('pk'): language_counters
+            for language_counters in UserLearningLanguage.objects.filter(
+                pk__in=[obj.pk for obj in objs]
+            )
+            .order_by()
+            .annotate(**counters)
+            .values('pk', *counters)
+        }
+        for obj in objs:
+            for counter, amount in counted.get(obj.pk, {}).items():
+                setattr(obj, counter, amount)
+        return None
+
+    def get_words_counter(self, obj: UserLearningLanguage, counter: str) -> int:
+        """Returns annotated (or fetched) words counter of learning language."""
+        if not hasattr(obj, 'mastered_words_count'):
+            self.bulk_fetch([obj])
+        return getattr(obj, counter, 0)
+
     @extend_schema_field({'type': 'integer'})
     def get_words_count(self, obj: UserLearningLanguage) -> int:
         """Returns words amount in given language."""
-        return obj.user.words.filter(language=obj.language).count()
+        return self.get_words_counter(obj, 'words_count')
 
     @extend_schema_field({'type': 'integer'})
     def get_inactive_words_count(self, obj: UserLearningLanguage) -> int:
         """Returns words with `Inactive` activity status amount in given language."""
-        return obj.user.words.filter(language=obj.language, activity_status='I').count()
+        return self.get_words_counter(obj, 'inactive_words_count')
 
     @extend_schema_field({'type': 'integer'})
     def get_active_words_count(self, obj: UserLearningLanguage) -> int:
         """Returns words with `Active` activity status amount in given language."""
-        return obj.user.words.filter(language=obj.language, activity_status='A').count()
+        return self.get_words_counter(obj, 'active_words_count')
 
     @extend_schema_field({'type': 'integer'})
     def get_mastered_words_count(self, obj: UserLearningLanguage) -> int:
         """Returns words with `Mastered` activity status amount in given language."""
-        return obj.user.words.filter(language=obj.language, activity_status='M').count()
+        return self.get_words_counter(obj, 'mastered_words_count')
 
 
 class LearningLanguageSerializer(
@@ -136,6 +175,7 @@ class LearningLanguageSerializer(
 
     class Meta:
         model = UserLearningLanguage
+        list_serializer_class = BulkFetchListSerializer
         fields = (
             'id',
             'slug',
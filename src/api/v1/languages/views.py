@@ -3,7 +3,7 @@
 import logging
 
 from django.db import transaction
-from django.db.models import Count, Case, When, Value, Q, F
+from django.db.models import Count, Case, Exists, OuterRef, When, Value, Q
 from django.db.models.query import QuerySet
 from django.http import HttpRequest, HttpResponse
 
@@ -16,6 +16,7 @@ from drf_spectacular.utils import extend_schema, extend_schema_view
 from django_filters.rest_framework import DjangoFilterBackend
 
 from apps.languages.models import Language, UserLearningLanguage, UserNativeLanguage
+from apps.vocabulary.models import WordsInCollections
 from apps.core.constants import (
     AmountLimits,
 )
@@ -30,7 +31,7 @@ from .serializers import (
     CoverListSerializer,
     CoverSetSerializer,
 )
-from ..core.mixins import ActionsWithRelatedObjectsMixin
+from ..core.mixins import ActionsWithRelatedObjectsMixin, SparseFieldsetsMixin
 from ..core.exceptions import (
     AmountLimitExceeded,
     ObjectAlreadyExist,
@@ -41,6 +42,7 @@ from ..vocabulary.serializers import (
     CollectionShortSerializer,
 )
 from ..vocabulary.views import WordViewSet, CollectionViewSet, get_word_cards_type
+from ..vocabulary.utils import VocabularyResponseCacheMixin
 
 logger = logging.getLogger(__name__)
 
@@ -61,12 +63,19 @@ def get_language_prefix(url: str) -> str:
     retrieve=extend_schema(operation_id='learning_language_retrieve'),
     destroy=extend_schema(operation_id='learning_language_destroy'),
 )
-class LanguageViewSet(ActionsWithRelatedObjectsMixin, viewsets.ModelViewSet):
+class LanguageViewSet(
+    VocabularyResponseCacheMixin,
+    SparseFieldsetsMixin,
+    ActionsWithRelatedObjectsMixin,
+    viewsets.ModelViewSet,
+):
     """User's learning, native languages CRUD."""
 
     http_method_names = ('get', 'post', 'delete', 'head')
     lookup_field = 'language__isocode'
     queryset = UserLearningLanguage.objects.none()
+    # languages words counters include words of all users
+    non_cached_actions = ('all', 'learning_available')
     serializer_class = LearningLanguageSerializer
     permission_classes = (IsAuthenticated,)
     pagination_class = None
@@ -113,13 +122,9 @@ class LanguageViewSet(ActionsWithRelatedObjectsMixin, viewsets.ModelViewSet):
                     .annotate(words_count=Count('words'))
                 )
             case _:
-                return user.learning_languages_detail.prefetch_related(
-                    'user', 'language'
-                ).annotate(
-                    words_count=Count(
-                        'user__words', filter=Q(user__words__language=F('language'))
-                    )
-                )
+                return self.prefetch_represented(
+                    user.learning_languages_detail.all(), 'user', 'language'
+                ).annotate(**UserLearningLanguage.get_words_counters())
 
     def get_serializer_class(self) -> Serializer:
         match self.action:
@@ -269,8 +274,18 @@ class LanguageViewSet(ActionsWithRelatedObjectsMixin, viewsets.ModelViewSet):
 
         instance_data = self.get_serializer(instance).data
 
-        _collections = instance.user.collections.filter(
-            words__language=instance.language
+        # collections are filtered by subquery, so they are not duplicated for
+        # every word with given language
+        _collections = (
+            instance.user.collections.filter(
+                Exists(
+                    WordsInCollections.objects.filter(
+                        collection=OuterRef('pk'), word__language=instance.language
+                    )
+                )
+            )
+            .prefetch_related('author', 'words')
+            .annotate(words_count=Count('words', distinct=True))
         )
         logger.debug(f'Obtained collections: {_collections}')
 
@@ -0,0 +1,386 @@
+"""Vocabulary app words import from CSV or JSON lines streams."""
+
+import csv
+import json
+import codecs
+import logging
+from typing import Iterable, Iterator
+
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Lower
+
+from rest_framework.exceptions import ValidationError
+
+from utils.fillers import slug_filler
+from apps.core.constants import ExceptionDetails
+from apps.vocabulary.models import (
+    Word,
+    WordTag,
+    WordTranslation,
+    Definition,
+    UsageExample,
+    WordTranslations,
+    WordDefinitions,
+    WordUsageExamples,
+    WordCounter,
+    WordSearchDocument,
+    MainPageSnapshot,
+    mark_vocabulary_modified,
+)
+
+from .serializers import WordImportSerializer
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+CSV_CONTENT_TYPES = ('text/csv',)
+JSON_LINES_CONTENT_TYPES = (
+    'application/jsonl',
+    'application/x-ndjson',
+    'application/x-jsonlines',
+)
+# separator of list values in CSV columns, e.g. `tags` column: `food|fruits`
+CSV_LIST_SEPARATOR = '|'
+IMPORT_CHUNK_SIZE = 1000
+
+
+def split_csv_list(value: str | None) -> list[str]:
+    """Returns not empty values of CSV list column."""
+    values = (value or '').split(CSV_LIST_SEPARATOR)
+    return [value.strip() for value in values if value.strip()]
+
+
+def parse_csv_row(row: dict) -> dict:
+    """
+    Returns CSV row converted to imported word data. Translations are in
+    `translations_language` language, definitions and examples are passed
+    without translations.
+    """
+    data = {
+        field: row[field]
+        for field in ('text', 'language', 'note')
+        if row.get(field) is not None
+    }
+    data['tags'] = split_csv_list(row.get('tags'))
+    data['translations'] = [
+        {'text': text, 'language': row.get('translations_language') or ''}
+        for text in split_csv_list(row.get('translations'))
+    ]
+    data['definitions'] = [
+        {'text': text} for text in split_csv_list(row.get('definitions'))
+    ]
+    data['examples'] = [{'text': text} for text in split_csv_list(row.get('examples'))]
+    return data
+
+
+def read_csv_rows(stream: Iterable[bytes]) -> Iterator[dict | ValidationError]:
+    """
+    Yields words data from CSV stream with header row (`text`, `language`,
+    `note`, `tags`, `translations`, `translations_language`, `definitions`,
+    `examples` columns). Yields validation error and stops if stream can not be
+    read any further.
+    """
+    reader = csv.DictReader(codecs.iterdecode(stream, 'utf-8-sig'))
+    try:
+        for row in reader:
+            yield parse_csv_row(row)
+    except (UnicodeDecodeError, csv.Error):
+        yield ValidationError(ExceptionDetails.Vocabulary.INVALID_IMPORT_ROW)
+
+
+def read_json_lines_rows(stream: Iterable[bytes]) -> Iterator[dict | ValidationError]:
+    """Yields words data from JSON lines stream, empty lines are skipped."""
+    for line in stream:
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield ValidationError(ExceptionDetails.Vocabulary.INVALID_IMPORT_ROW)
+
+
+def get_rows_reader(content_type: str):
+    """Returns rows reader for passed content type or None if not supported."""
+    if content_type in CSV_CONTENT_TYPES:
+        return read_csv_rows
+    if content_type in JSON_LINES_CONTENT_TYPES:
+        return read_json_lines_rows
+    return None
+
+
+class WordsImporter:
+    """
+    Imports words with translations, tags, definitions and usage examples to
+    user's vocabulary. Rows are validated and saved by chunks: words and related
+    objects are looked up and inserted with few queries per chunk instead of
+    queries per every object. Returns report with every row import result.
+    """
+
+    CREATED = 'created'
+    EXISTS = 'exists'
+    DUPLICATE = 'duplicate'
+    ERROR = 'error'
+
+    chunk_size = IMPORT_CHUNK_SIZE
+
+    # imported data field - (related model, text field, other unique fields,
+    # intermediary model, related object foreign key field name)
+    related_models = {
+        'translations': (
+            WordTranslation,
+            'text',
+            ('language',),
+            WordTranslations,
+            'translation',
+        ),
+        'tags': (WordTag, 'name', (), Word.tags.through, 'wordtag'),
+        'definitions': (Definition, 'text', (), WordDefinitions, 'definition'),
+        'examples': (UsageExample, 'text', (), WordUsageExamples, 'example'),
+    }
+    # existing related objects must be in the same language as the word itself
+    same_language_details = {
+        'definitions': ExceptionDetails.Vocabulary.DEFINITION_MUST_BE_SAME_LANGUAGE,
+        'examples': ExceptionDetails.Vocabulary.EXAMPLE_MUST_BE_SAME_LANGUAGE,
+    }
+
+    def __init__(self, user: User):
+        self.user = user
+        learning_languages = {
+            language.isocode: language for language in user.learning_languages.all()
+        }
+        native_languages = {
+            language.isocode: language for language in user.native_languages.all()
+        }
+        self.context = {
+            'learning_languages': learning_languages,
+            'translations_languages': native_languages | learning_languages,
+        }
+        # (text, language id) of words imported before current chunk
+        self.imported = set()
+
+    def run(self, rows: Iterable[dict | ValidationError]) -> dict:
+        """Imports rows by chunks, returns import report."""
+        results = []
+        chunk = []
+        for index, row in enumerate(rows, start=1):
+            chunk.append((index, row))
+            if len(chunk) >= self.chunk_size:
+                results.extend(self.import_chunk(chunk))
+                chunk = []
+        if chunk:
+            results.extend(self.import_chunk(chunk))
+
+        report = {
+            status: sum(1 for result in results if result['status'] == status)
+            for status in (self.CREATED, self.EXISTS, self.DUPLICATE, self.ERROR)
+        }
+        if report[self.CREATED]:
+            MainPageSnapshot.invalidate(users_ids=[self.user.pk])
+            mark_vocabulary_modified(users_ids=[self.user.pk])
+        logger.debug(f'Words import by {self.user} finished: {report}')
+        return {**report, 'rows': results}
+
+    def import_chunk(self, chunk: list[tuple[int, dict | ValidationError]]) -> list:
+        """Validates and saves chunk rows, returns rows results ordered by rows."""
+        results = {}
+        words = {}
+        for index, row in chunk:
+            if isinstance(row, ValidationError):
+                results[index] = self.get_error_result(index, row.detail)
+                continue
+            serializer = WordImportSerializer(data=row, context=self.context)
+            if serializer.is_valid():
+                words[index] = serializer.validated_data
+            else:
+                results[index] = self.get_error_result(index, serializer.errors)
+
+        results |= self.save_words(words)
+        return [results[index] for index in sorted(results)]
+
+    def save_words(self, words: dict[int, dict]) -> dict[int, dict]:
+        """
+        Saves words in single transaction. If some objects were created after
+        they were looked up, saves words one by one to report conflicting rows.
+        """
+        if not words:
+            return {}
+        try:
+            with transaction.atomic():
+                results, imported = self.create_words(words)
+        except IntegrityError:
+            if len(words) == 1:
+                index = next(iter(words))
+                return {
+                    index: self.get_error_result(
+                        index, [ExceptionDetails.Vocabulary.IMPORT_ROW_CONFLICT]
+                    )
+                }
+            results = {}
+            for index, data in words.items():
+                results |= self.save_words({index: data})
+            return results
+
+        self.imported |= imported
+        return results
+
+    def create_words(self, words: dict[int, dict]) -> tuple[dict, set]:
+        """
+        Creates not existing words, their related objects and intermediary objects
+        with bulk inserts. Returns rows results and created words keys.
+        """
+        results = {}
+        existing_words = set(
+            Word.objects.filter(
+                author=self.user, text__in={data['text'] for data in words.values()}
+            ).values_list('text', 'language_id')
+        )
+        new_words = {}
+        imported = set()
+        for index, data in words.items():
+            key = (data['text'], data['language'].pk)
+            if key in existing_words:
+                results[index] = {'row': index, 'status': self.EXISTS}
+            elif key in self.imported or key in imported:
+                results[index] = {'row': index, 'status': self.DUPLICATE}
+            else:
+                imported.add(key)
+                new_words[index] = data
+
+        related_data = {
+            index: self.get_related_data(data) for index, data in new_words.items()
+        }
+        related_objs = {
+            field: self.get_existing_related(field, related_data.values())
+            for field in self.related_models
+        }
+        for index, data in list(new_words.items()):
+            errors = self.check_related_languages(
+                data, related_data[index], related_objs
+            )
+            if errors:
+                results[index] = self.get_error_result(index, errors)
+                imported.discard((data['text'], data['language'].pk))
+                del new_words[index]
+                del related_data[index]
+        for field in self.related_models:
+            related_objs[field] |= self.create_related(
+                field, related_data.values(), related_objs[field]
+            )
+
+        created_words = {}
+        for index, data in new_words.items():
+            word = Word(
+                author=self.user,
+                language=data['language'],
+                text=data['text'],
+                note=data.get('note', ''),
+            )
+            slug_filler(Word, word)
+            created_words[index] = word
+        Word.objects.bulk_create(created_words.values())
+
+        for field, (_, _, _, through, related_field) in self.related_models.items():
+            through.objects.bulk_create(
+                [
+                    through(word=word, **{related_field: related_objs[field][key]})
+                    for index, word in created_words.items()
+                    for key in related_data[index][field]
+                ]
+            )
+
+        words_ids = [word.pk for word in created_words.values()]
+        WordCounter.objects.bulk_create(
+            [WordCounter(word_id=word_id) for word_id in words_ids]
+        )
+        WordCounter.refresh(words_ids)
+        WordSearchDocument.objects.bulk_create(
+            [WordSearchDocument(word_id=word_id) for word_id in words_ids]
+        )
+        WordSearchDocument.refresh(words_ids)
+        logger.debug(f'{len(words_ids)} words imported by {self.user}')
+
+        for index, word in created_words.items():
+            results[index] = {'row': index, 'status': self.CREATED, 'slug': word.slug}
+        return results, imported
+
+    def get_related_data(self, data: dict) -> dict[str, dict[tuple, dict]]:
+        """Returns word related objects fields by their lookup keys."""
+        objs_fields = {
+            'translations': data.get('translations', []),
+            'tags': [{'name': name} for name in data.get('tags', [])],
+            'definitions': [
+                {**fields, 'language': data['language']}
+                for fields in data.get('definitions', [])
+            ],
+            'examples': [
+                {**fields, 'language': data['language']}
+                for fields in data.get('examples', [])
+            ],
+        }
+        related_data = {}
+        for field, objs in objs_fields.items():
+            _, text_field, unique_fields, _, _ = self.related_models[field]
+            related_data[field] = {}
+            for fields in objs:
+                key = (
+                    fields[text_field].lower(),
+                    *(fields[unique_field].pk for unique_field in unique_fields),
+                )
+                related_data[field].setdefault(key, fields)
+        return related_data
+
+    def get_existing_related(self, field: str, related_data: Iterable[dict]) -> dict:
+        """Returns user's existing related objects by lookup keys with one query."""
+        model, text_field, unique_fields, _, _ = self.related_models[field]
+        keys = {key for data in related_data for key in data[field]}
+        if not keys:
+            return {}
+        objs = (
+            model.objects.filter(author=self.user)
+            .annotate(lower_text=Lower(text_field))
+            .filter(lower_text__in={key[0] for key in keys})
+        )
+        existing = {}
+        for obj in objs:
+            key = (
+                obj.lower_text,
+                *(getattr(obj, f'{unique_field}_id') for unique_field in unique_fields),
+            )
+            if key in keys:
+                existing[key] = obj
+        return existing
+
+    def check_related_languages(
+        self, data: dict, word_related_data: dict, related_objs: dict
+    ) -> dict[str, list]:
+        """Returns errors for existing related objects in other languages."""
+        errors = {}
+        for field, detail in self.same_language_details.items():
+            for key in word_related_data[field]:
+                obj = related_objs[field].get(key)
+                if obj and obj.language_id not in (None, data['language'].pk):
+                    errors[field] = [detail]
+                    break
+        return errors
+
+    def create_related(
+        self, field: str, related_data: Iterable[dict], existing: dict
+    ) -> dict:
+        """Creates not existing related objects with one query, returns them."""
+        model = self.related_models[field][0]
+        objs = {}
+        for data in related_data:
+            for key, fields in data[field].items():
+                if key in existing or key in objs:
+                    continue
+                obj = model(author=self.user, **fields)
+                if hasattr(model, 'slugify_fields'):
+                    slug_filler(model, obj)
+                objs[key] = obj
+        model.objects.bulk_create(objs.values())
+        return objs
+
+    def get_error_result(self, index: int, errors) -> dict:
+        return {'row': index, 'status': self.ERROR, 'errors': errors}
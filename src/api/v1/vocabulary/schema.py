@@ -3,11 +3,13 @@
 from rest_framework import status
 from rest_framework.serializers import (
     CharField,
+    DictField,
     IntegerField,
     ListField,
 )
 from drf_spectacular.utils import (
     OpenApiResponse,
+    PolymorphicProxySerializer,
     inline_serializer,
 )
 
@@ -26,6 +28,7 @@ from api.v1.vocabulary.serializers import (
     CollectionShortSerializer,
     CollectionListSerializer,
     MultipleWordsSerializer,
+    WordImportSerializer,
     TagListSerializer,
     ImageListSerializer,
     ImageInLineSerializer,
@@ -269,6 +272,31 @@ data = {
                 status.HTTP_401_UNAUTHORIZED: unauthorized_response,
             },
         },
+        'word_import': {
+            'summary': 'Импорт слов из CSV или JSON lines',
+            'description': (
+                'Импортирует слова с переводами, тегами, определениями и примерами '
+                'из потока `text/csv` (списки разделяются символом `|`, переводы '
+                'на языке из колонки `translations_language`) или '
+                '`application/x-ndjson` (одно слово в строке). Существующие слова '
+                'пропускаются. Возвращает результат импорта каждой строки. '
+                'Требуется авторизация. '
+            ),
+            'request': WordImportSerializer,
+            'responses': {
+                status.HTTP_201_CREATED: inline_serializer(
+                    name='words_import_report',
+                    fields={
+                        'created': IntegerField(),
+                        'exists': IntegerField(),
+                        'duplicate': IntegerField(),
+                        'error': IntegerField(),
+                        'rows': ListField(child=DictField()),
+                    },
+                ),
+                status.HTTP_401_UNAUTHORIZED: unauthorized_response,
+            },
+        },
         'word_tags_list': {
             'summary': 'Просмотр списка тегов слова',
             'description': (
@@ -1268,8 +1296,23 @@ data = {
         'tags': ['associations'],
         'associations_list': {
             'summary': 'Просмотр списка всех ассоциаций из словаря пользователя',
+            'description': (
+                'Возвращает ассоциации всех типов (картинки и цитаты) из словаря '
+                'пользователя, начиная с последних добавленных. '
+                'Список разбит на страницы курсором: ссылки на соседние '
+                'страницы передаются в полях next и previous. '
+                'Требуется авторизация.'
+            ),
             'request': None,
-            # responses
+            'responses': {
+                status.HTTP_200_OK: PolymorphicProxySerializer(
+                    'association',
+                    serializers=[ImageInLineSerializer, QuoteInLineSerializer],
+                    resource_type_field_name=None,
+                    many=True,
+                ),
+                status.HTTP_401_UNAUTHORIZED: unauthorized_response,
+            },
         },
         # other methods
     },
@@ -1,18 +1,21 @@
 """Vocabulary app serializers."""
 
 from itertools import chain
-from collections import OrderedDict
+from operator import attrgetter
+from collections import OrderedDict, defaultdict
 
 from django.contrib.auth import get_user_model
-from django.db.models import Count, Model
+from django.db.models import Count, Model, Prefetch, prefetch_related_objects
 from django.db import transaction
 from django.core.exceptions import ObjectDoesNotExist
 from django.db.models.query import QuerySet
+from django.utils.translation import get_language
 
 from drf_spectacular.utils import extend_schema_field
 from drf_extra_fields.relations import PresentablePrimaryKeyRelatedField
 from rest_framework import serializers
-from rest_framework.fields import Field
+from rest_framework.fields import Field, SkipField
+from rest_framework.relations import PKOnlyObject
 from rest_framework.utils.serializer_helpers import ReturnDict
 from rest_framework.serializers import Serializer
 
@@ -33,11 +36,19 @@ from apps.vocabulary.models import (
     UsageExample,
     Word,
     WordTranslation,
+    WordTranslations,
+    WordDefinitions,
+    WordUsageExamples,
+    WordImageAssociations,
+    WordsInCollections,
     ImageAssociation,
     QuoteAssociation,
     WordSelfRelatedModel,
-    clear_extra_objects,
+    MainPageSnapshot,
+    get_associations_feed,
+    get_collection_aggregates,
 )
+from apps.vocabulary.constants import MAX_DUE_WORDS_AMOUNT
 
 from ..core.serializers_fields import (
     ReadableHiddenField,
@@ -50,6 +61,7 @@ from ..core.serializers_fields import (
 )
 from ..core.serializers_mixins import (
     ListUpdateSerializer,
+    BulkFetchListSerializer,
     NestedSerializerMixin,
     FavoriteSerializerMixin,
     CountObjsSerializerMixin,
@@ -57,6 +69,8 @@ from ..core.serializers_mixins import (
     AmountLimitsSerializerHandler,
     UpdateSerializerMixin,
     HybridImageSerializerMixin,
+    LastObjsSerializerMixin,
+    SparseFieldsetsSerializerMixin,
 )
 from ..core.exceptions import AmountLimitExceeded, ObjectAlreadyExist
 from ..users.serializers import UserListSerializer
@@ -200,7 +214,11 @@ class WordTranslationInLineSerializer(
         default=NativeLanguageDefault(),
     )
     language_icon = serializers.SerializerMethodField('get_language_icon')
-    words_count = KwargsMethodField('get_objs_count', objs_related_name='words')
+    words_count = KwargsMethodField(
+        'get_objs_count',
+        objs_related_name='words',
+        annotation_name='words_count',
+    )
 
     already_exist_detail = ExceptionDetails.Vocabulary.TRANSLATION_ALREADY_EXIST
 
@@ -256,7 +274,11 @@ class UsageExampleInLineSerializer(
         slug_field='isocode',
         required=True,
     )
-    words_count = KwargsMethodField('get_objs_count', objs_related_name='words')
+    words_count = KwargsMethodField(
+        'get_objs_count',
+        objs_related_name='words',
+        annotation_name='words_count',
+    )
 
     already_exist_detail = ExceptionDetails.Vocabulary.EXAMPLE_ALREADY_EXIST
 
@@ -300,7 +322,11 @@ class DefinitionInLineSerializer(
         slug_field='isocode',
         required=True,
     )
-    words_count = KwargsMethodField('get_objs_count', objs_related_name='words')
+    words_count = KwargsMethodField(
+        'get_objs_count',
+        objs_related_name='words',
+        annotation_name='words_count',
+    )
 
     already_exist_detail = ExceptionDetails.Vocabulary.DEFINITION_ALREADY_EXIST
 
@@ -328,9 +354,11 @@ class DefinitionInLineSerializer(
 
 
 class CollectionShortSerializer(
+    SparseFieldsetsSerializerMixin,
     FavoriteSerializerMixin,
     AlreadyExistSerializerHandler,
     CountObjsSerializerMixin,
+    LastObjsSerializerMixin,
     serializers.ModelSerializer,
 ):
     """
@@ -346,10 +374,25 @@ class CollectionShortSerializer(
     words_count = KwargsMethodField(
         'get_objs_count',
         objs_related_name='words',
+        annotation_name='words_count',
     )
     last_4_words = serializers.SerializerMethodField('get_last_4_words')
 
     already_exist_detail = ExceptionDetails.Vocabulary.COLLECTION_ALREADY_EXIST
+    expandable_fields = ('last_4_words', 'words_languages', 'words_images')
+    prefetch_related_fields = {
+        'author': ('author',),
+        'words': ('words_count',),
+        'last_words': ('last_4_words',),
+    }
+    last_objs = {
+        'last_words': {
+            'queryset': WordsInCollections.objects.select_related('word'),
+            'parent_fields': 'collection',
+            'amount': 4,
+            'related_field': 'word',
+        },
+    }
 
     class Meta:
         model = Collection
@@ -376,9 +419,19 @@ class CollectionShortSerializer(
             'modified',
         )
 
+    def bulk_fetch(self, collections: list[Collection]) -> None:
+        """
+        Fetches last words, favorites for all listed collections with fixed amount
+        of queries (called by list serializer).
+        """
+        super().bulk_fetch(collections)
+        self.fetch_favorites(collections)
+
     @extend_schema_field({'type': 'object'})
-    def get_last_4_words(self, obj: Collection) -> QuerySet[Word]:
-        """Returns list of 3 last added words in the given collection."""
+    def get_last_4_words(self, obj: Collection) -> QuerySet[Word] | list[str]:
+        """Returns list of 4 last added words in the given collection."""
+        if hasattr(obj, 'last_words'):
+            return [word.text for word in obj.last_words]
         return obj.words.order_by('-wordsincollections__created').values_list(
             'text', flat=True
         )[:4]
@@ -441,7 +494,11 @@ class ImageInLineSerializer(HybridImageSerializerMixin, CountObjsSerializerMixin
     association_type = serializers.SerializerMethodField(
         'get_association_type',
     )
-    words_count = KwargsMethodField('get_objs_count', objs_related_name='words')
+    words_count = KwargsMethodField(
+        'get_objs_count',
+        objs_related_name='words',
+        annotation_name='words_count',
+    )
 
     class Meta:
         model = ImageAssociation
@@ -501,7 +558,11 @@ class QuoteInLineSerializer(CountObjsSerializerMixin, serializers.ModelSerialize
     association_type = serializers.SerializerMethodField(
         'get_association_type',
     )
-    words_count = KwargsMethodField('get_objs_count', objs_related_name='words')
+    words_count = KwargsMethodField(
+        'get_objs_count',
+        objs_related_name='words',
+        annotation_name='words_count',
+    )
 
     class Meta:
         model = QuoteAssociation
@@ -530,6 +591,47 @@ class QuoteInLineSerializer(CountObjsSerializerMixin, serializers.ModelSerialize
         return 'quote'
 
 
+class AssociationFeedSerializer(serializers.BaseSerializer):
+    """
+    Serializer to list associations of any type from merged associations feed
+    rows (association type and id), keeping feed order.
+    """
+
+    associations_serializers = {
+        'image': ImageInLineSerializer,
+        'quote': QuoteInLineSerializer,
+    }
+
+    class Meta:
+        list_serializer_class = BulkFetchListSerializer
+
+    def bulk_fetch(self, rows: list[dict]) -> None:
+        """
+        Fetches associations of all listed feed rows with fixed amount of queries
+        (called by list serializer).
+        """
+        ids = defaultdict(list)
+        for row in rows:
+            ids[row['association_type']].append(row['id'])
+        self.associations = {}
+        for association_type, serializer_class in self.associations_serializers.items():
+            if ids[association_type]:
+                self.associations.update(
+                    (obj.id, obj)
+                    for obj in serializer_class.Meta.model.objects.filter(
+                        id__in=ids[association_type]
+                    )
+                    .select_related('author')
+                    .prefetch_related('words')
+                )
+
+    def to_representation(self, row: dict) -> dict:
+        if not hasattr(self, 'associations'):
+            self.bulk_fetch([row])
+        serializer_class = self.associations_serializers[row['association_type']]
+        return serializer_class(self.associations[row['id']], context=self.context).data
+
+
 class TagSerializer(AlreadyExistSerializerHandler, serializers.ModelSerializer):
     """Serializer to list, create word tags."""
 
@@ -548,6 +650,35 @@ class TagSerializer(AlreadyExistSerializerHandler, serializers.ModelSerializer):
         fields = ('name', 'author')
 
 
+# word related lookups and fields they are needed for (used to skip prefetching
+# related objects of fields omitted by sparse fieldsets)
+words_prefetch_related_fields = {
+    'author': ('author',),
+    'language': ('language',),
+    'tags': ('tags',),
+    'types': ('types',),
+    'form_groups': ('form_groups',),
+    'image_associations': (
+        'image',
+        'images_count',
+        'image_associations',
+        'associations_count',
+        'associations',
+    ),
+    'quote_associations': ('associations_count', 'associations'),
+    'wordtranslations': (
+        'translations',
+        'translations_count',
+        'last_6_translations',
+        'other_translations_count',
+    ),
+    'translations': ('translations', 'translations_count'),
+    'examples': ('examples', 'examples_count'),
+    'definitions': ('definitions', 'definitions_count'),
+    'collections': ('collections', 'collections_count'),
+}
+
+
 class WordSuperShortSerializer(serializers.ModelSerializer):
     """Serializer to list words with no details."""
 
@@ -576,10 +707,24 @@ class ActivityProgressSerializerMixin(serializers.ModelSerializer):
 
     @extend_schema_field({'type': 'integer'})
     def get_activity_progress(self, obj: Word) -> int:
-        return 0
+        """Returns word exercise progress percent by repetitions schedule."""
+        return obj.exercise_progress
+
+
+class DueWordSerializer(ActivityProgressSerializerMixin, WordSuperShortSerializer):
+    """Serializer to list words in due words queue."""
+
+    class Meta(WordSuperShortSerializer.Meta):
+        fields = WordSuperShortSerializer.Meta.fields + (
+            'activity_progress',
+            'last_exercise_date',
+            'next_exercise_date',
+        )
+        read_only_fields = fields
 
 
 class WordShortCardSerializer(
+    SparseFieldsetsSerializerMixin,
     FavoriteSerializerMixin,
     ActivityProgressSerializerMixin,
     WordSuperShortSerializer,
@@ -589,9 +734,15 @@ class WordShortCardSerializer(
     tags = serializers.SlugRelatedField(slug_field='name', read_only=True, many=True)
     activity_status = serializers.SerializerMethodField('get_activity_status_display')
 
+    # related objects fetched for all listed words at once
+    cards_prefetch_related = ('author', 'language', 'tags')
+    expandable_fields = ('tags', 'types', 'last_6_translations', 'translations')
+    prefetch_related_fields = words_prefetch_related_fields
+
     class Meta(WordSuperShortSerializer.Meta):
         favorite_model = FavoriteWord
         favorite_model_field = 'word'
+        list_serializer_class = BulkFetchListSerializer
         fields = WordSuperShortSerializer.Meta.fields + (
             'tags',
             'favorite',
@@ -601,6 +752,16 @@ class WordShortCardSerializer(
             'last_exercise_date',
         )
 
+    def bulk_fetch(self, words: list[Word]) -> None:
+        """
+        Fetches related objects, favorites for all listed words with fixed amount
+        of queries (called by list serializer).
+        """
+        prefetch_related_objects(
+            words, *self.filter_prefetch_related(self.cards_prefetch_related)
+        )
+        self.fetch_favorites(words)
+
     @extend_schema_field({'type': 'string'})
     def get_activity_status_display(self, obj: Word) -> str:
         """Get activity status full text for display."""
@@ -619,9 +780,21 @@ class GetLastImageSerializerMixin(serializers.ModelSerializer):
 
     @extend_schema_field({'type': 'string'})
     def get_last_image(self, obj: Word) -> str | None:
-        """Returns last added image association."""
+        """
+        Returns last added image association.
+        Prefetched image associations are used if there are any.
+        """
         try:
-            latest_image_association = obj.image_associations.latest()
+            if 'image_associations' in getattr(obj, '_prefetched_objects_cache', {}):
+                latest_image_association = max(
+                    obj.image_associations.all(),
+                    key=attrgetter('created'),
+                    default=None,
+                )
+                if latest_image_association is None:
+                    return None
+            else:
+                latest_image_association = obj.image_associations.latest()
 
             try:
                 url = latest_image_association.image.url
@@ -642,9 +815,34 @@ class GetLastImageSerializerMixin(serializers.ModelSerializer):
             return None
 
 
+class TranslationsByDateSerializerMixin(serializers.ModelSerializer):
+    """
+    Custom serializer mixin to get word translations texts ordered by date added
+    to the word (latest first) from fetched intermediate objects.
+    """
+
+    cards_prefetch_related = WordShortCardSerializer.cards_prefetch_related + (
+        'types',
+        'image_associations',
+        Prefetch(
+            'wordtranslations',
+            queryset=WordTranslations.objects.select_related('translation').order_by(
+                '-created'
+            ),
+        ),
+    )
+
+    def get_translations_by_date(self, obj: Word) -> list[str]:
+        """Returns list of all translations texts for the given word, latest first."""
+        return [
+            word_translation.translation.text
+            for word_translation in obj.wordtranslations.all()
+        ]
+
+
 class WordLongCardSerializer(
     GetLastImageSerializerMixin,
-    CountObjsSerializerMixin,
+    TranslationsByDateSerializerMixin,
     WordShortCardSerializer,
 ):
     """Serializer to list words with 6 last added translations."""
@@ -670,20 +868,18 @@ class WordLongCardSerializer(
     @extend_schema_field({'type': 'integer'})
     def get_other_translations_count(self, obj: Word) -> int:
         """Returns amount of translations for the given word minus 6 last added."""
-        translations_count = obj.translations.count()
+        translations_count = len(self.get_translations_by_date(obj))
         return translations_count - 6 if translations_count > 6 else 0
 
     @extend_schema_field({'type': 'string'})
-    def get_last_6_translations(self, obj: Word) -> QuerySet[WordTranslation]:
+    def get_last_6_translations(self, obj: Word) -> list[str]:
         """Returns list of 6 last added translations for the given word."""
-        return obj.translations.order_by('-wordtranslations__created').values_list(
-            'text', flat=True
-        )[:6]
+        return self.get_translations_by_date(obj)[:6]
 
 
 class WordStandartCardSerializer(
     GetLastImageSerializerMixin,
-    CountObjsSerializerMixin,
+    TranslationsByDateSerializerMixin,
     WordShortCardSerializer,
 ):
     """Serializer to list words in standart form with all translations."""
@@ -693,10 +889,7 @@ class WordStandartCardSerializer(
         many=True,
         read_only=True,
     )
-    translations_count = KwargsMethodField(
-        'get_objs_count',
-        objs_related_name='translations',
-    )
+    translations_count = serializers.SerializerMethodField('get_translations_count')
     translations = serializers.SerializerMethodField('get_translations')
 
     class Meta(WordShortCardSerializer.Meta):
@@ -707,15 +900,19 @@ class WordStandartCardSerializer(
             'image',
         )
 
+    @extend_schema_field({'type': 'integer'})
+    def get_translations_count(self, obj: Word) -> int:
+        """Returns amount of translations for the given word."""
+        return len(self.get_translations_by_date(obj))
+
     @extend_schema_field({'type': 'string'})
-    def get_translations(self, obj: Word) -> QuerySet[WordTranslation]:
+    def get_translations(self, obj: Word) -> list[str]:
         """Returns list of all related translations for the given word."""
-        return obj.translations.order_by('-wordtranslations__created').values_list(
-            'text', flat=True
-        )
+        return self.get_translations_by_date(obj)
 
 
 class WordShortCreateSerializer(
+    SparseFieldsetsSerializerMixin,
     ValidateLanguageMixin,
     FavoriteSerializerMixin,
     UpdateSerializerMixin,
@@ -805,7 +1002,70 @@ class WordShortCreateSerializer(
     activity_status = serializers.SerializerMethodField('get_activity_status_display')
     activity_progress = serializers.SerializerMethodField('get_activity_progress')
 
+    # related objects fetched for all represented words at once (annotated with
+    # words amounts to count them without per object queries)
+    details_prefetch_related = (
+        'author',
+        'language',
+        'tags',
+        'types',
+        Prefetch(
+            'form_groups',
+            queryset=FormGroup.objects.select_related('author', 'language'),
+        ),
+        Prefetch(
+            'translations',
+            queryset=WordTranslation.objects.select_related(
+                'author', 'language'
+            ).annotate(words_count=Count('words', distinct=True)),
+        ),
+        Prefetch(
+            'examples',
+            queryset=UsageExample.objects.select_related('author', 'language').annotate(
+                words_count=Count('words', distinct=True)
+            ),
+        ),
+        Prefetch(
+            'definitions',
+            queryset=Definition.objects.select_related('author', 'language').annotate(
+                words_count=Count('words', distinct=True)
+            ),
+        ),
+        Prefetch(
+            'image_associations',
+            queryset=ImageAssociation.objects.select_related('author').annotate(
+                words_count=Count('words', distinct=True)
+            ),
+        ),
+        Prefetch(
+            'quote_associations',
+            queryset=QuoteAssociation.objects.select_related('author').annotate(
+                words_count=Count('words', distinct=True)
+            ),
+        ),
+        Prefetch(
+            'collections',
+            queryset=Collection.objects.select_related('author').annotate(
+                words_count=Count('words', distinct=True)
+            ),
+        ),
+    )
+    # ids of words fetched with `bulk_fetch`
+    fetched_words_ids = frozenset()
+
     already_exist_detail = ExceptionDetails.Vocabulary.WORD_ALREADY_EXIST
+    expandable_fields = (
+        'types',
+        'tags',
+        'form_groups',
+        'translations',
+        'examples',
+        'definitions',
+        'image_associations',
+        'associations',
+        'collections',
+    )
+    prefetch_related_fields = words_prefetch_related_fields
     default_error_messages = {
         ExceptionCodes.Vocabulary.EXAMPLE_MUST_BE_SAME_LANGUAGE: {
             'examples': ExceptionDetails.Vocabulary.EXAMPLE_MUST_BE_SAME_LANGUAGE,
@@ -930,15 +1190,6 @@ class WordShortCreateSerializer(
         """
         return super().create(validated_data, parent_first)
 
-    def update(self, instance: Word, validated_data: OrderedDict) -> Word:
-        """
-        Delete word related objects if they no longer relate to other words after
-        word update.
-        """
-        instance = super().update(instance, validated_data)
-        clear_extra_objects(sender=Word)
-        return instance
-
     def validate_language(self, language: Language) -> Language | None:
         """Check if passed language belongs to users learning languages."""
         return self.validate_language_is_learning(language)
@@ -964,6 +1215,27 @@ class WordShortCreateSerializer(
         """A helper method that simply raises a validation error."""
         raise serializers.ValidationError(self.error_messages[key], code=key)
 
+    def bulk_fetch(self, words: list[Word]) -> None:
+        """
+        Fetches related objects, favorites for all represented words with fixed
+        amount of queries (called by list serializer or before single word
+        representation).
+        """
+        prefetch_related_objects(
+            words, *self.filter_prefetch_related(self.details_prefetch_related)
+        )
+        self.fetch_favorites(words)
+        if 'collections' in self.fields:
+            self.fields['collections'].child.bulk_fetch(
+                list(chain.from_iterable(word.collections.all() for word in words))
+            )
+        self.fetched_words_ids = self.fetched_words_ids.union(word.pk for word in words)
+
+    def to_representation(self, instance: Word) -> OrderedDict:
+        if instance.pk not in self.fetched_words_ids:
+            self.bulk_fetch([instance])
+        return super().to_representation(instance)
+
     @extend_schema_field({'type': 'integer'})
     def get_associations_count(self, obj: Word) -> int:
         """Returns common amount of all associations of any type."""
@@ -971,18 +1243,36 @@ class WordShortCreateSerializer(
 
     @extend_schema_field({'type': 'object'})
     def get_associations(self, obj: Word) -> list:
-        """Returns common list of all associations of any type."""
-        images = ImageInLineSerializer(
-            obj.image_associations.order_by('-wordimageassociations__created'),
-            many=True,
-            context={'request': self.context.get('request')},
-        )
-        quotes = QuoteInLineSerializer(
-            obj.quote_associations.order_by('-wordquoteassociations__created'),
+        """
+        Returns common list of all associations of any type, latest first.
+        Prefetched associations are merged if there are any.
+        """
+        prefetched = getattr(obj, '_prefetched_objects_cache', {})
+        if 'image_associations' in prefetched and 'quote_associations' in prefetched:
+            associations = sorted(
+                chain(obj.image_associations.all(), obj.quote_associations.all()),
+                # feed order, null modified dates go first as in database ordering
+                key=lambda association: (
+                    association.created,
+                    association.modified is None,
+                    association.modified or association.created,
+                    association.id,
+                ),
+                reverse=True,
+            )
+            return [
+                AssociationFeedSerializer.associations_serializers[
+                    'image' if isinstance(association, ImageAssociation) else 'quote'
+                ](association, context={'request': self.context.get('request')}).data
+                for association in associations
+            ]
+        return AssociationFeedSerializer(
+            get_associations_feed(
+                obj.image_associations.all(), obj.quote_associations.all()
+            ).order_by('-created', '-modified', '-id'),
             many=True,
             context={'request': self.context.get('request')},
-        )
-        return chain(quotes.data, images.data)
+        ).data
 
     @extend_schema_field({'type': 'string'})
     def get_activity_status_display(self, obj: Word) -> str:
@@ -996,6 +1286,10 @@ class WordSelfRelatedSerializer(NestedSerializerMixin, serializers.ModelSerializ
     to_word = serializers.HiddenField(default=None)
     from_word = WordShortCreateSerializer(read_only=False, required=True, many=False)
 
+    # words related name to count related words of the same type for related word
+    words_related_name = ''
+    # ids of relations fetched with `bulk_fetch`
+    fetched_relations_ids = frozenset()
     validate_same_language = True
     default_error_messages = {
         ExceptionCodes.Vocabulary.WORDS_MUST_BE_SAME_LANGUAGE: ExceptionDetails.Vocabulary.WORDS_MUST_BE_SAME_LANGUAGE,
@@ -1066,12 +1360,55 @@ class WordSelfRelatedSerializer(NestedSerializerMixin, serializers.ModelSerializ
         """A helper method that simply raises a validation error."""
         raise serializers.ValidationError(self.error_messages[key], code=key)
 
+    def bulk_fetch(self, relations: list[WordSelfRelatedModel]) -> None:
+        """
+        Fetches related words with their details, related words amounts for all
+        represented relations with fixed amount of queries (called by list
+        serializer or before single relation representation).
+        """
+        prefetch_related_objects(relations, 'from_word')
+        not_counted = [
+            relation for relation in relations if 'words_count' not in vars(relation)
+        ]
+        if 'words_count' in self.fields and not_counted:
+            words_counts = dict(
+                Word.objects.filter(
+                    pk__in={relation.from_word_id for relation in not_counted}
+                )
+                .annotate(words_count=Count(self.words_related_name, distinct=True))
+                .values_list('pk', 'words_count')
+            )
+            for relation in not_counted:
+                relation.words_count = words_counts[relation.from_word_id]
+        self.fields['from_word'].bulk_fetch(
+            [relation.from_word for relation in relations]
+        )
+        self.fetched_relations_ids = self.fetched_relations_ids.union(
+            relation.pk for relation in relations
+        )
+
+    def to_representation(self, instance: WordSelfRelatedModel) -> OrderedDict:
+        if instance.pk not in self.fetched_relations_ids:
+            self.bulk_fetch([instance])
+        return super().to_representation(instance)
+
+    @extend_schema_field({'type': 'integer'})
+    def get_words_count(self, obj: WordSelfRelatedModel) -> int | None:
+        """
+        Returns amount of related words of the same type for related word
+        (fetched amount if there is one).
+        """
+        if 'words_count' in vars(obj):
+            return obj.words_count
+        return obj.from_word.__getattribute__(self.words_related_name).count()
+
 
 class SynonymInLineSerializer(WordSelfRelatedSerializer):
     """Serializer to list, create word synonyms inside word serializer."""
 
     words_count = serializers.SerializerMethodField('get_words_count')
 
+    words_related_name = 'synonyms'
     default_error_messages = {
         ExceptionCodes.Vocabulary.SYNONYM_MUST_BE_SAME_LANGUAGE: {
             'synonyms': ExceptionDetails.Vocabulary.SYNONYM_MUST_BE_SAME_LANGUAGE,
@@ -1098,16 +1435,13 @@ class SynonymInLineSerializer(WordSelfRelatedSerializer):
             'created',
         )
 
-    @extend_schema_field({'type': 'integer'})
-    def get_words_count(self, obj) -> int | None:
-        return obj.from_word.synonyms.count()
-
 
 class AntonymInLineSerializer(WordSelfRelatedSerializer):
     """Serializer to list, create word antonyms inside word serializer."""
 
     words_count = serializers.SerializerMethodField('get_words_count')
 
+    words_related_name = 'antonyms'
     default_error_messages = {
         ExceptionCodes.Vocabulary.ANTONYM_MUST_BE_SAME_LANGUAGE: {
             'antonyms': ExceptionDetails.Vocabulary.ANTONYM_MUST_BE_SAME_LANGUAGE,
@@ -1134,16 +1468,13 @@ class AntonymInLineSerializer(WordSelfRelatedSerializer):
             'created',
         )
 
-    @extend_schema_field({'type': 'integer'})
-    def get_words_count(self, obj) -> int | None:
-        return obj.from_word.antonyms.count()
-
 
 class FormInLineSerializer(WordSelfRelatedSerializer):
     """Serializer to list, create word forms inside word serializer."""
 
     words_count = serializers.SerializerMethodField('get_words_count')
 
+    words_related_name = 'forms'
     default_error_messages = {
         ExceptionCodes.Vocabulary.FORM_MUST_BE_SAME_LANGUAGE: {
             'forms': ExceptionDetails.Vocabulary.FORM_MUST_BE_SAME_LANGUAGE,
@@ -1169,16 +1500,13 @@ class FormInLineSerializer(WordSelfRelatedSerializer):
             'created',
         )
 
-    @extend_schema_field({'type': 'integer'})
-    def get_words_count(self, obj) -> int | None:
-        return obj.from_word.forms.count()
-
 
 class SimilarInLineSerializer(WordSelfRelatedSerializer):
     """Serializer to list, create similar words inside word serializer."""
 
     words_count = serializers.SerializerMethodField('get_words_count')
 
+    words_related_name = 'similars'
     default_error_messages = {
         ExceptionCodes.Vocabulary.SIMILAR_MUST_BE_SAME_LANGUAGE: {
             'similars': ExceptionDetails.Vocabulary.SIMILAR_MUST_BE_SAME_LANGUAGE,
@@ -1204,10 +1532,6 @@ class SimilarInLineSerializer(WordSelfRelatedSerializer):
             'created',
         )
 
-    @extend_schema_field({'type': 'integer'})
-    def get_words_count(self, obj) -> int | None:
-        return obj.from_word.similars.count()
-
 
 class WordSerializer(WordShortCreateSerializer):
     """
@@ -1255,21 +1579,33 @@ class WordSerializer(WordShortCreateSerializer):
         objs_related_name='definitions',
     )
     definitions = DefinitionInLineSerializer(many=True, required=False)
-    synonyms_count = KwargsMethodField('get_objs_count', objs_related_name='synonyms')
+    synonyms_count = KwargsMethodField(
+        'get_objs_count',
+        objs_related_name='synonym_to_words',
+    )
     synonyms = SynonymInLineSerializer(
         many=True,
         required=False,
         source='synonym_to_words',
     )
-    antonyms_count = KwargsMethodField('get_objs_count', objs_related_name='antonyms')
+    antonyms_count = KwargsMethodField(
+        'get_objs_count',
+        objs_related_name='antonym_to_words',
+    )
     antonyms = AntonymInLineSerializer(
         many=True,
         required=False,
         source='antonym_to_words',
     )
-    forms_count = KwargsMethodField('get_objs_count', objs_related_name='forms')
+    forms_count = KwargsMethodField(
+        'get_objs_count',
+        objs_related_name='form_to_words',
+    )
     forms = FormInLineSerializer(many=True, required=False, source='form_to_words')
-    similars_count = KwargsMethodField('get_objs_count', objs_related_name='similars')
+    similars_count = KwargsMethodField(
+        'get_objs_count',
+        objs_related_name='similar_to_words',
+    )
     similars = SimilarInLineSerializer(
         many=True,
         required=False,
@@ -1281,6 +1617,30 @@ class WordSerializer(WordShortCreateSerializer):
     )
     collections = CollectionShortSerializer(many=True, required=False)
 
+    # related words relations fetched for all represented words at once (related
+    # words details are fetched for all relations together then)
+    related_words_prefetch_related = tuple(
+        Prefetch(
+            f'{model.__name__.lower()}_to_words',
+            queryset=model.objects.select_related('from_word').annotate(
+                words_count=Count(f'from_word__{words_related_name}', distinct=True)
+            ),
+        )
+        for model, words_related_name in (
+            (Synonym, 'synonyms'),
+            (Antonym, 'antonyms'),
+            (Form, 'forms'),
+            (Similar, 'similars'),
+        )
+    )
+    prefetch_related_fields = {
+        **words_prefetch_related_fields,
+        'synonym_to_words': ('synonyms', 'synonyms_count'),
+        'antonym_to_words': ('antonyms', 'antonyms_count'),
+        'form_to_words': ('forms', 'forms_count'),
+        'similar_to_words': ('similars', 'similars_count'),
+    }
+
     already_exist_detail = ExceptionDetails.Vocabulary.WORD_ALREADY_EXIST
 
     class Meta(WordShortCreateSerializer.Meta):
@@ -1409,6 +1769,24 @@ class WordSerializer(WordShortCreateSerializer):
             ),
         }
 
+    def bulk_fetch(self, words: list[Word]) -> None:
+        """
+        Fetches related words relations for all represented words, then fetches
+        details of all related words at once.
+        """
+        super().bulk_fetch(words)
+        lookups = self.filter_prefetch_related(self.related_words_prefetch_related)
+        prefetch_related_objects(words, *lookups)
+        prefetch_related_objects(
+            [
+                relation.from_word
+                for word in words
+                for lookup in lookups
+                for relation in getattr(word, lookup.prefetch_to).all()
+            ],
+            *self.details_prefetch_related,
+        )
+
 
 class MultipleWordsSerializer(serializers.Serializer):
     """
@@ -1455,6 +1833,129 @@ class MultipleWordsSerializer(serializers.Serializer):
         return {'words': _words, 'collections': _collections}
 
 
+def get_model_field_validators(model, field_name: str) -> list:
+    """Returns model field validators to validate data without model instance."""
+    return list(model._meta.get_field(field_name).validators)
+
+
+class ImportLanguageField(serializers.CharField):
+    """
+    Language isocode field for imported rows, returns language from languages
+    passed in serializer context by `languages_context_key` (to avoid querying
+    languages for every row).
+    """
+
+    def __init__(self, languages_context_key: str, error_detail: str, **kwargs):
+        self.languages_context_key = languages_context_key
+        self.error_detail = error_detail
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data) -> Language:
+        isocode = super().to_internal_value(data)
+        try:
+            return self.context[self.languages_context_key][isocode]
+        except KeyError:
+            raise serializers.ValidationError(
+                self.error_detail, code=ExceptionCodes.Languages.LANGUAGE_INVALID
+            )
+
+
+class WordImportTranslationSerializer(serializers.Serializer):
+    """Imported word translation serializer."""
+
+    text = serializers.CharField(
+        validators=get_model_field_validators(WordTranslation, 'text')
+    )
+    language = ImportLanguageField(
+        languages_context_key='translations_languages',
+        error_detail=ExceptionDetails.Languages.LANGUAGE_MUST_BE_LEARNING_OR_NATIVE,
+    )
+
+
+class WordImportDefinitionSerializer(serializers.Serializer):
+    """Imported word definition serializer."""
+
+    text = serializers.CharField(
+        validators=get_model_field_validators(Definition, 'text')
+    )
+    translation = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        validators=get_model_field_validators(Definition, 'translation'),
+    )
+
+
+class WordImportUsageExampleSerializer(serializers.Serializer):
+    """Imported word usage example serializer."""
+
+    text = serializers.CharField(
+        validators=get_model_field_validators(UsageExample, 'text')
+    )
+    translation = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        validators=get_model_field_validators(UsageExample, 'translation'),
+    )
+
+
+class WordImportSerializer(serializers.Serializer):
+    """
+    Imported word row serializer. Validates row data only, languages must be
+    passed in context, objects are created by `WordsImporter` in bulk.
+    """
+
+    text = serializers.CharField(validators=get_model_field_validators(Word, 'text'))
+    language = ImportLanguageField(
+        languages_context_key='learning_languages',
+        error_detail=ExceptionDetails.Languages.LANGUAGE_MUST_BE_LEARNING,
+    )
+    note = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        validators=get_model_field_validators(Word, 'note'),
+    )
+    tags = serializers.ListField(
+        child=serializers.CharField(
+            validators=get_model_field_validators(WordTag, 'name')
+        ),
+        required=False,
+    )
+    translations = WordImportTranslationSerializer(many=True, required=False)
+    definitions = WordImportDefinitionSerializer(many=True, required=False)
+    examples = WordImportUsageExampleSerializer(many=True, required=False)
+
+    # field name - (max objects amount, amount exceeded detail)
+    amount_limits = {
+        'tags': (
+            AmountLimits.Vocabulary.MAX_TAGS_AMOUNT,
+            AmountLimits.Vocabulary.Details.TAGS_AMOUNT_EXCEEDED,
+        ),
+        'translations': (
+            AmountLimits.Vocabulary.MAX_TRANSLATIONS_AMOUNT,
+            AmountLimits.Vocabulary.Details.TRANSLATIONS_AMOUNT_EXCEEDED,
+        ),
+        'definitions': (
+            AmountLimits.Vocabulary.MAX_DEFINITIONS_AMOUNT,
+            AmountLimits.Vocabulary.Details.DEFINITIONS_AMOUNT_EXCEEDED,
+        ),
+        'examples': (
+            AmountLimits.Vocabulary.MAX_EXAMPLES_AMOUNT,
+            AmountLimits.Vocabulary.Details.EXAMPLES_AMOUNT_EXCEEDED,
+        ),
+    }
+
+    def validate(self, attrs: dict) -> dict:
+        """Checks word related objects amount limits."""
+        errors = {
+            field: [detail]
+            for field, (limit, detail) in self.amount_limits.items()
+            if len(attrs.get(field, ())) > limit
+        }
+        if errors:
+            raise serializers.ValidationError(errors)
+        return attrs
+
+
 class OtherWordsSerializerMixin:
     """
     Custom serializer mixin to add `get_other_words`, `get_other_self_related_words`
@@ -1627,7 +2128,9 @@ class SimilarForWordListSerializer(
         )
 
 
-class WordTranslationListSerializer(serializers.ModelSerializer):
+class WordTranslationListSerializer(
+    LastObjsSerializerMixin, serializers.ModelSerializer
+):
     """Serializer to list translations of all words in user vocabulary."""
 
     author = ReadableHiddenField(
@@ -1645,8 +2148,18 @@ class WordTranslationListSerializer(serializers.ModelSerializer):
     )
     last_4_words = serializers.SerializerMethodField('get_last_4_words')
 
+    last_objs = {
+        'last_words': {
+            'queryset': WordTranslations.objects.select_related('word__language'),
+            'parent_fields': 'translation',
+            'amount': 4,
+            'related_field': 'word',
+        },
+    }
+
     class Meta:
         model = WordTranslation
+        list_serializer_class = BulkFetchListSerializer
         fields = (
             'id',
             'slug',
@@ -1668,8 +2181,13 @@ class WordTranslationListSerializer(serializers.ModelSerializer):
         return words_count - 4 if words_count > 4 else 0
 
     @extend_schema_field({'type': 'string'})
-    def get_last_4_words(self, obj: WordTranslation) -> QuerySet[Word]:
+    def get_last_4_words(self, obj: WordTranslation) -> QuerySet[Word] | list[dict]:
         """Returns list of 4 last added words for the given translation."""
+        if hasattr(obj, 'last_words'):
+            return [
+                {'text': word.text, 'language__name': word.language.name}
+                for word in obj.last_words
+            ]
         return obj.words.order_by('-wordtranslations__created').values(
             'text', 'language__name'
         )[:4]
@@ -1742,7 +2260,7 @@ class WordTranslationCreateSerializer(
         }
 
 
-class DefinitionListSerializer(serializers.ModelSerializer):
+class DefinitionListSerializer(LastObjsSerializerMixin, serializers.ModelSerializer):
     """Serializer to list definitions of all words in user vocabulary."""
 
     author = ReadableHiddenField(
@@ -1760,8 +2278,18 @@ class DefinitionListSerializer(serializers.ModelSerializer):
     )
     last_4_words = serializers.SerializerMethodField('get_last_4_words')
 
+    last_objs = {
+        'last_words': {
+            'queryset': WordDefinitions.objects.select_related('word'),
+            'parent_fields': 'definition',
+            'amount': 4,
+            'related_field': 'word',
+        },
+    }
+
     class Meta:
         model = Definition
+        list_serializer_class = BulkFetchListSerializer
         fields = (
             'id',
             'slug',
@@ -1782,8 +2310,10 @@ class DefinitionListSerializer(serializers.ModelSerializer):
         return words_count - 4 if words_count > 4 else 0
 
     @extend_schema_field({'type': 'string'})
-    def get_last_4_words(self, obj: Definition) -> QuerySet[Word]:
+    def get_last_4_words(self, obj: Definition) -> QuerySet[Word] | list[str]:
         """Returns list of 4 last added words for the given definition."""
+        if hasattr(obj, 'last_words'):
+            return [word.text for word in obj.last_words]
         return obj.words.order_by('-worddefinitions__created').values_list(
             'text', flat=True
         )[:4]
@@ -1876,7 +2406,7 @@ class DefinitionCreateSerializer(
         return self.validate_language_is_learning(language)
 
 
-class UsageExampleListSerializer(serializers.ModelSerializer):
+class UsageExampleListSerializer(LastObjsSerializerMixin, serializers.ModelSerializer):
     """Serializer to list usage examples of all words in user vocabulary."""
 
     author = ReadableHiddenField(
@@ -1894,8 +2424,18 @@ class UsageExampleListSerializer(serializers.ModelSerializer):
     )
     last_4_words = serializers.SerializerMethodField('get_last_4_words')
 
+    last_objs = {
+        'last_words': {
+            'queryset': WordUsageExamples.objects.select_related('word'),
+            'parent_fields': 'example',
+            'amount': 4,
+            'related_field': 'word',
+        },
+    }
+
     class Meta:
         model = UsageExample
+        list_serializer_class = BulkFetchListSerializer
         fields = (
             'id',
             'slug',
@@ -1918,11 +2458,13 @@ class UsageExampleListSerializer(serializers.ModelSerializer):
         return words_count - 4 if words_count > 4 else 0
 
     @extend_schema_field({'type': 'string'})
-    def get_last_4_words(self, obj: UsageExample) -> QuerySet[Word]:
+    def get_last_4_words(self, obj: UsageExample) -> QuerySet[Word] | list[str]:
         """Returns list of 4 last added words for the given usage example."""
-        return obj.words.order_by('-wordusageexamples').values_list('text', flat=True)[
-            :4
-        ]
+        if hasattr(obj, 'last_words'):
+            return [word.text for word in obj.last_words]
+        return obj.words.order_by('-wordusageexamples__created').values_list(
+            'text', flat=True
+        )[:4]
 
 
 class UsageExampleSerializer(
@@ -2018,7 +2560,7 @@ class UsageExampleCreateSerializer(
         return self.validate_language_is_learning(language)
 
 
-class ImageListSerializer(HybridImageSerializerMixin):
+class ImageListSerializer(LastObjsSerializerMixin, HybridImageSerializerMixin):
     """Serializer to list image-associations of all words in user vocabulary."""
 
     author = ReadableHiddenField(
@@ -2031,8 +2573,18 @@ class ImageListSerializer(HybridImageSerializerMixin):
     )
     last_4_words = serializers.SerializerMethodField('get_last_4_words')
 
+    last_objs = {
+        'last_words': {
+            'queryset': WordImageAssociations.objects.select_related('word'),
+            'parent_fields': 'image',
+            'amount': 4,
+            'related_field': 'word',
+        },
+    }
+
     class Meta:
         model = ImageAssociation
+        list_serializer_class = BulkFetchListSerializer
         fields = (
             'id',
             'author',
@@ -2061,9 +2613,11 @@ class ImageListSerializer(HybridImageSerializerMixin):
         return words_count - 4 if words_count > 4 else 0
 
     @extend_schema_field({'type': 'string'})
-    def get_last_4_words(self, obj: ImageAssociation) -> QuerySet[Word]:
+    def get_last_4_words(self, obj: ImageAssociation) -> QuerySet[Word] | list[str]:
         """Returns list of 4 last added words for the given image-association."""
-        return obj.words.order_by('-wordimageassociations').values_list(
+        if hasattr(obj, 'last_words'):
+            return [word.text for word in obj.last_words]
+        return obj.words.order_by('-wordimageassociations__created').values_list(
             'text', flat=True
         )[:4]
 
@@ -2150,7 +2704,9 @@ class SimilarSerializer(SynonymSerializer):
 class TagListSerializer(TagSerializer, CountObjsSerializerMixin):
     """Serializer to list all user's tags."""
 
-    words_count = KwargsMethodField('get_objs_count', objs_related_name='words')
+    words_count = KwargsMethodField(
+        'get_objs_count', objs_related_name='words', annotation_name='words_count'
+    )
 
     class Meta:
         model = WordTag
@@ -2161,7 +2717,9 @@ class TagListSerializer(TagSerializer, CountObjsSerializerMixin):
 class TypeSerializer(CountObjsSerializerMixin, serializers.ModelSerializer):
     """Serializer to list all possible types of words and phrases."""
 
-    words_count = KwargsMethodField('get_objs_count', objs_related_name='words')
+    words_count = KwargsMethodField(
+        'get_objs_count', objs_related_name='words', annotation_name='words_count'
+    )
 
     class Meta:
         model = WordType
@@ -2264,18 +2822,14 @@ class CollectionSerializer(NestedSerializerMixin, CollectionShortSerializer):
         Returns languages list of all words in given collection sorted by
         words amount for each language.
         """
-        return (
-            obj.words.values(
-                'language__name', 'language__country', 'language__isocode'
-            ).annotate(words_count=Count('language'))
-        ).order_by('-words_count')
+        return get_collection_aggregates(obj)['words_languages']
 
     @extend_schema_field({'type': 'integer'})
     def get_words_images_count(self, obj: Collection) -> int:
         """
         Returns amount of image-associations for all words in given collection.
         """
-        return obj.words.filter(image_associations__isnull=False).count()
+        return len(get_collection_aggregates(obj)['words_images'])
 
     @extend_schema_field({'type': 'object'})
     def get_words_images(self, obj: Collection) -> QuerySet[Word]:
@@ -2287,14 +2841,10 @@ class CollectionSerializer(NestedSerializerMixin, CollectionShortSerializer):
         if request is None:
             raise AssertionError('No request was passed in context.')
 
-        return map(
-            lambda data: request.build_absolute_uri(data[0]) if data[0] else data[1],
-            obj.words.filter(image_associations__isnull=False)
-            .order_by('-created')
-            .values_list(
-                'image_associations__image', 'image_associations__image_url', flat=False
-            ),
-        )
+        return [
+            request.build_absolute_uri(image) if image else image_url
+            for image, image_url in get_collection_aggregates(obj)['words_images']
+        ]
 
 
 class UserDetailsSerializer(
@@ -2378,7 +2928,23 @@ class UserDetailsSerializer(
 
 
 class MainPageSerailizer(UserDetailsSerializer):
-    """Serializer to retrieve main page data."""
+    """
+    Serializer to retrieve main page data. Data is stored in user's sections
+    snapshots, only deleted (changed) sections are serialized again.
+    """
+
+    # main page section - section fields
+    snapshot_sections = {
+        'learning_languages': ('learning_languages_count', 'learning_languages'),
+        'collections': ('collections_count', 'last_10_collections'),
+        'tags': ('tags_count', 'last_10_tags'),
+        'images': ('images_count', 'last_10_images'),
+        'definitions': ('definitions_count', 'last_10_definitions'),
+        'examples': ('examples_count', 'last_10_examples'),
+        'translations': ('translations_count', 'last_10_translations'),
+        'words': ('words_count', 'last_10_words'),
+        'due_words': ('next_due_words',),
+    }
 
     collections_count = KwargsMethodField(
         'get_objs_count',
@@ -2410,6 +2976,7 @@ class MainPageSerailizer(UserDetailsSerializer):
         objs_related_name='wordtranslations',
     )
     last_10_translations = serializers.SerializerMethodField('get_last_10_translations')
+    next_due_words = serializers.SerializerMethodField('get_next_due_words')
 
     class Meta:
         model = User
@@ -2430,18 +2997,93 @@ class MainPageSerailizer(UserDetailsSerializer):
             'last_10_translations',
             'words_count',
             'last_10_words',
+            'next_due_words',
             # last_exercise_results
             # random_word_challenge
             # word_of_day
         )
         read_only_fields = fields
 
+    def get_snapshot_variant(self) -> str:
+        """
+        Returns language and host of current request, sections are serialized
+        separately for them (translated fields, absolute urls).
+        """
+        return f"{get_language()} {self.context['request'].build_absolute_uri('/')}"
+
+    def get_section_data(self, instance, section: str) -> dict:
+        """Serializes passed section fields."""
+        data = {}
+        for field_name in self.snapshot_sections[section]:
+            field = self.fields[field_name]
+            try:
+                attribute = field.get_attribute(instance)
+            except SkipField:
+                continue
+            check_for_none = (
+                attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+            )
+            data[field_name] = (
+                None if check_for_none is None else field.to_representation(attribute)
+            )
+        return data
+
+    def to_representation(self, instance) -> OrderedDict:
+        """
+        Returns main page data from user's sections snapshots, serializes and
+        stores missing sections.
+        """
+        variant = self.get_snapshot_variant()
+        snapshots = dict(
+            MainPageSnapshot.objects.filter(user=instance, variant=variant).values_list(
+                'section', 'data'
+            )
+        )
+        missing_sections = [
+            section for section in self.snapshot_sections if section not in snapshots
+        ]
+        for section in missing_sections:
+            snapshots[section] = self.get_section_data(instance, section)
+        if missing_sections:
+            MainPageSnapshot.objects.bulk_create(
+                [
+                    MainPageSnapshot(
+                        user=instance,
+                        variant=variant,
+                        section=section,
+                        data=snapshots[section],
+                    )
+                    for section in missing_sections
+                ],
+                ignore_conflicts=True,
+            )
+
+        data = {}
+        for section_data in snapshots.values():
+            data.update(section_data)
+        return OrderedDict(
+            (field_name, data[field_name])
+            for field_name in self.Meta.fields
+            if field_name in data
+        )
+
     def get_last_10_objs(
-        self, obj, objs_related_name: str, serializer_class: Serializer
+        self,
+        obj,
+        objs_related_name: str,
+        serializer_class: Serializer,
+        *lookups: str,
+        **annotations,
     ) -> ReturnDict:
-        """Common method to return list of 10 last added by user objects."""
+        """
+        Common method to return list of 10 last added by user objects, passed
+        lookups are prefetched and annotations are added to represent objects
+        without queries for every object.
+        """
         return serializer_class(
-            obj.__getattribute__(objs_related_name).all()[:10],
+            obj.__getattribute__(objs_related_name)
+            .annotate(**annotations)
+            .prefetch_related(*lookups)[:10],
             many=True,
             context={'request': self.context['request']},
         ).data
@@ -2449,67 +3091,77 @@ class MainPageSerailizer(UserDetailsSerializer):
     @extend_schema_field(CollectionShortSerializer(many=True))
     def get_last_10_collections(self, obj) -> ReturnDict:
         """Returns list of 10 last added user's collections."""
-        return self.get_last_10_objs(obj, 'collections', CollectionShortSerializer)
+        return self.get_last_10_objs(
+            obj,
+            'collections',
+            CollectionShortSerializer,
+            'author',
+            words_count=Count('words', distinct=True),
+        )
 
     @extend_schema_field(TagListSerializer(many=True))
     def get_last_10_tags(self, obj) -> ReturnDict:
         """Returns list of 10 last added user's tags."""
-        return self.get_last_10_objs(obj, 'wordtags', TagListSerializer)
+        return self.get_last_10_objs(
+            obj,
+            'wordtags',
+            TagListSerializer,
+            words_count=Count('words', distinct=True),
+        )
 
     @extend_schema_field(ImageListSerializer(many=True))
     def get_last_10_images(self, obj) -> ReturnDict:
         """Returns list of 10 last added user's words image-associations."""
-        return self.get_last_10_objs(obj, 'imageassociations', ImageListSerializer)
+        return self.get_last_10_objs(
+            obj, 'imageassociations', ImageListSerializer, 'author', 'words'
+        )
 
     @extend_schema_field(DefinitionListSerializer(many=True))
     def get_last_10_definitions(self, obj) -> ReturnDict:
         """Returns list of 10 last added user's words definitions."""
-        return self.get_last_10_objs(obj, 'definitions', DefinitionListSerializer)
+        return self.get_last_10_objs(
+            obj, 'definitions', DefinitionListSerializer, 'author', 'language', 'words'
+        )
 
     @extend_schema_field(UsageExampleListSerializer(many=True))
     def get_last_10_examples(self, obj) -> ReturnDict:
         """Returns list of 10 last added user's words usage examples."""
-        return self.get_last_10_objs(obj, 'usageexamples', UsageExampleListSerializer)
+        return self.get_last_10_objs(
+            obj,
+            'usageexamples',
+            UsageExampleListSerializer,
+            'author',
+            'language',
+            'words',
+        )
 
     @extend_schema_field(WordTranslationListSerializer(many=True))
     def get_last_10_translations(self, obj) -> ReturnDict:
         """Returns list of 10 last added user's words translations."""
         return self.get_last_10_objs(
-            obj, 'wordtranslations', WordTranslationListSerializer
-        )
-
-
-class AllAssociationsSerializer(serializers.ModelSerializer):
-    """Serializer to retrieve user associations of all types."""
-
-    associations_list = serializers.SerializerMethodField('get_user_associations')
-
-    class Meta:
-        model = User
-        fields = ('associations_list',)
-
-    @extend_schema_field(list)
-    def get_user_associations(self, obj) -> chain:
-        """Returns list of all user's words associations."""
-        images = ImageInLineSerializer(
-            obj.imageassociations.all(),
-            many=True,
-            context=self.context,
-        )
-
-        quotes = QuoteInLineSerializer(
-            obj.quoteassociations.all(),
-            many=True,
-            context=self.context,
-        )
-
-        result_list = sorted(
-            chain(quotes.data, images.data),
-            key=lambda d: d.get('created'),
-            reverse=True,
+            obj,
+            'wordtranslations',
+            WordTranslationListSerializer,
+            'author',
+            'language',
+            'words',
         )
 
-        return result_list
+    @extend_schema_field({'type': 'object'})
+    def get_next_due_words(self, obj) -> dict:
+        """
+        Returns lists of user's words to be exercised next for every learning
+        language, every list is read from due words index.
+        """
+        return {
+            language.isocode: DueWordSerializer(
+                Word.get_due_words(obj.pk, language.pk).select_related(
+                    'author', 'language'
+                )[:MAX_DUE_WORDS_AMOUNT],
+                many=True,
+            ).data
+            for language in obj.learning_languages.all()
+        }
 
 
 class WordTextImageSerializer(GetLastImageSerializerMixin):
@@ -2528,23 +3180,54 @@ class WordTextImageSerializer(GetLastImageSerializerMixin):
 class CollectionListSerializer(CollectionShortSerializer):
     """Serializer to retrieve collections list."""
 
+    def bulk_fetch(self, collections: list[Collection]) -> None:
+        """Fetches last words with their images for all listed collections."""
+        super().bulk_fetch(collections)
+        if 'last_4_words' not in self.fields:
+            return None
+        prefetch_related_objects(
+            list(chain.from_iterable(obj.last_words for obj in collections)),
+            'image_associations',
+        )
+
     @extend_schema_field(WordTextImageSerializer(many=True))
-    def get_last_4_words(self, obj: Collection) -> QuerySet[Word]:
-        """Returns list of 3 last added words in the given collection."""
+    def get_last_4_words(self, obj: Collection) -> ReturnDict:
+        """Returns list of 4 last added words in the given collection."""
+        if hasattr(obj, 'last_words'):
+            words = obj.last_words
+        else:
+            words = obj.words.order_by('-wordsincollections__created')[:4]
         return WordTextImageSerializer(
-            obj.words.order_by('-wordsincollections__created')[:4],
+            words,
             many=True,
             context={'request': self.context.get('request')},
         ).data
 
 
-class LearningLanguageWithLastWordsSerailizer(LearningLanguageSerializer):
+class LearningLanguageWithLastWordsSerailizer(
+    LastObjsSerializerMixin, LearningLanguageSerializer
+):
     """Serializer to list all user's learning languages with last 10 words."""
 
     last_10_words = serializers.SerializerMethodField('get_last_10_words')
 
+    expandable_fields = ('last_10_words',)
+    prefetch_related_fields = {
+        **LearningLanguageSerializer.prefetch_related_fields,
+        'last_words': ('last_10_words',),
+    }
+    last_objs = {
+        'last_words': {
+            'queryset': Word.objects.all(),
+            'parent_fields': ('author', 'language'),
+            'parent_key': attrgetter('user_id', 'language_id'),
+            'amount': 10,
+        },
+    }
+
     class Meta:
         model = UserLearningLanguage
+        list_serializer_class = BulkFetchListSerializer
         fields = (
             'id',
             'slug',
@@ -2575,9 +3258,31 @@ class LearningLanguageWithLastWordsSerailizer(LearningLanguageSerializer):
             'last_10_words',
         )
 
+    def bulk_fetch(self, learning_languages: list[UserLearningLanguage]) -> None:
+        """
+        Fetches last words for all listed learning languages, then represents
+        them with single cards serializer call.
+        """
+        super().bulk_fetch(learning_languages)
+        if 'last_10_words' not in self.fields:
+            return None
+        words_data = WordStandartCardSerializer(
+            list(chain.from_iterable(obj.last_words for obj in learning_languages)),
+            many=True,
+            context={'request': self.context['request']},
+        ).data
+        for obj in learning_languages:
+            obj.last_words_data, words_data = (
+                words_data[: len(obj.last_words)],
+                words_data[len(obj.last_words) :],
+            )
+        return None
+
     @extend_schema_field(WordStandartCardSerializer(many=True))
-    def get_last_10_words(self, obj: UserLearningLanguage) -> ReturnDict:
+    def get_last_10_words(self, obj: UserLearningLanguage) -> ReturnDict | list:
         """Return list of 10 last added words for each learning language."""
+        if hasattr(obj, 'last_words_data'):
+            return obj.last_words_data
         words = obj.user.words.filter(language=obj.language)[:10]
         return WordStandartCardSerializer(
             words, many=True, context={'request': self.context['request']}
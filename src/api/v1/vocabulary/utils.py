@@ -1,12 +1,20 @@
 """Vocabulary app utils."""
 
+import hashlib
 import logging
+from datetime import datetime
+from typing import Callable
 
 from django.http import HttpRequest
+from django.utils.translation import get_language
+from django.views.decorators.http import condition
 
 from rest_framework.serializers import Serializer
 
-from apps.vocabulary.models import DefaultWordCards
+from apps.users.preferences import get_user_preferences
+from apps.vocabulary.models import get_vocabulary_modified, get_vocabulary_version
+
+from ..core.mixins import VersionedResponseCacheMixin
 
 from .serializers import (
     WordStandartCardSerializer,
@@ -28,7 +36,7 @@ def get_word_cards_type(request: HttpRequest) -> Serializer:
     """Returns serializer class for words list."""
 
     # Return serializer class based on `cards_type` query parameter if passed
-    # or try to get user default word cards type setting from database
+    # or try to get user default word cards type setting from preferences cache
     # or return serializer class defined in types for `default_type`.
     type_param = request.query_params.get('cards_type', None)
     logger.debug(f'Word cards view query parameter passed: {type_param}')
@@ -38,16 +46,70 @@ def get_word_cards_type(request: HttpRequest) -> Serializer:
             type_param, WORD_CARD_TYPES.get(DEFAULT_WORD_CARD_TYPE)
         )
 
-    try:
-        user_default_type = DefaultWordCards.objects.get(user=request.user).cards_type
+    user_default_type = (
+        get_user_preferences(request.user)['cards_type']
+        if request.user.is_authenticated
+        else None
+    )
+    if user_default_type:
         logger.debug(
             f'Word cards type obtained from users default settings: '
             f'{user_default_type}'
         )
-    except Exception:
+    else:
         user_default_type = DEFAULT_WORD_CARD_TYPE
         logger.debug(
             f'Word cards type parameter is set to default: {DEFAULT_WORD_CARD_TYPE}'
         )
 
     return WORD_CARD_TYPES.get(user_default_type)
+
+
+def get_request_vocabulary_modified(request: HttpRequest) -> datetime | None:
+    """
+    Returns user's vocabulary last modification time to build conditional
+    requests validators (marker is read from cache once per request).
+    """
+    if not request.user.is_authenticated:
+        return None
+    if not hasattr(request, 'vocabulary_modified'):
+        request.vocabulary_modified = get_vocabulary_modified(request.user.pk)
+    return request.vocabulary_modified
+
+
+def get_vocabulary_etag(request: HttpRequest, *args, **kwargs) -> str | None:
+    """
+    Returns entity tag built from user's vocabulary modification time and
+    representation options (interface language, word cards type).
+    """
+    last_modified = get_request_vocabulary_modified(request)
+    if last_modified is None:
+        return None
+    validator = ':'.join(
+        (
+            str(request.user.pk),
+            last_modified.isoformat(),
+            get_language(),
+            get_word_cards_type(request).__name__,
+        )
+    )
+    return hashlib.md5(validator.encode()).hexdigest()
+
+
+# conditional GET for views represented data of user's vocabulary only,
+# validated by ETag: Last-Modified has one second resolution, so several writes
+# within one second would be answered with stale 304 to If-Modified-Since
+vocabulary_condition = condition(etag_func=get_vocabulary_etag)
+
+
+class VocabularyResponseCacheMixin(VersionedResponseCacheMixin):
+    """
+    Custom mixin to cache responses with user's vocabulary data until any
+    write to user's vocabulary and to answer conditional requests.
+    """
+
+    def get_cache_version(self, request: HttpRequest) -> str | None:
+        return get_vocabulary_version(request.user.pk)
+
+    def get_conditional_handler(self, handler: Callable) -> Callable:
+        return vocabulary_condition(handler)
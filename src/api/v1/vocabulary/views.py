@@ -1,8 +1,6 @@
 """Vocabulary app views."""
 
-import random
 import logging
-from itertools import chain
 
 from django.contrib.auth import get_user_model
 from django.db import transaction
@@ -21,15 +19,25 @@ from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
-from rest_framework.serializers import Serializer
-from rest_framework.exceptions import NotFound
+from rest_framework.serializers import Serializer, IntegerField
+from rest_framework.exceptions import (
+    NotFound,
+    ValidationError,
+    UnsupportedMediaType,
+)
 from rest_framework.reverse import reverse
 
-from utils.getters import get_admin_user
+from utils.getters import UnionQuerySet, get_admin_user, get_random_objs
 from apps.core.constants import (
     AmountLimits,
 )
-from apps.vocabulary.filters import CollectionFilter, WordFilter, WordCounters
+from apps.vocabulary.filters import (
+    CollectionFilter,
+    WordFilter,
+    WordCounters,
+    WordSearchFilter,
+)
+from apps.vocabulary.constants import MAX_RANDOM_WORDS_AMOUNT
 from apps.vocabulary.models import (
     Collection,
     FormGroup,
@@ -43,19 +51,28 @@ from apps.vocabulary.models import (
     QuoteAssociation,
     FavoriteCollection,
     FavoriteWord,
+    get_associations_feed,
+    get_collection_words_objs,
+    get_vocabulary_version,
 )
 
 from ..auth.permissions import IsAuthorOrReadOnly
-from ..core.pagination import LimitPagination
+from ..core.pagination import (
+    LimitPagination,
+    LimitCursorPagination,
+    LimitOrCursorPagination,
+)
 from ..core.mixins import (
     ActionsWithRelatedObjectsMixin,
     AmountLimitExceededHandler,
     ObjectAlreadyExistHandler,
     DestroyReturnListMixin,
     FavoriteMixin,
+    SparseFieldsetsMixin,
 )
 from ..core.exceptions import ObjectAlreadyExist
-from .utils import get_word_cards_type
+from .importers import WordsImporter, get_rows_reader
+from .utils import get_word_cards_type, VocabularyResponseCacheMixin
 from .serializers import (
     WordStandartCardSerializer,
     WordShortCreateSerializer,
@@ -95,7 +112,7 @@ from .serializers import (
     QuoteInLineSerializer,
     AssociationsCreateSerializer,
     MainPageSerailizer,
-    AllAssociationsSerializer,
+    AssociationFeedSerializer,
 )
 
 
@@ -108,7 +125,6 @@ words_list_prefetch_related = (
     'language',
     'tags',
     'types',
-    'translations',
     'image_associations',
     'form_groups',
 )
@@ -328,6 +344,8 @@ class ActionsWithRelatedWordsMixin(ActionsWithRelatedObjectsMixin):
     destroy=extend_schema(operation_id='word_destroy'),
 )
 class WordViewSet(
+    VocabularyResponseCacheMixin,
+    SparseFieldsetsMixin,
     ActionsWithRelatedObjectsMixin,
     AmountLimitExceededHandler,
     ObjectAlreadyExistHandler,
@@ -340,13 +358,17 @@ class WordViewSet(
     http_method_names = ('get', 'post', 'patch', 'delete', 'head')
     lookup_field = 'slug'
     queryset = Word.objects.none()
+    # random words, shared and favorite words of other users are not cached
+    non_cached_actions = ('random', 'share', 'favorites')
+    conditional_actions = ('list', 'retrieve')
     serializer_class = WordSerializer
     permission_classes = (IsAuthenticated,)
     permission_classes_by_action = {'share': [permissions.AllowAny]}
-    pagination_class = LimitPagination
+    pagination_class = LimitOrCursorPagination
+    # ordering goes first to be able to sort found words by relevance
     filter_backends = (
-        filters.SearchFilter,
         filters.OrderingFilter,
+        WordSearchFilter,
         DjangoFilterBackend,
     )
     filterset_class = WordFilter
@@ -356,15 +378,6 @@ class WordViewSet(
         'last_exercise_date',
         'created',
     ) + tuple(WordCounters.all.keys())
-    search_fields = (
-        'text',
-        'translations__text',
-        'tags__name',
-        'definitions__text',
-        'definitions__translation',
-        'examples__text',
-        'examples__translation',
-    )
 
     def get_queryset(self) -> QuerySet[Word]:
         """Returns all words from user vocabulary or favorites only."""
@@ -380,15 +393,19 @@ class WordViewSet(
                 case _:
                     # Annotate words with some related objects amount to use in
                     # filters, sorting
-                    return user.words.prefetch_related(
-                        *words_list_prefetch_related
-                    ).annotate(**WordCounters.all)
+                    queryset = user.words.annotate(**WordCounters.all)
+                    if self.detail:
+                        # represented word related objects are fetched by
+                        # serializer
+                        return queryset
+                    return self.prefetch_represented(
+                        queryset, *words_list_prefetch_related
+                    )
         else:
             match self.action:
                 case 'share':
-                    return Word.objects.all().prefetch_related(
-                        *words_list_prefetch_related
-                    )
+                    # represented word related objects are fetched by serializer
+                    return Word.objects.all()
                 case _:
                     return Word.objects.none()
 
@@ -417,12 +434,34 @@ class WordViewSet(
         serializer_class=WordStandartCardSerializer,
     )
     def random(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
-        """Return one random word from user's vocabulary."""
+        """
+        Return one random word from user's vocabulary or list of random words if
+        `count` query param is passed. Words filters are applied.
+        """
         queryset = self.filter_queryset(self.get_queryset())
-        word: Word | None = random.choice(queryset) if queryset else None
-        logger.debug(f'Random word from {request.user} user vocabulary: {word}')
+
+        count_param = request.query_params.get('count', None)
+        logger.debug(f'Random words amount query parameter passed: {count_param}')
+        if count_param is None:
+            words = get_random_objs(queryset)
+            word: Word | None = words[0] if words else None
+            logger.debug(f'Random word from {request.user} user vocabulary: {word}')
+            return Response(
+                self.get_serializer(word, many=False).data,
+                status=status.HTTP_200_OK,
+            )
+
+        try:
+            amount = IntegerField(
+                min_value=1, max_value=MAX_RANDOM_WORDS_AMOUNT
+            ).run_validation(count_param)
+        except ValidationError as exception:
+            raise ValidationError({'count': exception.detail})
+
+        words = get_random_objs(queryset, amount)
+        logger.debug(f'Random words from {request.user} user vocabulary: {words}')
         return Response(
-            self.get_serializer(word, many=False, context={'request': request}).data,
+            self.get_serializer(words, many=True).data,
             status=status.HTTP_200_OK,
         )
 
@@ -490,6 +529,27 @@ class WordViewSet(
             logger.error(f'ObjectDoesNotExist exception occured: {exception}')
             raise exception
 
+    @extend_schema(operation_id='word_import')
+    @action(
+        methods=('post',),
+        detail=False,
+        url_path='import',
+    )
+    def import_words(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        """
+        Imports words from streamed CSV or JSON lines body by chunks, returns
+        every row import result.
+        """
+        reader = get_rows_reader(request.content_type)
+        if reader is None:
+            raise UnsupportedMediaType(request.content_type)
+
+        report = WordsImporter(request.user).run(reader(request.stream or ()))
+        return Response(
+            report,
+            status=status.HTTP_201_CREATED if report['created'] else status.HTTP_200_OK,
+        )
+
     @extend_schema(operation_id='word_share')
     @action(
         methods=('get',),
@@ -581,12 +641,12 @@ class WordViewSet(
             if filterby_language
             else instance.translations.all()
         )
-        logger.debug(f'Obtained objects: {_objs}')
+        logger.debug('Obtained objects: %s', _objs)
 
         translations_languages = instance.translations.values_list(
             'language__name', flat=True
         )
-        logger.debug(f'Translations languages list: {translations_languages}')
+        logger.debug('Translations languages list: %s', translations_languages)
 
         return self.list_related_objs(
             request,
@@ -933,26 +993,14 @@ class WordViewSet(
         instance = self.get_object()
         logger.debug(f'Word instance: {instance}')
 
-        images = ImageInLineSerializer(
-            instance.image_associations.all(),
+        result_list = AssociationFeedSerializer(
+            get_associations_feed(
+                instance.image_associations.all(), instance.quote_associations.all()
+            ).order_by('-created', '-modified', '-id'),
             many=True,
             context={'request': request},
-        )
-        logger.debug(f'Word image-associations: {images.data}')
-
-        quotes = QuoteInLineSerializer(
-            instance.quote_associations.all(),
-            many=True,
-            context={'request': request},
-        )
-        logger.debug(f'Word quote-associations: {images.data}')
-
-        result_list = sorted(
-            chain(quotes.data, images.data),
-            key=lambda d: d.get('created'),
-            reverse=True,
-        )
-        logger.debug(f'Result list: {images.data}')
+        ).data
+        logger.debug(f'Result list: {result_list}')
 
         return Response(
             {
@@ -1108,6 +1156,7 @@ class WordViewSet(
     destroy=extend_schema(operation_id='translation_destroy'),
 )
 class WordTranslationViewSet(
+    VocabularyResponseCacheMixin,
     ActionsWithRelatedWordsMixin,
     ObjectAlreadyExistHandler,
     DestroyReturnListMixin,
@@ -1185,6 +1234,7 @@ class WordTranslationViewSet(
     destroy=extend_schema(operation_id='example_destroy'),
 )
 class UsageExampleViewSet(
+    VocabularyResponseCacheMixin,
     ActionsWithRelatedWordsMixin,
     ObjectAlreadyExistHandler,
     DestroyReturnListMixin,
@@ -1262,6 +1312,7 @@ class UsageExampleViewSet(
     destroy=extend_schema(operation_id='definition_destroy'),
 )
 class DefinitionViewSet(
+    VocabularyResponseCacheMixin,
     ActionsWithRelatedWordsMixin,
     ObjectAlreadyExistHandler,
     DestroyReturnListMixin,
@@ -1334,20 +1385,32 @@ class DefinitionViewSet(
 @extend_schema_view(
     list=extend_schema(operation_id='associations_list'),
 )
-class AssociationViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+class AssociationViewSet(
+    VocabularyResponseCacheMixin, mixins.ListModelMixin, viewsets.GenericViewSet
+):
     """Words associations CRUD."""
 
     http_method_names = ('get', 'head')
     queryset = ImageAssociation.objects.none()
-    serializer_class = AllAssociationsSerializer
+    serializer_class = AssociationFeedSerializer
     permission_classes = (IsAuthenticated,)
-    pagination_class = LimitPagination
+    pagination_class = LimitCursorPagination
+
+    def get_queryset(self) -> UnionQuerySet | QuerySet[ImageAssociation]:
+        """
+        Returns merged feed of all user's associations (ordered and paginated
+        in database).
+        """
+        user = self.request.user
+        if user.is_authenticated:
+            return get_associations_feed(
+                user.imageassociations.all(), user.quoteassociations.all()
+            )
+        return ImageAssociation.objects.none()
 
     def list(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
-        """Returns list of all user's associations of any type."""
-        serializer = self.get_serializer(request.user, many=False)
-        logger.debug(f'Serializer used for list user associations: {type(serializer)}')
-        return Response(serializer.data)
+        """Returns list of all user's associations of any type, latest first."""
+        return super().list(request, *args, **kwargs)
 
 
 @extend_schema(tags=['image_associations'])
@@ -1358,6 +1421,7 @@ class AssociationViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
     destroy=extend_schema(operation_id='image_destroy'),
 )
 class ImageViewSet(
+    VocabularyResponseCacheMixin,
     ActionsWithRelatedWordsMixin,
     DestroyReturnListMixin,
     mixins.ListModelMixin,
@@ -1426,6 +1490,7 @@ class ImageViewSet(
     destroy=extend_schema(operation_id='quote_destroy'),
 )
 class QuoteViewSet(
+    VocabularyResponseCacheMixin,
     ActionsWithRelatedWordsMixin,
     mixins.RetrieveModelMixin,
     mixins.UpdateModelMixin,
@@ -1485,6 +1550,7 @@ class QuoteViewSet(
     destroy=extend_schema(operation_id='synonym_destroy'),
 )
 class SynonymViewSet(
+    VocabularyResponseCacheMixin,
     ActionsWithRelatedWordsMixin,
     mixins.RetrieveModelMixin,
     mixins.UpdateModelMixin,
@@ -1563,6 +1629,7 @@ class SynonymViewSet(
     destroy=extend_schema(operation_id='antonym_destroy'),
 )
 class AntonymViewSet(
+    VocabularyResponseCacheMixin,
     ActionsWithRelatedWordsMixin,
     mixins.RetrieveModelMixin,
     mixins.UpdateModelMixin,
@@ -1641,6 +1708,7 @@ class AntonymViewSet(
     destroy=extend_schema(operation_id='similar_destroy'),
 )
 class SimilarViewSet(
+    VocabularyResponseCacheMixin,
     ActionsWithRelatedWordsMixin,
     mixins.RetrieveModelMixin,
     mixins.UpdateModelMixin,
@@ -1714,7 +1782,9 @@ class SimilarViewSet(
 
 @extend_schema(tags=['tags'])
 @extend_schema_view(list=extend_schema(operation_id='user_tags_list'))
-class TagViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+class TagViewSet(
+    VocabularyResponseCacheMixin, mixins.ListModelMixin, viewsets.GenericViewSet
+):
     """List all user's tags."""
 
     queryset = WordTag.objects.none()
@@ -1737,10 +1807,14 @@ class TagViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
 
 @extend_schema(tags=['types'])
 @extend_schema_view(list=extend_schema(operation_id='types_list'))
-class TypeViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+class TypeViewSet(
+    VocabularyResponseCacheMixin, mixins.ListModelMixin, viewsets.GenericViewSet
+):
     """List all possible types of words and phrases."""
 
     queryset = WordType.objects.all()
+    # words counts include other users words, so they are cached for short time
+    response_cache_timeout = 60 * 5
     serializer_class = TypeSerializer
     lookup_field = 'slug'
     http_method_names = ('get', 'head')
@@ -1759,7 +1833,9 @@ class TypeViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
 @extend_schema_view(
     list=extend_schema(operation_id='formsgroups_list'),
 )
-class FormGroupsViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+class FormGroupsViewSet(
+    VocabularyResponseCacheMixin, mixins.ListModelMixin, viewsets.GenericViewSet
+):
     """List all user's form groups."""
 
     queryset = FormGroup.objects.none()
@@ -1771,6 +1847,14 @@ class FormGroupsViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
     filter_backends = (filters.SearchFilter,)
     search_fields = ('name',)
 
+    def get_cache_version(self, request: HttpRequest) -> str | None:
+        """Returns user's vocabulary version combined with admin user's one."""
+        version = super().get_cache_version(request)
+        admin_user = get_admin_user()
+        if admin_user is None:
+            return version
+        return f'{version}.{get_vocabulary_version(admin_user.pk)}'
+
     def get_queryset(self) -> QuerySet[FormGroup]:
         """Returns all user's and admin user form groups."""
         user = self.request.user
@@ -1795,6 +1879,8 @@ class FormGroupsViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
     destroy=extend_schema(operation_id='collection_destroy'),
 )
 class CollectionViewSet(
+    VocabularyResponseCacheMixin,
+    SparseFieldsetsMixin,
     ActionsWithRelatedWordsMixin,
     ObjectAlreadyExistHandler,
     DestroyReturnListMixin,
@@ -1807,8 +1893,11 @@ class CollectionViewSet(
     serializer_class = CollectionSerializer
     lookup_field = 'slug'
     http_method_names = ('get', 'post', 'patch', 'delete', 'head')
+    # favorite collections of other users are not cached
+    non_cached_actions = ('favorites',)
+    conditional_actions = ('retrieve',)
     permission_classes = (IsAuthenticated, IsAuthorOrReadOnly)
-    pagination_class = LimitPagination
+    pagination_class = LimitOrCursorPagination
     filter_backends = (
         filters.SearchFilter,
         filters.OrderingFilter,
@@ -1832,8 +1921,8 @@ class CollectionViewSet(
                     )
                 case _:
                     # Annotate with words amount to use in filters, sorting
-                    return user.collections.prefetch_related(
-                        'author', 'words'
+                    return self.prefetch_represented(
+                        user.collections.all(), 'author', 'words'
                     ).annotate(words_count=Count('words', distinct=True))
         return Collection.objects.none()
 
@@ -1883,6 +1972,7 @@ class CollectionViewSet(
         objs_viewset: viewsets.GenericViewSet,
         objs_list_serializer: Serializer,
         *args,
+        prefetch_lookups: tuple[str, ...] = ('author', 'words'),
         **kwargs,
     ) -> HttpResponse:
         """
@@ -1896,13 +1986,10 @@ class CollectionViewSet(
 
         collection_data = self.get_serializer(collection).data
 
-        _objs = (
-            objs_model.objects.prefetch_related('author', 'words')
-            .filter(words__in=collection.words.all())
-            .distinct()
-            .annotate(words_count=Count('words'))
+        _objs = get_collection_words_objs(collection, objs_model).prefetch_related(
+            *prefetch_lookups
         )
-        logger.debug(f'Obtained objects: {_objs}')
+        logger.debug('Obtained objects: %s', _objs)
 
         objs_data = self.get_filtered_paginated_objs(
             request, _objs, objs_viewset, objs_list_serializer
@@ -1945,6 +2032,7 @@ class CollectionViewSet(
             WordTranslation,
             WordTranslationViewSet,
             WordTranslationListSerializer,
+            prefetch_lookups=('author', 'language', 'words'),
         )
 
     @extend_schema(operation_id='collection_definitions_list', methods=('get',))
@@ -1961,6 +2049,7 @@ class CollectionViewSet(
             Definition,
             DefinitionViewSet,
             DefinitionListSerializer,
+            prefetch_lookups=('author', 'language', 'words'),
         )
 
     @extend_schema(operation_id='collection_examples_list', methods=('get',))
@@ -1977,6 +2066,7 @@ class CollectionViewSet(
             UsageExample,
             UsageExampleViewSet,
             UsageExampleListSerializer,
+            prefetch_lookups=('author', 'language', 'words'),
         )
 
     @extend_schema(operation_id='collections_favorites_list', methods=('get',))
@@ -2053,7 +2143,9 @@ class CollectionViewSet(
 @extend_schema_view(
     list=extend_schema(operation_id='main_page_retrieve'),
 )
-class MainPageViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+class MainPageViewSet(
+    VocabularyResponseCacheMixin, mixins.ListModelMixin, viewsets.GenericViewSet
+):
     """Retrieve main page data."""
 
     http_method_names = ('get', 'head')
@@ -2062,6 +2154,7 @@ class MainPageViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
     serializer_class = MainPageSerailizer
     permission_classes = (IsAuthenticated,)
     pagination_class = None
+    conditional_actions = ('list',)
 
     def list(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
         serializer = self.get_serializer(request.user, many=False)
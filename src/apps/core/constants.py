@@ -109,6 +109,21 @@ class ExceptionDetails:
         """Exercises app exception details."""
 
         WORD_SET_ALREADY_EXIST = _('This word set already exists.')
+        SESSION_NOT_AVAILABLE = _('Sessions are not available for this exercise.')
+        APPROACH_WORDS_NOT_FOUND = _('Some answered words were not found.')
+        APPROACH_TRANSLATIONS_NOT_FOUND = _(
+            'Some answered translations were not found.'
+        )
+        APPROACH_HINTS_NOT_AVAILABLE = _(
+            'Some used hints are not available for this exercise.'
+        )
+
+    class Pagination:
+        """Pagination exception details."""
+
+        CURSOR_ORDERING_NOT_SUPPORTED = _(
+            'This ordering is not supported with cursor pagination.'
+        )
 
     class Vocabulary:
         """Vocabulary app exception details."""
@@ -172,6 +187,11 @@ class ExceptionDetails:
         )
         NOTE_ALREADY_EXIST = _('This note already exists for this word.')
 
+        INVALID_IMPORT_ROW = _('Invalid row, words must be passed one per line.')
+        IMPORT_ROW_CONFLICT = _(
+            'The word or its related objects conflict with existing ones.'
+        )
+
 
 class AmountLimits:
     """Class to store amount limit constants, detail messages."""
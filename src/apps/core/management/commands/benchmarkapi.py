@@ -0,0 +1,357 @@
+"""Custom command to benchmark hot API routes under concurrent load."""
+
+import json
+import time
+import threading
+import statistics
+import subprocess
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.core.servers.basehttp import ThreadedWSGIServer, WSGIRequestHandler
+from django.db import connection
+from django.db.models import Count
+
+from rest_framework.authtoken.models import Token
+
+from apps.core.models import ActivityStatusModel
+from apps.exercises.constants import exercises_lookups
+from apps.exercises.models import Exercise
+from apps.languages.models import Language
+
+User = get_user_model()
+
+QUERIES_COUNT_HEADER = 'X-Queries-Count'
+
+# route name: url, placeholders are replaced with benchmark user objects lookups
+ROUTES = {
+    'words-filtered': '/api/vocabulary/?activity_status={activity_status}'
+    '&language={language}',
+    'words-search': '/api/vocabulary/?search={search}',
+    'words-random': '/api/vocabulary/random/',
+    'collection-detail': '/api/collections/{collection}/',
+    'main-page': '/api/main/',
+    'learning-language-detail': '/api/languages/{language}/',
+    'exercise-available-words': '/api/exercises/{exercise}/available-words/',
+}
+
+
+class QueriesCounter:
+    """Database execute wrapper counting executed queries."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class QueriesCountingWSGIHandler(WSGIHandler):
+    """WSGI handler adding executed database queries amount response header."""
+
+    def __call__(self, environ, start_response):
+        counter = QueriesCounter()
+
+        def counting_start_response(status, headers, exc_info=None):
+            headers = [*headers, (QUERIES_COUNT_HEADER, str(counter.count))]
+            return start_response(status, headers, exc_info)
+
+        with connection.execute_wrapper(counter):
+            return super().__call__(environ, counting_start_response)
+
+
+class QuietWSGIRequestHandler(WSGIRequestHandler):
+    """Request handler not logging every request."""
+
+    def log_message(self, *args):
+        pass
+
+
+def percentile(values: list[float], percent: int) -> float:
+    """Returns passed percentile of values."""
+    if len(values) < 2:
+        return values[0] if values else 0
+    return statistics.quantiles(values, n=100, method='inclusive')[percent - 1]
+
+
+class Command(BaseCommand):
+    """
+    Command to benchmark hot API routes: runs the application server against
+    database seeded with synthetic vocabularies, requests routes concurrently and
+    reports throughput, latency percentiles and database queries per request.
+    """
+
+    help = (
+        'Seeds test database with synthetic vocabularies (see `generatevocabulary` '
+        'command), requests hot API routes concurrently and reports throughput, '
+        'p50/p95/p99 latency and database queries per request. Pass --output to '
+        'save results as JSON and --compare to compare them with saved results'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--requests', type=int, default=200, help='Requests amount per route'
+        )
+        parser.add_argument(
+            '--concurrency', type=int, default=8, help='Concurrent clients amount'
+        )
+        parser.add_argument(
+            '--warmup',
+            type=int,
+            default=10,
+            help='Requests amount per route sent before measuring',
+        )
+        parser.add_argument(
+            '--routes',
+            nargs='+',
+            choices=ROUTES,
+            default=list(ROUTES),
+            help='Routes to benchmark',
+        )
+        parser.add_argument(
+            '--users', type=int, default=20, help='Synthetic users amount to seed'
+        )
+        parser.add_argument(
+            '--words',
+            type=int,
+            default=2000,
+            help='Average synthetic words amount per user',
+        )
+        parser.add_argument('--seed', type=int, default=0, help='Seeding random seed')
+        parser.add_argument(
+            '--prefix',
+            default='benchmark',
+            help='Synthetic users usernames prefix',
+        )
+        parser.add_argument(
+            '--keepdb',
+            action='store_true',
+            default=False,
+            help='Pass to keep (and reuse) seeded test database',
+        )
+        parser.add_argument(
+            '--current-db',
+            action='store_true',
+            default=False,
+            help='Pass to benchmark configured database instead of test database',
+        )
+        parser.add_argument('--output', help='Path to save results JSON to')
+        parser.add_argument('--compare', help='Path to saved results JSON to compare')
+
+    def handle(self, *args, **options):
+        self.options = options
+        verbosity = options['verbosity']
+        if not options['current_db']:
+            old_database_name = connection.settings_dict['NAME']
+            connection.creation.create_test_db(
+                verbosity=verbosity, autoclobber=True, keepdb=options['keepdb']
+            )
+        try:
+            self.seed()
+            user = self.get_user()
+            results = self.run(user)
+        finally:
+            if not options['current_db']:
+                connection.creation.destroy_test_db(
+                    old_database_name, verbosity=verbosity, keepdb=options['keepdb']
+                )
+
+        self.report(results)
+        if options['compare']:
+            self.compare(results, options['compare'])
+        if options['output']:
+            with open(options['output'], 'w') as file:
+                json.dump(results, file, indent=2)
+            self.stdout.write(f"Results saved to {options['output']}")
+
+    def seed(self) -> None:
+        """Imports languages, exercises and seeds synthetic vocabularies once."""
+        if not Language.objects.filter(learning_available=True).exists():
+            call_command('importlanguages', only_popular=True)
+        if not Exercise.objects.exists():
+            call_command('importexercises')
+        prefix = self.options['prefix']
+        if User.objects.filter(username__startswith=f'{prefix}_').exists():
+            return
+        call_command(
+            'generatevocabulary',
+            users=self.options['users'],
+            words=self.options['words'],
+            seed=self.options['seed'],
+            prefix=prefix,
+        )
+
+    def get_user(self) -> User:
+        """Returns synthetic user with the largest vocabulary."""
+        user = (
+            User.objects.filter(username__startswith=f"{self.options['prefix']}_")
+            .annotate(words_count=Count('words'))
+            .order_by('-words_count', 'username')
+            .first()
+        )
+        if user is None:
+            raise CommandError('No synthetic users found to benchmark routes with')
+        return user
+
+    def get_lookups(self, user: User) -> dict[str, str]:
+        """Returns routes placeholders values for passed user."""
+        collection = (
+            user.collections.annotate(words_count=Count('words'))
+            .order_by('-words_count', 'slug')
+            .first()
+        )
+        language = (
+            user.words.values('language__isocode')
+            .annotate(words_count=Count('pk'))
+            .order_by('-words_count', 'language__isocode')
+            .first()
+        )
+        word = user.words.order_by('-created').first()
+        return {
+            'activity_status': ActivityStatusModel.ACTIVE,
+            'language': language['language__isocode'] if language else '',
+            'search': word.text[:3] if word else '',
+            'collection': collection.slug if collection else '',
+            'exercise': exercises_lookups.TRANSLATOR_EXERCISE_SLUG,
+        }
+
+    def run(self, user: User) -> dict:
+        """Runs server in background thread and benchmarks chosen routes."""
+        token, _ = Token.objects.get_or_create(user=user)
+        lookups = self.get_lookups(user)
+
+        server = ThreadedWSGIServer(('127.0.0.1', 0), QuietWSGIRequestHandler)
+        server.set_app(QueriesCountingWSGIHandler())
+        server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+        server_thread.start()
+
+        # urls include default language prefix to avoid locale redirects
+        base_url = f'http://127.0.0.1:{server.server_port}/{settings.LANGUAGE_CODE}'
+        sessions = threading.local()
+
+        def request(url: str) -> tuple[float, int, int]:
+            if not hasattr(sessions, 'session'):
+                sessions.session = requests.Session()
+                sessions.session.headers['Authorization'] = f'Token {token.key}'
+            started = time.perf_counter()
+            response = sessions.session.get(url)
+            elapsed = time.perf_counter() - started
+            queries = int(response.headers.get(QUERIES_COUNT_HEADER, 0))
+            return elapsed, response.status_code, queries
+
+        routes = {}
+        try:
+            with ThreadPoolExecutor(self.options['concurrency']) as executor:
+                for name in self.options['routes']:
+                    url = base_url + ROUTES[name].format(**lookups)
+                    list(executor.map(request, [url] * self.options['warmup']))
+                    started = time.perf_counter()
+                    responses = list(
+                        executor.map(request, [url] * self.options['requests'])
+                    )
+                    elapsed = time.perf_counter() - started
+                    routes[name] = self.summarize(url, responses, elapsed)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        return {
+            'commit': self.get_commit(),
+            'created': datetime.now(timezone.utc).isoformat(),
+            'options': {
+                option: self.options[option]
+                for option in (
+                    'requests',
+                    'concurrency',
+                    'warmup',
+                    'users',
+                    'words',
+                    'seed',
+                )
+            },
+            'user_words_count': user.words_count,
+            'routes': routes,
+        }
+
+    def summarize(
+        self, url: str, responses: list[tuple[float, int, int]], elapsed: float
+    ) -> dict:
+        """Returns route throughput, latency percentiles and queries amount."""
+        latencies = sorted(latency for latency, _, _ in responses)
+        queries = [queries for _, _, queries in responses]
+        return {
+            'url': url.split('/', 3)[-1],
+            'requests': len(responses),
+            'errors': sum(1 for _, status, _ in responses if status != 200),
+            'throughput': round(len(responses) / elapsed, 2) if elapsed else 0,
+            'latency': {
+                'mean': round(statistics.fmean(latencies), 4) if latencies else 0,
+                'p50': round(percentile(latencies, 50), 4),
+                'p95': round(percentile(latencies, 95), 4),
+                'p99': round(percentile(latencies, 99), 4),
+            },
+            'queries': round(statistics.fmean(queries), 2) if queries else 0,
+        }
+
+    @staticmethod
+    def get_commit() -> str:
+        """Returns current git commit hash if available."""
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', 'HEAD'],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return ''
+
+    def report(self, results: dict) -> None:
+        self.stdout.write(
+            f"Commit {results['commit'] or '-'}, user words amount: "
+            f"{results['user_words_count']}"
+        )
+        self.stdout.write(
+            f"{'route':<28}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}"
+            f"{'queries':>9}{'errors':>8}"
+        )
+        for name, route in results['routes'].items():
+            latency = route['latency']
+            self.stdout.write(
+                f"{name:<28}{route['throughput']:>9}{latency['p50']:>9}"
+                f"{latency['p95']:>9}{latency['p99']:>9}{route['queries']:>9}"
+                f"{route['errors']:>8}"
+            )
+
+    def compare(self, results: dict, path: str) -> None:
+        """Writes metrics changes relative to saved results."""
+        try:
+            with open(path) as file:
+                previous = json.load(file)
+        except (OSError, ValueError) as e:
+            raise CommandError(f'Could not read results to compare from {path}: {e}')
+
+        def change(new, old):
+            return f'{(new - old) / old:+.1%}' if old else '-'
+
+        self.stdout.write(f"Compared with commit {previous.get('commit') or '-'}")
+        for name, route in results['routes'].items():
+            old_route = previous.get('routes', {}).get(name)
+            if old_route is None:
+                continue
+            self.stdout.write(
+                f"{name:<28}"
+                f"rps {change(route['throughput'], old_route['throughput'])}, "
+                f"p50 {change(route['latency']['p50'], old_route['latency']['p50'])}, "
+                f"p95 {change(route['latency']['p95'], old_route['latency']['p95'])}, "
+                f"p99 {change(route['latency']['p99'], old_route['latency']['p99'])}, "
+                f"queries {change(route['queries'], old_route['queries'])}"
+            )
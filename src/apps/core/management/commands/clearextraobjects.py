@@ -0,0 +1,63 @@
+"""Custom command to delete words related objects which have no words."""
+
+from django.core.management.base import BaseCommand
+
+from apps.vocabulary.models import (
+    ImageAssociation,
+    delete_orphans,
+    get_orphans,
+    orphan_relations,
+)
+
+
+class Command(BaseCommand):
+    """
+    Command to delete translations, definitions, usage examples, tags, forms
+    groups, associations which no longer relate to any word.
+    """
+
+    help = (
+        'This command deletes words related objects (and image associations files) '
+        'which no longer relate to any word. Such objects are deleted after words '
+        'are deleted or objects are removed from words, the command collects ones '
+        'left (e.g. after bulk operations). Pass --dry-run to only count them'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Objects amount deleted with one query',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            default=False,
+            help='Pass to count objects without deleting them',
+        )
+
+    def handle(self, *args, **options):
+        if options['dry_run']:
+            return self.count()
+
+        report = delete_orphans(batch_size=options['batch_size'])
+        files = report.pop('files')
+        for name, amount in report.items():
+            self.stdout.write(f'Deleted {name}: {amount}')
+        self.stdout.write(
+            f'Deleted {sum(report.values())} objects, {files} image files'
+        )
+
+    def count(self):
+        total = 0
+        for model in orphan_relations:
+            orphans = get_orphans(model)
+            amount = orphans.count()
+            total += amount
+            if amount:
+                self.stdout.write(f'{model._meta.verbose_name_plural}: {amount}')
+            if model is ImageAssociation:
+                files = orphans.exclude(image='').exclude(image__isnull=True).count()
+                self.stdout.write(f'Image files: {files}')
+        self.stdout.write(f'{total} objects have no words')
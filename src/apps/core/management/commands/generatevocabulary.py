@@ -0,0 +1,444 @@
+"""Custom command to generate synthetic users vocabularies."""
+
+import uuid
+import random
+import argparse
+from datetime import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import models, transaction
+
+from tqdm import tqdm
+
+from apps.core.models import ActivityStatusModel
+from apps.exercises.models import Exercise, UsersExercisesHistory, WordsUpdateHistory
+from apps.languages.models import Language, UserLearningLanguage, UserNativeLanguage
+from apps.vocabulary.models import (
+    Word,
+    WordTag,
+    WordTranslation,
+    WordTranslations,
+    Definition,
+    WordDefinitions,
+    UsageExample,
+    WordUsageExamples,
+    ImageAssociation,
+    WordImageAssociations,
+    QuoteAssociation,
+    WordQuoteAssociations,
+    Collection,
+    WordsInCollections,
+    Synonym,
+    Antonym,
+    Form,
+    Similar,
+    WordCounter,
+    CollectionCounter,
+    WordSearchDocument,
+)
+from utils.fillers import slug_filler
+
+User = get_user_model()
+
+SYLLABLES = (
+    'ka', 'lo', 'mi', 'ne', 'su', 'ta', 'vo', 'ri', 'pa', 'de',
+    'zu', 'bo', 'fi', 'ge', 'hu', 'ja', 'ki', 'ly', 'mo', 'nu',
+)  # fmt: skip
+
+# models are inserted in this order, so related objects exist before relations
+INSERT_ORDER = (
+    UserLearningLanguage,
+    UserNativeLanguage,
+    Word,
+    WordTranslation,
+    Definition,
+    UsageExample,
+    ImageAssociation,
+    QuoteAssociation,
+    WordTag,
+    Collection,
+    WordTranslations,
+    WordDefinitions,
+    WordUsageExamples,
+    WordImageAssociations,
+    WordQuoteAssociations,
+    Word.tags.through,
+    WordsInCollections,
+    Synonym,
+    Antonym,
+    Form,
+    Similar,
+    UsersExercisesHistory,
+    WordsUpdateHistory,
+    WordCounter,
+    CollectionCounter,
+    WordSearchDocument,
+)
+
+
+def amount_range(value: str) -> tuple[int, int]:
+    """Parses `min-max` (or single `amount`) command argument."""
+    try:
+        bounds = tuple(int(bound) for bound in value.split('-'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'Invalid amount range: {value}')
+    if len(bounds) == 1:
+        bounds *= 2
+    if len(bounds) != 2 or bounds[0] < 0 or bounds[0] > bounds[1]:
+        raise argparse.ArgumentTypeError(f'Invalid amount range: {value}')
+    return bounds
+
+
+class Command(BaseCommand):
+    """
+    Command to bulk generate users with words and all words related objects
+    to benchmark and load test the app on production-sized data.
+    """
+
+    help = (
+        'This command generates users, each with words, translations, definitions, '
+        'usage examples, tags, collections, related words, associations and '
+        'exercises history. The same seed and options generate the same data'
+    )
+
+    batch_size = 5000
+    words_distributions = ('fixed', 'uniform', 'exponential')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--users', type=int, default=10, help='Users amount to generate'
+        )
+        parser.add_argument(
+            '--words', type=int, default=500, help='Average words amount per user'
+        )
+        parser.add_argument(
+            '--words-distribution',
+            choices=self.words_distributions,
+            default='exponential',
+            help='Distribution of words amount between users',
+        )
+        parser.add_argument('--seed', type=int, default=0, help='Random seed')
+        parser.add_argument(
+            '--prefix',
+            default='synthetic',
+            help='Generated users usernames prefix',
+        )
+        for argument, default, help_text in (
+            ('--learning-languages', '1-2', 'Learning languages per user'),
+            ('--translations', '1-4', 'Translations per word'),
+            ('--definitions', '0-2', 'Definitions per word'),
+            ('--examples', '0-2', 'Usage examples per word'),
+            ('--images', '0-1', 'Image associations per word'),
+            ('--quotes', '0-1', 'Quote associations per word'),
+            ('--tags', '5-30', 'Tags per user'),
+            ('--word-tags', '0-3', 'Tags per word'),
+            ('--collections', '2-20', 'Collections per user'),
+            ('--word-collections', '0-2', 'Collections per word'),
+            ('--related-words', '0-2', 'Synonyms, antonyms, forms, similars per word'),
+            ('--approaches', '0-30', 'Exercises approaches per user'),
+            ('--approach-words', '1-20', 'Words with updated status per approach'),
+        ):
+            parser.add_argument(
+                argument,
+                type=amount_range,
+                default=default,
+                help=f'{help_text} (`min-max` range, default {default})',
+            )
+
+    def handle(self, *args, **options):
+        self.options = options
+        self.random = random.Random(options['seed'])
+        # separate ids generator, so data with other prefix does not reuse ids
+        self.ids_random = random.Random(f"{options['seed']}-{options['prefix']}")
+        self.buffers = {model: [] for model in INSERT_ORDER}
+        self.buffered_amount = 0
+        self.inserted = {model: 0 for model in INSERT_ORDER}
+
+        languages = list(Language.objects.order_by('isocode'))
+        learning_languages = [
+            language for language in languages if language.learning_available
+        ]
+        if not learning_languages:
+            raise CommandError(
+                'No learning languages found, run `importlanguages` command first'
+            )
+        self.exercise = Exercise.objects.order_by('slug').first()
+
+        users = self.make_users()
+        for user in tqdm(users, desc='Users vocabularies'):
+            user_learning_languages = self.random.sample(
+                learning_languages,
+                min(self.amount('learning_languages'), len(learning_languages)) or 1,
+            )
+            native_language = self.random.choice(languages)
+            self.make_vocabulary(user, user_learning_languages, native_language)
+        self.flush()
+
+        for model, amount in self.inserted.items():
+            if amount:
+                self.stdout.write(f'{model._meta.verbose_name_plural}: {amount}')
+
+    def amount(self, option: str) -> int:
+        """Returns random amount from passed option range."""
+        return self.random.randint(*self.options[option])
+
+    def make_uuid(self) -> uuid.UUID:
+        """Returns uuid generated with command random generator (reproducible)."""
+        return uuid.UUID(int=self.ids_random.getrandbits(128), version=4)
+
+    def make_text(self, index: int, min_length: int = 2) -> str:
+        """Returns unique pseudo word for passed index."""
+        syllables = []
+        while index or len(syllables) < min_length:
+            index, syllable_index = divmod(index, len(SYLLABLES))
+            syllables.append(SYLLABLES[syllable_index])
+        return ''.join(syllables)
+
+    def make_sentence(self, index: int) -> str:
+        """Returns unique pseudo sentence for passed index."""
+        words = [
+            self.make_text(self.random.randrange(10000))
+            for _ in range(self.random.randint(3, 8))
+        ]
+        return ' '.join([self.make_text(index), *words]).capitalize()
+
+    def words_amount(self) -> int:
+        """Returns words amount for user according to chosen distribution."""
+        average = self.options['words']
+        match self.options['words_distribution']:
+            case 'uniform':
+                return self.random.randint(1, 2 * average - 1) if average else 0
+            case 'exponential':
+                return round(self.random.expovariate(1 / average)) if average else 0
+            case _:
+                return average
+
+    def add(self, obj: models.Model, slugify: bool = False) -> models.Model:
+        """Adds object to insert buffer, fills its slug if needed."""
+        if isinstance(obj._meta.pk, models.UUIDField):
+            obj.pk = self.make_uuid()
+        if slugify:
+            slug_filler(type(obj), obj)
+        self.buffers[type(obj)].append(obj)
+        self.buffered_amount += 1
+        return obj
+
+    def flush(self) -> None:
+        """
+        Inserts all buffered objects in models dependencies order, then recounts
+        inserted words counters and rebuilds their search documents (signals are
+        not sent on bulk inserts).
+        """
+        words_ids = [word.pk for word in self.buffers[Word]]
+        collections_ids = [collection.pk for collection in self.buffers[Collection]]
+        with transaction.atomic():
+            for model, objs in self.buffers.items():
+                if objs:
+                    model.objects.bulk_create(objs, batch_size=self.batch_size)
+                    self.inserted[model] += len(objs)
+                    objs.clear()
+            if words_ids:
+                WordCounter.refresh(words_ids)
+                WordSearchDocument.refresh(words_ids)
+            if collections_ids:
+                CollectionCounter.refresh(collections_ids)
+        self.buffered_amount = 0
+
+    def make_users(self) -> list[User]:
+        """Creates users to generate vocabularies for."""
+        prefix = self.options['prefix']
+        if User.objects.filter(username__startswith=f'{prefix}_').exists():
+            raise CommandError(
+                f'Users with `{prefix}_` username prefix already exist, pass '
+                'another --prefix'
+            )
+        users = [
+            User(
+                id=self.make_uuid(),
+                username=f'{prefix}_{index}',
+                email=f'{prefix}_{index}@example.com',
+                first_name=self.make_text(index).capitalize(),
+            )
+            for index in range(self.options['users'])
+        ]
+        for user in users:
+            user.set_unusable_password()
+        return User.objects.bulk_create(users, batch_size=self.batch_size)
+
+    def make_vocabulary(
+        self,
+        user: User,
+        learning_languages: list[Language],
+        native_language: Language,
+    ) -> None:
+        """Buffers user's words with all related objects."""
+        for language in learning_languages:
+            self.add(UserLearningLanguage(user=user, language=language), slugify=True)
+        self.add(UserNativeLanguage(user=user, language=native_language), slugify=True)
+
+        words = [
+            self.add(
+                Word(
+                    author=user,
+                    language=self.random.choice(learning_languages),
+                    text=self.make_text(index),
+                    activity_status=self.random.choice(ActivityStatusModel.ACTIVITY)[0],
+                    is_problematic=self.random.random() < 0.1,
+                ),
+                slugify=True,
+            )
+            for index in range(self.words_amount())
+        ]
+        tags = [
+            self.add(WordTag(author=user, name=f'tag{self.make_text(index)}'))
+            for index in range(self.amount('tags'))
+        ]
+        collections = [
+            self.add(
+                Collection(
+                    author=user,
+                    title=f'Collection {self.make_text(index)}',
+                    description=self.make_sentence(index),
+                ),
+                slugify=True,
+            )
+            for index in range(self.amount('collections'))
+        ]
+        for collection in collections:
+            self.add(CollectionCounter(collection=collection))
+
+        # related objects amounts by type to generate unique texts
+        counters = {}
+
+        def make_related(option, make_obj, make_relation):
+            for _ in range(self.amount(option)):
+                index = counters.get(option, 0)
+                counters[option] = index + 1
+                make_relation(make_obj(index))
+
+        for word in words:
+            make_related(
+                'translations',
+                lambda index: self.add(
+                    WordTranslation(
+                        author=user,
+                        language=native_language,
+                        text=f'tr{self.make_text(index)}',
+                    ),
+                    slugify=True,
+                ),
+                lambda obj: self.add(WordTranslations(word=word, translation=obj)),
+            )
+            make_related(
+                'definitions',
+                lambda index: self.add(
+                    Definition(
+                        author=user,
+                        language=word.language,
+                        text=self.make_sentence(index),
+                        translation=self.make_sentence(index),
+                    ),
+                    slugify=True,
+                ),
+                lambda obj: self.add(WordDefinitions(word=word, definition=obj)),
+            )
+            make_related(
+                'examples',
+                lambda index: self.add(
+                    UsageExample(
+                        author=user,
+                        language=word.language,
+                        text=self.make_sentence(index),
+                        translation=self.make_sentence(index),
+                    ),
+                    slugify=True,
+                ),
+                lambda obj: self.add(WordUsageExamples(word=word, example=obj)),
+            )
+            make_related(
+                'images',
+                lambda index: self.add(
+                    ImageAssociation(
+                        author=user,
+                        image_url=f'https://example.com/{self.make_uuid()}.jpg',
+                    )
+                ),
+                lambda obj: self.add(WordImageAssociations(word=word, image=obj)),
+            )
+            make_related(
+                'quotes',
+                lambda index: self.add(
+                    QuoteAssociation(
+                        author=user,
+                        text=self.make_sentence(index),
+                        quote_author=self.make_text(index).capitalize(),
+                    )
+                ),
+                lambda obj: self.add(WordQuoteAssociations(word=word, quote=obj)),
+            )
+            for tag in self.random.sample(
+                tags, min(self.amount('word_tags'), len(tags))
+            ):
+                self.add(Word.tags.through(word=word, wordtag=tag))
+            for collection in self.random.sample(
+                collections, min(self.amount('word_collections'), len(collections))
+            ):
+                self.add(WordsInCollections(word=word, collection=collection))
+            self.add(WordCounter(word=word))
+            self.add(WordSearchDocument(word=word))
+
+        self.make_related_words(words)
+        self.make_exercises_history(user, words)
+
+        if self.buffered_amount >= self.batch_size:
+            self.flush()
+        return None
+
+    def make_related_words(self, words: list[Word]) -> None:
+        """Buffers symmetrical synonyms, antonyms, forms, similars graphs."""
+        if len(words) < 2:
+            return None
+        for model in (Synonym, Antonym, Form, Similar):
+            pairs = set()
+            for word_index in range(len(words)):
+                for _ in range(self.amount('related_words')):
+                    other_index = self.random.randrange(len(words))
+                    if other_index != word_index:
+                        pairs.add(tuple(sorted((word_index, other_index))))
+            for first_index, second_index in sorted(pairs):
+                first_word, second_word = words[first_index], words[second_index]
+                self.add(model(from_word=first_word, to_word=second_word))
+                self.add(model(from_word=second_word, to_word=first_word))
+        return None
+
+    def make_exercises_history(self, user: User, words: list[Word]) -> None:
+        """Buffers exercises approaches with words activity status updates."""
+        if self.exercise is None or not words:
+            return None
+        statuses = [status for status, _ in ActivityStatusModel.ACTIVITY]
+        for _ in range(self.amount('approaches')):
+            approach_words = self.random.sample(
+                words, min(self.amount('approach_words'), len(words))
+            )
+            corrects_amount = self.random.randint(0, len(approach_words))
+            approach = self.add(
+                UsersExercisesHistory(
+                    user=user,
+                    exercise=self.exercise,
+                    words_amount=len(approach_words),
+                    corrects_amount=corrects_amount,
+                    incorrects_amount=len(approach_words) - corrects_amount,
+                    complete_time=time(minute=self.random.randint(0, 59)),
+                )
+            )
+            for word in approach_words:
+                self.add(
+                    WordsUpdateHistory(
+                        word=word,
+                        approach=approach,
+                        activity_status=word.activity_status,
+                        new_activity_status=self.random.choice(statuses),
+                    )
+                )
+        return None
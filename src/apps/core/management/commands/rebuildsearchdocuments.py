@@ -0,0 +1,29 @@
+"""Custom command to rebuild words search documents."""
+
+from django.core.management.base import BaseCommand
+
+from apps.vocabulary.models import Word, WordSearchDocument
+
+
+class Command(BaseCommand):
+    """Command to create missing and rebuild all words search documents."""
+
+    help = (
+        'This command creates missing words search documents and rebuilds all of '
+        'them from words and its translations, definitions, examples, tags texts'
+    )
+
+    batch_size = 1000
+
+    def handle(self, *args, **options):
+        missing_words_ids = Word.objects.filter(
+            search_document__isnull=True
+        ).values_list('pk', flat=True)
+        created = WordSearchDocument.objects.bulk_create(
+            (WordSearchDocument(word_id=pk) for pk in missing_words_ids.iterator()),
+            batch_size=self.batch_size,
+        )
+        self.stdout.write('Created %d missing search documents' % len(created))
+
+        updated = WordSearchDocument.refresh()
+        self.stdout.write('Rebuilt %d search documents' % updated)
@@ -0,0 +1,93 @@
+"""Custom command to rebuild, verify words related objects counters."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.vocabulary.models import Collection, CollectionCounter, Word, WordCounter
+
+
+class Command(BaseCommand):
+    """Command to rebuild or verify denormalized words related objects counters."""
+
+    help = (
+        'This command creates missing words related objects counters and recounts '
+        'all of them, then recounts collections words counters. Pass --verify to '
+        'only compare stored words counters with actual related objects amounts'
+    )
+
+    batch_size = 1000
+    max_mismatches_shown = 20
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            default=False,
+            help='Pass to check counters without changing them',
+        )
+
+    def handle(self, *args, **options):
+        if options['verify']:
+            return self.verify()
+
+        missing_words_ids = Word.objects.filter(counters__isnull=True).values_list(
+            'pk', flat=True
+        )
+        created = WordCounter.objects.bulk_create(
+            (WordCounter(word_id=pk) for pk in missing_words_ids.iterator()),
+            batch_size=self.batch_size,
+        )
+        self.stdout.write('Created %d missing counters' % len(created))
+
+        updated = WordCounter.refresh()
+        self.stdout.write('Recounted %d words counters' % updated)
+
+        missing_collections_ids = Collection.objects.filter(
+            counters__isnull=True
+        ).values_list('pk', flat=True)
+        created = CollectionCounter.objects.bulk_create(
+            (
+                CollectionCounter(collection_id=pk)
+                for pk in missing_collections_ids.iterator()
+            ),
+            batch_size=self.batch_size,
+        )
+        self.stdout.write('Created %d missing collections counters' % len(created))
+
+        updated = CollectionCounter.refresh()
+        self.stdout.write('Recounted %d collections counters' % updated)
+
+    def verify(self):
+        fields = tuple(WordCounter.counted_relations)
+        stored = {
+            counter['word']: counter
+            for counter in WordCounter.objects.values('word', *fields).iterator()
+        }
+        actual = (
+            Word.objects.order_by()
+            .annotate(**WordCounter.get_counted_values(word_ref='pk'))
+            .values('pk', *fields)
+        )
+
+        mismatches = 0
+        for word_counters in actual.iterator(chunk_size=self.batch_size):
+            word_id = word_counters.pop('pk')
+            stored_counters = stored.get(word_id)
+            if stored_counters is None:
+                differences = 'counters do not exist'
+            else:
+                differences = ', '.join(
+                    f'{field}: {stored_counters[field]} != {amount}'
+                    for field, amount in word_counters.items()
+                    if stored_counters[field] != amount
+                )
+            if differences:
+                mismatches += 1
+                if mismatches <= self.max_mismatches_shown:
+                    self.stdout.write(f'Word {word_id}: {differences}')
+
+        if mismatches:
+            raise CommandError(
+                f'{mismatches} words counters are out of date, run the command '
+                'without --verify to rebuild them'
+            )
+        self.stdout.write(f'All {len(stored)} words counters are up to date')
@@ -1,9 +1,10 @@
 """Core abstract models, model mixins."""
 
 from collections import OrderedDict
-from typing import Type
+from typing import Iterable, Type
 
 from django.db import models
+from django.db.models import Q
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ObjectDoesNotExist
@@ -71,17 +72,29 @@ class GetObjectBySlugModelMixin:
                 )
         return cls.slugify_func(*_slugify_data)
 
+    @classmethod
+    def get_object_key(
+        cls, data: OrderedDict, instance: Type[models.Model] = None
+    ) -> str:
+        """Returns slug to get object by."""
+        return cls.get_slug_from_data(**data, instance=instance)
+
     @classmethod
     def get_object(
         cls, data: OrderedDict, instance: Type[models.Model] = None
     ) -> Type[models.Model] | None:
         """Returns object gotten by slug or None if ObjectDoesNotExist is raised."""
-        slug = cls.get_slug_from_data(**data, instance=instance)
+        slug = cls.get_object_key(data, instance)
         try:
             return cls.objects.get(slug=slug)
         except ObjectDoesNotExist:
             return None
 
+    @classmethod
+    def get_objects(cls, keys: Iterable[str]) -> dict[str, Type[models.Model]]:
+        """Returns objects gotten by passed slugs with one query by slugs."""
+        return cls.objects.in_bulk(set(keys), field_name='slug')
+
 
 class GetObjectModelMixin:
     """
@@ -101,6 +114,43 @@ class GetObjectModelMixin:
             cls, 'get_object_by_fields'
         ), 'Set `get_object_by_fields` class attributes to use GetObjectModelMixin.'
 
+    @classmethod
+    def get_object_key(
+        cls, data: OrderedDict, instance: Type[models.Model] = None
+    ) -> tuple | None:
+        """
+        Returns required fields values (related objects ids for foreign keys) to
+        get object by or None if some of fields are not passed.
+        """
+        cls.check_class_attrs()
+        key = []
+        for field in cls.get_object_by_fields:
+            try:
+                value = data[field]
+            except KeyError:
+                return None
+            key.append(value.pk if isinstance(value, models.Model) else value)
+        return tuple(key)
+
+    @classmethod
+    def get_objects(
+        cls, keys: Iterable[tuple | None]
+    ) -> dict[tuple, Type[models.Model]]:
+        """Returns objects gotten by passed required fields values with one query."""
+        keys = {key for key in keys if key is not None}
+        if not keys:
+            return {}
+        attnames = [
+            cls._meta.get_field(field).attname for field in cls.get_object_by_fields
+        ]
+        lookup = Q()
+        for key in keys:
+            lookup |= Q(**dict(zip(attnames, key)))
+        return {
+            tuple(getattr(obj, attname) for attname in attnames): obj
+            for obj in cls.objects.filter(lookup)
+        }
+
     @classmethod
     def get_object(cls, data: OrderedDict) -> Type[models.Model] | None:
         """
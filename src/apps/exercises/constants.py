@@ -7,8 +7,20 @@ exercises_lookups = types.SimpleNamespace()
 exercises_lookups.TRANSLATOR_EXERCISE_SLUG = 'translator'
 exercises_lookups.ASSOCIATE_EXERCISE_SLUG = 'associate'
 
+hints_codes = types.SimpleNamespace()
+hints_codes.SHOW_ASSOCIATION = 'show_association'
+hints_codes.SHOW_FIRST_LETTER = 'show_first_letter'
+hints_codes.SHOW_LETTERS_AMOUNT = 'show_letters_amount'
+hints_codes.SHOW_SYNONYM = 'show_synonym'
+hints_codes.REMOVE_INCORRECT = 'remove_incorrect'
+
 MAX_TEXT_ANSWER_LENGTH = 1024
 
+# `Translator` exercise session words amount if not passed, options amount
+# (including correct one) suggested in variants mode
+TRANSLATOR_SESSION_WORDS_AMOUNT = 10
+TRANSLATOR_OPTIONS_AMOUNT = 4
+
 
 class ExercisesLengthLimits:
     """Length limits constants."""
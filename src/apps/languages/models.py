@@ -4,6 +4,7 @@ import uuid
 import logging
 
 from django.db import models
+from django.db.models import Count, F, Q
 from django.utils.translation import gettext as _
 from django.db.models.signals import pre_save
 from django.dispatch import receiver
@@ -16,6 +17,7 @@ from apps.core.models import (
     GetObjectModelMixin,
     WordsCountMixin,
     AuthorModel,
+    ActivityStatusModel,
 )
 from config.settings import AUTH_USER_MODEL
 from utils.fillers import slug_filler
@@ -255,6 +257,32 @@ class UserLearningLanguage(
     def __str__(self) -> str:
         return f'{self.user} studies {self.language}'
 
+    @classmethod
+    def get_words_counters(cls) -> dict[str, Count]:
+        """
+        Returns annotations to count user's words in learning language: all words
+        and words of every activity status (counted within single grouped query).
+        """
+        language_words = Q(user__words__language=F('language'))
+        return {
+            'words_count': Count('user__words', filter=language_words),
+            'inactive_words_count': Count(
+                'user__words',
+                filter=language_words
+                & Q(user__words__activity_status=ActivityStatusModel.INACTIVE),
+            ),
+            'active_words_count': Count(
+                'user__words',
+                filter=language_words
+                & Q(user__words__activity_status=ActivityStatusModel.ACTIVE),
+            ),
+            'mastered_words_count': Count(
+                'user__words',
+                filter=language_words
+                & Q(user__words__activity_status=ActivityStatusModel.MASTERED),
+            ),
+        }
+
 
 class UserNativeLanguage(SlugModel, CreatedModel):
     """Users native languages."""
@@ -8,3 +8,7 @@ class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.users'
     verbose_name = _('Users')
+
+    def ready(self):
+        # connect users preferences cache signals receivers
+        from . import preferences  # noqa: F401
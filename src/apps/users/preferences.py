@@ -0,0 +1,122 @@
+"""
+Users preferences cache: word cards type and translator exercise default
+settings are read on many requests, so they are stored in cache shared between
+application workers instead of querying database every time.
+"""
+
+import logging
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.signals import user_logged_in
+from django.core.cache import cache
+from django.db.models import Model
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.core.constants import ADMIN_USERNAME
+from apps.exercises.models import TranslatorUserDefaultSettings
+from apps.vocabulary.models import DefaultWordCards
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+PREFERENCES_CACHE_KEY = 'users-preferences-{user_id}'
+# translator settings of admin user are used by default
+DEFAULT_TRANSLATOR_SETTINGS_CACHE_KEY = 'users-preferences-default-translator'
+PREFERENCES_CACHE_TIMEOUT = 60 * 60 * 24
+
+# translator settings fields stored in cache
+TRANSLATOR_SETTINGS_FIELDS = (
+    'mode',
+    'answer_time_limit',
+    'repetitions_amount',
+    'from_language',
+)
+
+
+def get_translator_settings_values(user_id) -> dict | None:
+    """Returns user's translator settings fields values or None if not set."""
+    return (
+        TranslatorUserDefaultSettings.objects.filter(user_id=user_id)
+        .values(*TRANSLATOR_SETTINGS_FIELDS)
+        .first()
+    )
+
+
+def fetch_user_preferences(user: User) -> dict:
+    """Returns user's preferences fetched from database."""
+    return {
+        'cards_type': DefaultWordCards.objects.filter(user=user)
+        .values_list('cards_type', flat=True)
+        .first(),
+        'translator_settings': get_translator_settings_values(user.pk),
+    }
+
+
+def get_user_preferences(user: User) -> dict:
+    """Returns cached user's preferences, caches them if not cached yet."""
+    key = PREFERENCES_CACHE_KEY.format(user_id=user.pk)
+    preferences = cache.get(key)
+    if preferences is None:
+        preferences = warm_user_preferences(user)
+    return preferences
+
+
+def warm_user_preferences(user: User) -> dict:
+    """Fetches and caches user's preferences."""
+    preferences = fetch_user_preferences(user)
+    cache.set(
+        PREFERENCES_CACHE_KEY.format(user_id=user.pk),
+        preferences,
+        PREFERENCES_CACHE_TIMEOUT,
+    )
+    logger.debug(f'User {user} preferences cached: {preferences}')
+    return preferences
+
+
+def get_translator_settings(user: User) -> TranslatorUserDefaultSettings | None:
+    """
+    Returns user's translator settings (not saved object built from cached
+    values) or admin user (default) settings if user has no settings. Settings
+    object is bound to passed user in both cases.
+    """
+    values = get_user_preferences(user)['translator_settings']
+    if values is None:
+        values = cache.get(DEFAULT_TRANSLATOR_SETTINGS_CACHE_KEY)
+        if values is None:
+            admin_user = User.objects.filter(username=ADMIN_USERNAME).first()
+            values = get_translator_settings_values(admin_user.pk) if admin_user else {}
+            cache.set(
+                DEFAULT_TRANSLATOR_SETTINGS_CACHE_KEY,
+                values,
+                PREFERENCES_CACHE_TIMEOUT,
+            )
+        logger.debug(f'Default translator settings used for user {user}')
+    return TranslatorUserDefaultSettings(user=user, **values) if values else None
+
+
+def invalidate_user_preferences(user_id) -> None:
+    """Deletes cached user's preferences."""
+    cache.delete(PREFERENCES_CACHE_KEY.format(user_id=user_id))
+    logger.debug(f'User {user_id} preferences cache deleted')
+
+
+@receiver(user_logged_in)
+def warm_preferences_on_login(sender, user: User, *args, **kwargs) -> None:
+    """Cache user's preferences on login."""
+    warm_user_preferences(user)
+
+
+@receiver([post_save, post_delete], sender=DefaultWordCards)
+@receiver([post_save, post_delete], sender=TranslatorUserDefaultSettings)
+def invalidate_preferences_on_settings_change(
+    sender, instance: Model, *args, **kwargs
+) -> None:
+    """
+    Delete cached user's preferences when settings are changed. Default
+    translator settings are deleted too, as changed settings may be admin's.
+    """
+    invalidate_user_preferences(instance.user_id)
+    if sender is TranslatorUserDefaultSettings:
+        cache.delete(DEFAULT_TRANSLATOR_SETTINGS_CACHE_KEY)
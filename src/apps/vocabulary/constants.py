@@ -1,5 +1,16 @@
 """Vocabulary app constants."""
 
+MAX_RANDOM_WORDS_AMOUNT = 50
+MAX_DUE_WORDS_AMOUNT = 10
+
+# words exercises spaced repetition (SM-2) scheduling: intervals in days after
+# first and second successful repetitions, default and minimal ease factors,
+# interval at which word exercise progress is considered complete
+EXERCISE_FIRST_INTERVALS = (1, 6)
+EXERCISE_DEFAULT_EASE = 2.5
+EXERCISE_MIN_EASE = 1.3
+EXERCISE_COMPLETE_INTERVAL = 21
+
 
 class VocabularyLengthLimits:
     """Length limits constants."""
@@ -1,8 +1,19 @@
 """Vocabulary app filters."""
 
 import django_filters as df
-from django.db.models import Q, Count
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity,
+)
+from django.db import connections
+from django.db.models import Case, FloatField, Q, Value, When
+from django.db.models.functions import Coalesce
 from django.db.models.query import QuerySet
+from django.http import HttpRequest
+from rest_framework.filters import SearchFilter
+from rest_framework.settings import api_settings
 
 from .models import Collection, Word
 
@@ -65,71 +76,131 @@ class WordFilter(df.FilterSet):
 
     # amount filters
     translations_count = df.NumberFilter(
-        field_name='translations_count',
+        field_name='counters__translations_count',
         lookup_expr='exact',
     )
     translations_count__gt = df.NumberFilter(
-        field_name='translations_count',
+        field_name='counters__translations_count',
         lookup_expr='gt',
     )
     translations_count__lt = df.NumberFilter(
-        field_name='translations_count',
+        field_name='counters__translations_count',
         lookup_expr='lt',
     )
 
-    examples_count = df.NumberFilter(field_name='examples_count', lookup_expr='exact')
-    examples_count__gt = df.NumberFilter(field_name='examples_count', lookup_expr='gt')
-    examples_count__lt = df.NumberFilter(field_name='examples_count', lookup_expr='lt')
+    examples_count = df.NumberFilter(
+        field_name='counters__examples_count',
+        lookup_expr='exact',
+    )
+    examples_count__gt = df.NumberFilter(
+        field_name='counters__examples_count',
+        lookup_expr='gt',
+    )
+    examples_count__lt = df.NumberFilter(
+        field_name='counters__examples_count',
+        lookup_expr='lt',
+    )
 
     definitions_count = df.NumberFilter(
-        field_name='definitions_count',
+        field_name='counters__definitions_count',
         lookup_expr='exact',
     )
     definitions_count__gt = df.NumberFilter(
-        field_name='definitions_count',
+        field_name='counters__definitions_count',
         lookup_expr='gt',
     )
     definitions_count__lt = df.NumberFilter(
-        field_name='definitions_count',
+        field_name='counters__definitions_count',
         lookup_expr='lt',
     )
 
     image_associations_count = df.NumberFilter(
-        field_name='image_associations_count',
+        field_name='counters__image_associations_count',
         lookup_expr='exact',
     )
     image_associations_count__gt = df.NumberFilter(
-        field_name='image_associations_count',
+        field_name='counters__image_associations_count',
         lookup_expr='gt',
     )
     image_associations_count__lt = df.NumberFilter(
-        field_name='image_associations_count',
+        field_name='counters__image_associations_count',
         lookup_expr='lt',
     )
 
-    synonyms_count = df.NumberFilter(field_name='synonyms_count', lookup_expr='exact')
-    synonyms_count__gt = df.NumberFilter(field_name='synonyms_count', lookup_expr='gt')
-    synonyms_count__lt = df.NumberFilter(field_name='synonyms_count', lookup_expr='lt')
+    synonyms_count = df.NumberFilter(
+        field_name='counters__synonyms_count',
+        lookup_expr='exact',
+    )
+    synonyms_count__gt = df.NumberFilter(
+        field_name='counters__synonyms_count',
+        lookup_expr='gt',
+    )
+    synonyms_count__lt = df.NumberFilter(
+        field_name='counters__synonyms_count',
+        lookup_expr='lt',
+    )
 
-    antonyms_count = df.NumberFilter(field_name='antonyms_count', lookup_expr='exact')
-    antonyms_count__gt = df.NumberFilter(field_name='antonyms_count', lookup_expr='gt')
-    antonyms_count__lt = df.NumberFilter(field_name='antonyms_count', lookup_expr='lt')
+    antonyms_count = df.NumberFilter(
+        field_name='counters__antonyms_count',
+        lookup_expr='exact',
+    )
+    antonyms_count__gt = df.NumberFilter(
+        field_name='counters__antonyms_count',
+        lookup_expr='gt',
+    )
+    antonyms_count__lt = df.NumberFilter(
+        field_name='counters__antonyms_count',
+        lookup_expr='lt',
+    )
 
-    forms_count = df.NumberFilter(field_name='forms_count', lookup_expr='exact')
-    forms_count__gt = df.NumberFilter(field_name='forms_count', lookup_expr='gt')
-    forms_count__lt = df.NumberFilter(field_name='forms_count', lookup_expr='lt')
+    forms_count = df.NumberFilter(
+        field_name='counters__forms_count',
+        lookup_expr='exact',
+    )
+    forms_count__gt = df.NumberFilter(
+        field_name='counters__forms_count',
+        lookup_expr='gt',
+    )
+    forms_count__lt = df.NumberFilter(
+        field_name='counters__forms_count',
+        lookup_expr='lt',
+    )
 
-    similars_count = df.NumberFilter(field_name='similars_count', lookup_expr='exact')
-    similars_count__gt = df.NumberFilter(field_name='similars_count', lookup_expr='gt')
-    similars_count__lt = df.NumberFilter(field_name='similars_count', lookup_expr='lt')
+    similars_count = df.NumberFilter(
+        field_name='counters__similars_count',
+        lookup_expr='exact',
+    )
+    similars_count__gt = df.NumberFilter(
+        field_name='counters__similars_count',
+        lookup_expr='gt',
+    )
+    similars_count__lt = df.NumberFilter(
+        field_name='counters__similars_count',
+        lookup_expr='lt',
+    )
 
-    tags_count = df.NumberFilter(field_name='tags_count', lookup_expr='exact')
-    tags_count__gt = df.NumberFilter(field_name='tags_count', lookup_expr='gt')
-    tags_count__lt = df.NumberFilter(field_name='tags_count', lookup_expr='lt')
+    tags_count = df.NumberFilter(field_name='counters__tags_count', lookup_expr='exact')
+    tags_count__gt = df.NumberFilter(
+        field_name='counters__tags_count',
+        lookup_expr='gt',
+    )
+    tags_count__lt = df.NumberFilter(
+        field_name='counters__tags_count',
+        lookup_expr='lt',
+    )
 
-    types_count = df.NumberFilter(field_name='types_count', lookup_expr='exact')
-    types_count__gt = df.NumberFilter(field_name='types_count', lookup_expr='gt')
-    types_count__lt = df.NumberFilter(field_name='types_count', lookup_expr='lt')
+    types_count = df.NumberFilter(
+        field_name='counters__types_count',
+        lookup_expr='exact',
+    )
+    types_count__gt = df.NumberFilter(
+        field_name='counters__types_count',
+        lookup_expr='gt',
+    )
+    types_count__lt = df.NumberFilter(
+        field_name='counters__types_count',
+        lookup_expr='lt',
+    )
 
     class Meta:
         model = Word
@@ -176,19 +247,70 @@ class WordFilter(df.FilterSet):
             )
 
 
+class WordSearchFilter(SearchFilter):
+    """
+    Searching words by search document with word text and its translations,
+    definitions, usage examples, tags texts (trigram index is used on PostgreSQL).
+    Found words are sorted by relevance if ordering query param is not passed.
+    """
+
+    document_field = 'search_document__document'
+
+    def get_search_rank(self, queryset: QuerySet, search_text: str) -> Case:
+        """
+        Returns words relevance expression: exact and prefix matches of word text
+        go first, full-text rank and trigram similarity of search document are
+        added on PostgreSQL.
+        """
+        rank = Case(
+            When(text__iexact=search_text, then=Value(2.0)),
+            When(text__istartswith=search_text, then=Value(1.0)),
+            default=Value(0.0),
+            output_field=FloatField(),
+        )
+        if connections[queryset.db].vendor == 'postgresql':
+            rank += SearchRank(
+                SearchVector(self.document_field, config='simple'),
+                SearchQuery(search_text, config='simple'),
+            ) + TrigramWordSimilarity(search_text, self.document_field)
+        return rank
+
+    def filter_queryset(self, request: HttpRequest, queryset: QuerySet, view):
+        search_terms = self.get_search_terms(request)
+        if not search_terms:
+            return queryset
+
+        queryset = queryset.filter(
+            *[
+                Q(**{f'{self.document_field}__contains': term.lower()})
+                for term in search_terms
+            ]
+        ).annotate(search_rank=self.get_search_rank(queryset, ' '.join(search_terms)))
+
+        if request.query_params.get(api_settings.ORDERING_PARAM):
+            return queryset
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        return queryset.order_by('-search_rank', *ordering)
+
+
 class WordCounters:
-    translations_count = Count('translations', distinct=True)
-    examples_count = Count('examples', distinct=True)
-    definitions_count = Count('definitions', distinct=True)
-    image_associations_count = Count('image_associations', distinct=True)
-    quote_associations_count = Count('quote_associations', distinct=True)
-    synonyms_count = Count('synonyms', distinct=True)
-    antonyms_count = Count('antonyms', distinct=True)
-    forms_count = Count('forms', distinct=True)
-    similars_count = Count('similars', distinct=True)
-    tags_count = Count('tags', distinct=True)
-    types_count = Count('types', distinct=True)
-    collections_count = Count('collections', distinct=True)
+    """
+    Word related objects amounts read from denormalized `WordCounter` store.
+    Use to annotate words for filters, sorting.
+    """
+
+    translations_count = Coalesce('counters__translations_count', 0)
+    examples_count = Coalesce('counters__examples_count', 0)
+    definitions_count = Coalesce('counters__definitions_count', 0)
+    image_associations_count = Coalesce('counters__image_associations_count', 0)
+    quote_associations_count = Coalesce('counters__quote_associations_count', 0)
+    synonyms_count = Coalesce('counters__synonyms_count', 0)
+    antonyms_count = Coalesce('counters__antonyms_count', 0)
+    forms_count = Coalesce('counters__forms_count', 0)
+    similars_count = Coalesce('counters__similars_count', 0)
+    tags_count = Coalesce('counters__tags_count', 0)
+    types_count = Coalesce('counters__types_count', 0)
+    collections_count = Coalesce('counters__collections_count', 0)
 
     all = {
         'translations_count': translations_count,
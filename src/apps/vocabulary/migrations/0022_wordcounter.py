@@ -0,0 +1,167 @@
+# Generated by Django 4.2.15 on 2026-10-16 19:43
+
+from collections import defaultdict
+
+from django.db import migrations, models
+from django.db.models import Count
+import django.db.models.deletion
+
+# counter field name - (intermediary model name, word foreign key field name)
+COUNTED_RELATIONS = {
+    "translations_count": ("WordTranslations", "word"),
+    "examples_count": ("WordUsageExamples", "word"),
+    "definitions_count": ("WordDefinitions", "word"),
+    "image_associations_count": ("WordImageAssociations", "word"),
+    "quote_associations_count": ("WordQuoteAssociations", "word"),
+    "synonyms_count": ("Synonym", "to_word"),
+    "antonyms_count": ("Antonym", "to_word"),
+    "forms_count": ("Form", "to_word"),
+    "similars_count": ("Similar", "to_word"),
+    "tags_count": ("Word_tags", "word"),
+    "types_count": ("Word_types", "word"),
+    "collections_count": ("WordsInCollections", "word"),
+}
+SYMMETRICAL_RELATIONS = ("Synonym", "Antonym", "Form", "Similar")
+
+
+def count_related_objs(model, word_field, symmetrical):
+    """
+    Returns related objects amounts by words ids, symmetrical words relations
+    are counted by distinct related words in both directions.
+    """
+    if not symmetrical:
+        return dict(
+            model.objects.order_by()
+            .values_list(word_field)
+            .annotate(amount=Count("pk"))
+        )
+    related_words = defaultdict(set)
+    pairs = model.objects.values_list("to_word_id", "from_word_id")
+    for to_word_id, from_word_id in pairs.iterator():
+        related_words[to_word_id].add(from_word_id)
+        related_words[from_word_id].add(to_word_id)
+    return {word_id: len(words) for word_id, words in related_words.items()}
+
+
+def create_word_counters(apps, schema_editor):
+    """Create counters of existing words with actual related objects amounts."""
+    Word = apps.get_model("vocabulary", "Word")
+    WordCounter = apps.get_model("vocabulary", "WordCounter")
+    amounts = {
+        field: count_related_objs(
+            apps.get_model("vocabulary", model_name),
+            word_field,
+            model_name in SYMMETRICAL_RELATIONS,
+        )
+        for field, (model_name, word_field) in COUNTED_RELATIONS.items()
+    }
+    WordCounter.objects.bulk_create(
+        (
+            WordCounter(
+                word_id=word_id,
+                **{
+                    field: words_amounts.get(word_id, 0)
+                    for field, words_amounts in amounts.items()
+                },
+            )
+            for word_id in Word.objects.values_list("pk", flat=True).iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("vocabulary", "0021_alter_imageassociation_image_url"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WordCounter",
+            fields=[
+                (
+                    "word",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="counters",
+                        serialize=False,
+                        to="vocabulary.word",
+                        verbose_name="Word",
+                    ),
+                ),
+                (
+                    "translations_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Translations amount"
+                    ),
+                ),
+                (
+                    "examples_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Usage examples amount"
+                    ),
+                ),
+                (
+                    "definitions_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Definitions amount"
+                    ),
+                ),
+                (
+                    "image_associations_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Image associations amount"
+                    ),
+                ),
+                (
+                    "quote_associations_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Quote associations amount"
+                    ),
+                ),
+                (
+                    "synonyms_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Synonyms amount"
+                    ),
+                ),
+                (
+                    "antonyms_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Antonyms amount"
+                    ),
+                ),
+                (
+                    "forms_count",
+                    models.PositiveIntegerField(default=0, verbose_name="Forms amount"),
+                ),
+                (
+                    "similars_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Similars amount"
+                    ),
+                ),
+                (
+                    "tags_count",
+                    models.PositiveIntegerField(default=0, verbose_name="Tags amount"),
+                ),
+                (
+                    "types_count",
+                    models.PositiveIntegerField(default=0, verbose_name="Types amount"),
+                ),
+                (
+                    "collections_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Collections amount"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Word related objects counters",
+                "verbose_name_plural": "Words related objects counters",
+                "db_table_comment": "Denormalized amounts of word related objects",
+            },
+        ),
+        migrations.RunPython(create_word_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 4.2.15 on 2026-10-16 20:05
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+# word related objects texts included in document
+INDEXED_FIELDS = (
+    "translations__text",
+    "definitions__text",
+    "definitions__translation",
+    "examples__text",
+    "examples__translation",
+    "tags__name",
+)
+
+
+def create_search_documents(apps, schema_editor):
+    """Create search documents of existing words."""
+    Word = apps.get_model("vocabulary", "Word")
+    WordSearchDocument = apps.get_model("vocabulary", "WordSearchDocument")
+    words = Word.objects.order_by()
+
+    texts = {}
+    for word_id, text in words.values_list("pk", "text").iterator():
+        texts[word_id] = [text]
+    for field in INDEXED_FIELDS:
+        objs = words.filter(**{f"{field}__isnull": False}).values_list("pk", field)
+        for word_id, text in objs.iterator():
+            texts[word_id].append(text)
+
+    WordSearchDocument.objects.bulk_create(
+        (
+            WordSearchDocument(word_id=word_id, document=" ".join(word_texts).lower())
+            for word_id, word_texts in texts.items()
+        ),
+        batch_size=1000,
+    )
+
+
+def create_trigram_index(apps, schema_editor):
+    """Create trigram index for search documents (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS vocabulary_wordsearchdocument_trgm "
+        "ON vocabulary_wordsearchdocument USING gin (document gin_trgm_ops)"
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS vocabulary_wordsearchdocument_trgm")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("vocabulary", "0022_wordcounter"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WordSearchDocument",
+            fields=[
+                (
+                    "word",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="search_document",
+                        serialize=False,
+                        to="vocabulary.word",
+                        verbose_name="Word",
+                    ),
+                ),
+                (
+                    "document",
+                    models.TextField(blank=True, verbose_name="Search document"),
+                ),
+            ],
+            options={
+                "verbose_name": "Word search document",
+                "verbose_name_plural": "Words search documents",
+                "db_table_comment": "Lowercase texts of words and its related objects used for search",
+            },
+        ),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+        migrations.RunPython(create_search_documents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,74 @@
+# Generated by Django 4.2.15 on 2026-10-16 21:12
+
+from django.conf import settings
+import django.core.serializers.json
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("vocabulary", "0023_wordsearchdocument"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MainPageSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created",
+                    models.DateTimeField(
+                        auto_now_add=True, db_index=True, verbose_name="Date created"
+                    ),
+                ),
+                (
+                    "section",
+                    models.CharField(max_length=32, verbose_name="Main page section"),
+                ),
+                (
+                    "variant",
+                    models.CharField(
+                        max_length=256,
+                        verbose_name="Language and host section is serialized for",
+                    ),
+                ),
+                (
+                    "data",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        verbose_name="Serialized section data",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="%(class)s",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="User",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Main page section snapshot",
+                "verbose_name_plural": "Main page sections snapshots",
+                "db_table_comment": "Serialized users main page sections",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="mainpagesnapshot",
+            constraint=models.UniqueConstraint(
+                fields=("user", "variant", "section"), name="unique_main_page_snapshot"
+            ),
+        ),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 4.2.15 on 2026-10-16 22:54
+
+from django.db import migrations, models
+from django.db.models import Count
+import django.db.models.deletion
+
+# counter field name - word counter field name which must be positive
+COUNTED_WORDS = {
+    "translated_words_count": "translations_count",
+    "illustrated_words_count": "image_associations_count",
+}
+
+
+def create_collection_counters(apps, schema_editor):
+    """
+    Create counters of existing collections with actual amounts of words
+    counted by words counters.
+    """
+    Collection = apps.get_model("vocabulary", "Collection")
+    CollectionCounter = apps.get_model("vocabulary", "CollectionCounter")
+    WordsInCollections = apps.get_model("vocabulary", "WordsInCollections")
+    amounts = {
+        field: dict(
+            WordsInCollections.objects.filter(
+                **{f"word__counters__{word_counter_field}__gt": 0}
+            )
+            .order_by()
+            .values_list("collection")
+            .annotate(amount=Count("pk"))
+        )
+        for field, word_counter_field in COUNTED_WORDS.items()
+    }
+    CollectionCounter.objects.bulk_create(
+        (
+            CollectionCounter(
+                collection_id=collection_id,
+                **{
+                    field: collections_amounts.get(collection_id, 0)
+                    for field, collections_amounts in amounts.items()
+                },
+            )
+            for collection_id in Collection.objects.values_list(
+                "pk", flat=True
+            ).iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("vocabulary", "0024_mainpagesnapshot"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CollectionCounter",
+            fields=[
+                (
+                    "collection",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="counters",
+                        serialize=False,
+                        to="vocabulary.collection",
+                        verbose_name="Collection",
+                    ),
+                ),
+                (
+                    "translated_words_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Words with translations amount"
+                    ),
+                ),
+                (
+                    "illustrated_words_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Words with image associations amount"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Collection words counters",
+                "verbose_name_plural": "Collections words counters",
+                "db_table_comment": "Denormalized amounts of collection exercises words",
+            },
+        ),
+        migrations.RunPython(create_collection_counters, migrations.RunPython.noop),
+    ]
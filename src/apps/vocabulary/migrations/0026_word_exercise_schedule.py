@@ -0,0 +1,58 @@
+# Generated by Django 4.2.15 on 2026-10-17 01:12
+
+import datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("vocabulary", "0025_collectioncounter"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="word",
+            name="next_exercise_date",
+            field=models.DateTimeField(
+                editable=False, null=True, verbose_name="Next exercise date"
+            ),
+        ),
+        migrations.AddField(
+            model_name="word",
+            name="exercise_interval",
+            field=models.DurationField(
+                default=datetime.timedelta,
+                editable=False,
+                verbose_name="Exercise repetitions interval",
+            ),
+        ),
+        migrations.AddField(
+            model_name="word",
+            name="exercise_ease",
+            field=models.FloatField(
+                default=2.5, editable=False, verbose_name="Exercise ease factor"
+            ),
+        ),
+        migrations.AddField(
+            model_name="word",
+            name="exercise_repetitions",
+            field=models.PositiveSmallIntegerField(
+                default=0,
+                editable=False,
+                verbose_name="Successful exercise repetitions in a row",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="word",
+            index=models.Index(
+                fields=["author", "next_exercise_date"], name="word_author_due_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="word",
+            index=models.Index(
+                fields=["author", "language", "next_exercise_date"],
+                name="word_author_language_due_idx",
+            ),
+        ),
+    ]
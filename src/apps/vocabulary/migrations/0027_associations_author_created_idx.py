@@ -0,0 +1,24 @@
+# Generated by Django 4.2.15 on 2026-10-17 02:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("vocabulary", "0026_word_exercise_schedule"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="imageassociation",
+            index=models.Index(
+                fields=["author", "created"], name="image_author_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="quoteassociation",
+            index=models.Index(
+                fields=["author", "created"], name="quote_author_created_idx"
+            ),
+        ),
+    ]
@@ -1,14 +1,37 @@
 """Vocabulary app models."""
 
+import time
 import uuid
 import logging
+from datetime import datetime, timedelta
 
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import MinLengthValidator
 from django.db import models
-from django.db.models.functions import Lower
-from django.db.models.signals import pre_save, post_delete
+from django.db.models import (
+    Case,
+    Count,
+    Exists,
+    F,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce, Lower
+from django.db.models.signals import (
+    pre_save,
+    post_save,
+    pre_delete,
+    post_delete,
+    m2m_changed,
+)
 from django.dispatch import receiver
-from django.utils.translation import gettext as _
+from django.utils import timezone
+from django.utils.translation import get_language, gettext as _
 
 from apps.core.models import (
     GetObjectBySlugModelMixin,
@@ -37,10 +60,16 @@ from apps.core.constants import (
 )
 from apps.core.validators import CustomRegexValidator
 from utils.fillers import slug_filler
+from utils.getters import UnionQuerySet
 from utils.images import compress
+from utils.transactions import TransactionCollector
 
 from .constants import (
     VocabularyLengthLimits,
+    EXERCISE_FIRST_INTERVALS,
+    EXERCISE_DEFAULT_EASE,
+    EXERCISE_MIN_EASE,
+    EXERCISE_COMPLETE_INTERVAL,
 )
 
 logger = logging.getLogger(__name__)
@@ -184,6 +213,26 @@ class Word(
         editable=False,
         null=True,
     )
+    next_exercise_date = models.DateTimeField(
+        _('Next exercise date'),
+        editable=False,
+        null=True,
+    )
+    exercise_interval = models.DurationField(
+        _('Exercise repetitions interval'),
+        editable=False,
+        default=timedelta,
+    )
+    exercise_ease = models.FloatField(
+        _('Exercise ease factor'),
+        editable=False,
+        default=EXERCISE_DEFAULT_EASE,
+    )
+    exercise_repetitions = models.PositiveSmallIntegerField(
+        _('Successful exercise repetitions in a row'),
+        editable=False,
+        default=0,
+    )
 
     slugify_fields = ('text', ('author', 'username'), ('language', 'isocode'))
 
@@ -198,10 +247,71 @@ class Word(
                 'text', 'author', 'language', name='unique_words_in_user_voc'
             )
         ]
+        indexes = [
+            # due words queues of user and of user's language
+            models.Index(
+                fields=('author', 'next_exercise_date'), name='word_author_due_idx'
+            ),
+            models.Index(
+                fields=('author', 'language', 'next_exercise_date'),
+                name='word_author_language_due_idx',
+            ),
+        ]
 
     def __str__(self) -> str:
         return f'{self.text} (by {self.author})'
 
+    @property
+    def exercise_progress(self) -> int:
+        """Returns word exercise progress percent by repetitions interval."""
+        progress = self.exercise_interval / timedelta(days=EXERCISE_COMPLETE_INTERVAL)
+        return min(100, round(progress * 100))
+
+    def schedule_next_exercise(self, quality: int, exercise_date: datetime) -> None:
+        """
+        Updates word repetitions interval, ease factor and next exercise date by
+        passed exercise answers quality from 0 to 5 (SM-2 algorithm), answers
+        with quality lower than 3 start repetitions again. Word is not saved.
+        """
+        if quality >= 3:
+            if self.exercise_repetitions < len(EXERCISE_FIRST_INTERVALS):
+                interval = timedelta(
+                    days=EXERCISE_FIRST_INTERVALS[self.exercise_repetitions]
+                )
+            else:
+                interval = timedelta(
+                    days=round(self.exercise_interval.days * self.exercise_ease)
+                )
+            self.exercise_repetitions += 1
+        else:
+            interval = timedelta(days=EXERCISE_FIRST_INTERVALS[0])
+            self.exercise_repetitions = 0
+
+        self.exercise_ease = max(
+            EXERCISE_MIN_EASE,
+            self.exercise_ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02),
+        )
+        self.exercise_interval = interval
+        self.next_exercise_date = exercise_date + interval
+
+    @classmethod
+    def get_due_words(
+        cls, author_id, language_id=None, due_before: datetime | None = None
+    ) -> models.QuerySet:
+        """
+        Returns user's (and language's if passed) scheduled words ordered by next
+        exercise date, only words due before passed date if passed. First words
+        are read from due words index without scanning whole vocabulary.
+        """
+        words = cls.objects.filter(
+            author_id=author_id, next_exercise_date__isnull=False
+        )
+        if language_id is not None:
+            words = words.filter(language_id=language_id)
+        if due_before is not None:
+            words = words.filter(next_exercise_date__lte=due_before)
+        return words.order_by('next_exercise_date')
+
 
 class WordType(
     GetObjectBySlugModelMixin,
@@ -604,6 +714,10 @@ class ImageAssociation(
         db_table_comment = _('Image-associations for words and phrases')
         ordering = ('-created', '-modified')
         get_latest_by = ('created', 'modified')
+        indexes = [
+            # user's associations feed ordered by creation date
+            models.Index(fields=('author', 'created'), name='image_author_created_idx'),
+        ]
 
     def __str__(self) -> str:
         return _(f'Image association by {self.author}')
@@ -660,6 +774,10 @@ class QuoteAssociation(
         db_table_comment = _('Quote-associations for words and phrases')
         ordering = ('-created', '-modified')
         get_latest_by = ('created', 'modified')
+        indexes = [
+            # user's associations feed ordered by creation date
+            models.Index(fields=('author', 'created'), name='quote_author_created_idx'),
+        ]
 
     def __str__(self) -> str:
         if self.quote_author:
@@ -1237,6 +1355,405 @@ class DefaultWordCards(UserRelatedModel, CreatedModel):
         return f'Default word cards type set by {self.user}: {self.cards_type}'
 
 
+class WordCounter(models.Model):
+    """
+    Denormalized amounts of word related objects.
+    Kept up to date by signals on word intermediary models, used in words
+    filters and sorting instead of counting related objects on every request.
+    """
+
+    # counter field name - (intermediary model, word foreign key field name)
+    counted_relations = {
+        'translations_count': (WordTranslations, 'word'),
+        'examples_count': (WordUsageExamples, 'word'),
+        'definitions_count': (WordDefinitions, 'word'),
+        'image_associations_count': (WordImageAssociations, 'word'),
+        'quote_associations_count': (WordQuoteAssociations, 'word'),
+        'synonyms_count': (Synonym, 'to_word'),
+        'antonyms_count': (Antonym, 'to_word'),
+        'forms_count': (Form, 'to_word'),
+        'similars_count': (Similar, 'to_word'),
+        'tags_count': (Word.tags.through, 'word'),
+        'types_count': (Word.types.through, 'word'),
+        'collections_count': (WordsInCollections, 'word'),
+    }
+
+    word = models.OneToOneField(
+        'Word',
+        verbose_name=_('Word'),
+        on_delete=models.CASCADE,
+        related_name='counters',
+        primary_key=True,
+    )
+    translations_count = models.PositiveIntegerField(
+        _('Translations amount'),
+        default=0,
+    )
+    examples_count = models.PositiveIntegerField(
+        _('Usage examples amount'),
+        default=0,
+    )
+    definitions_count = models.PositiveIntegerField(
+        _('Definitions amount'),
+        default=0,
+    )
+    image_associations_count = models.PositiveIntegerField(
+        _('Image associations amount'),
+        default=0,
+    )
+    quote_associations_count = models.PositiveIntegerField(
+        _('Quote associations amount'),
+        default=0,
+    )
+    synonyms_count = models.PositiveIntegerField(
+        _('Synonyms amount'),
+        default=0,
+    )
+    antonyms_count = models.PositiveIntegerField(
+        _('Antonyms amount'),
+        default=0,
+    )
+    forms_count = models.PositiveIntegerField(
+        _('Forms amount'),
+        default=0,
+    )
+    similars_count = models.PositiveIntegerField(
+        _('Similars amount'),
+        default=0,
+    )
+    tags_count = models.PositiveIntegerField(
+        _('Tags amount'),
+        default=0,
+    )
+    types_count = models.PositiveIntegerField(
+        _('Types amount'),
+        default=0,
+    )
+    collections_count = models.PositiveIntegerField(
+        _('Collections amount'),
+        default=0,
+    )
+
+    class Meta:
+        verbose_name = _('Word related objects counters')
+        verbose_name_plural = _('Words related objects counters')
+        db_table_comment = _('Denormalized amounts of word related objects')
+
+    def __str__(self) -> str:
+        return f'Related objects counters of word `{self.word}`'
+
+    @classmethod
+    def get_amount(cls, field: str, word_ref: str = 'word_id') -> Coalesce:
+        """
+        Returns subquery to count actual word related objects for passed counter
+        field. Symmetrical words relations (synonyms, antonyms, etc.) are counted
+        by distinct related words in both directions.
+
+        Args:
+            field (str): counter field name.
+            word_ref (str): outer query field name to get word id from.
+        """
+        model, word_field = cls.counted_relations[field]
+        word = OuterRef(word_ref)
+        if issubclass(model, WordSelfRelatedModel):
+            objs = (
+                model.objects.filter(Q(to_word=word) | Q(from_word=word))
+                .annotate(
+                    _related_word=Case(
+                        When(to_word=word, then=F('from_word')),
+                        default=F('to_word'),
+                    )
+                )
+                .order_by()
+                .annotate(_group=Value(1))
+                .values('_group')
+                .annotate(_amount=Count('_related_word', distinct=True))
+            )
+        else:
+            objs = (
+                model.objects.filter(**{word_field: word})
+                .order_by()
+                .values(word_field)
+                .annotate(_amount=Count('pk'))
+            )
+        return Coalesce(Subquery(objs.values('_amount')), 0)
+
+    @classmethod
+    def get_counted_values(
+        cls, *fields, word_ref: str = 'word_id'
+    ) -> dict[str, Coalesce]:
+        """
+        Returns actual related objects amounts subqueries for passed counter fields
+        (or for all counter fields if nothing passed).
+        """
+        fields = fields or tuple(cls.counted_relations)
+        return {field: cls.get_amount(field, word_ref) for field in fields}
+
+    @classmethod
+    def refresh(cls, words_ids=None, *fields) -> int:
+        """
+        Recounts passed counter fields (or all counter fields if nothing passed)
+        for given words (or for all words if None passed) with single update query.
+        Returns updated counters amount.
+        """
+        counters = cls.objects.all()
+        if words_ids is not None:
+            counters = counters.filter(word_id__in=words_ids)
+        return counters.update(**cls.get_counted_values(*fields))
+
+
+class CollectionCounter(models.Model):
+    """
+    Denormalized amounts of collection words available for exercises (words with
+    translations, with image-associations) to filter and count available
+    collections without joining words related objects on every request.
+    """
+
+    # counter field name - word counter field name which must be positive
+    counted_words = {
+        'translated_words_count': 'translations_count',
+        'illustrated_words_count': 'image_associations_count',
+    }
+
+    collection = models.OneToOneField(
+        'Collection',
+        verbose_name=_('Collection'),
+        on_delete=models.CASCADE,
+        related_name='counters',
+        primary_key=True,
+    )
+    translated_words_count = models.PositiveIntegerField(
+        _('Words with translations amount'),
+        default=0,
+    )
+    illustrated_words_count = models.PositiveIntegerField(
+        _('Words with image associations amount'),
+        default=0,
+    )
+
+    class Meta:
+        verbose_name = _('Collection words counters')
+        verbose_name_plural = _('Collections words counters')
+        db_table_comment = _('Denormalized amounts of collection exercises words')
+
+    def __str__(self) -> str:
+        return f'Words counters of collection `{self.collection}`'
+
+    @classmethod
+    def get_amount(cls, field: str, collection_ref: str = 'collection_id') -> Coalesce:
+        """
+        Returns subquery to count actual collection words for passed counter field.
+
+        Args:
+            field (str): counter field name.
+            collection_ref (str): outer query field name to get collection id from.
+        """
+        objs = (
+            WordsInCollections.objects.filter(
+                collection=OuterRef(collection_ref),
+                **{f'word__counters__{cls.counted_words[field]}__gt': 0},
+            )
+            .order_by()
+            .values('collection')
+            .annotate(_amount=Count('pk'))
+        )
+        return Coalesce(Subquery(objs.values('_amount')), 0)
+
+    @classmethod
+    def get_counted_values(
+        cls, *fields, collection_ref: str = 'collection_id'
+    ) -> dict[str, Coalesce]:
+        """
+        Returns actual words amounts subqueries for passed counter fields (or for
+        all counter fields if nothing passed).
+        """
+        fields = fields or tuple(cls.counted_words)
+        return {field: cls.get_amount(field, collection_ref) for field in fields}
+
+    @classmethod
+    def refresh(cls, collections_ids=None, words_ids=None) -> int:
+        """
+        Recounts counters of given collections or of collections with given words
+        (or of all collections if None passed) with single update query. Must be
+        called after words counters are refreshed. Returns updated counters amount.
+        """
+        counters = cls.objects.all()
+        if collections_ids is not None:
+            counters = counters.filter(collection_id__in=collections_ids)
+        if words_ids is not None:
+            counters = counters.filter(
+                collection_id__in=WordsInCollections.objects.filter(
+                    word_id__in=words_ids
+                ).values('collection_id')
+            )
+        return counters.update(**cls.get_counted_values())
+
+
+class WordSearchDocument(models.Model):
+    """
+    Lowercase text of word and its translations, definitions, usage examples and
+    tags to search words in single indexed column instead of joining all of
+    them on every search request.
+    """
+
+    # word related objects texts included in document
+    indexed_fields = (
+        'translations__text',
+        'definitions__text',
+        'definitions__translation',
+        'examples__text',
+        'examples__translation',
+        'tags__name',
+    )
+    # intermediary models objects changes require document update
+    indexed_relations = (
+        WordTranslations,
+        WordDefinitions,
+        WordUsageExamples,
+        Word.tags.through,
+    )
+
+    word = models.OneToOneField(
+        'Word',
+        verbose_name=_('Word'),
+        on_delete=models.CASCADE,
+        related_name='search_document',
+        primary_key=True,
+    )
+    document = models.TextField(
+        _('Search document'),
+        blank=True,
+    )
+
+    class Meta:
+        verbose_name = _('Word search document')
+        verbose_name_plural = _('Words search documents')
+        db_table_comment = _(
+            'Lowercase texts of words and its related objects used for search'
+        )
+
+    def __str__(self) -> str:
+        return f'Search document of word `{self.word}`'
+
+    @classmethod
+    def refresh(cls, words_ids=None) -> int:
+        """
+        Rebuilds search documents of given words (or of all words if None passed).
+        Returns updated documents amount.
+        """
+        documents = cls.objects.all()
+        words = Word.objects.order_by()
+        if words_ids is not None:
+            documents = documents.filter(word_id__in=words_ids)
+            words = words.filter(pk__in=words_ids)
+
+        texts = {}
+        for word_id, text in words.values_list('pk', 'text').iterator():
+            texts[word_id] = [text]
+        for field in cls.indexed_fields:
+            objs = words.filter(**{f'{field}__isnull': False}).values_list('pk', field)
+            for word_id, text in objs.iterator():
+                texts[word_id].append(text)
+
+        documents = list(documents)
+        for document in documents:
+            document.document = ' '.join(texts.get(document.word_id, [])).lower()
+        return cls.objects.bulk_update(documents, ['document'], batch_size=1000)
+
+
+class MainPageSnapshot(UserRelatedModel, CreatedModel):
+    """
+    Serialized user's main page section. Every section is stored separately, so
+    changes of user's objects rebuild only sections built from these objects.
+    Snapshots are deleted by signals when these objects change, and built again
+    on next main page request.
+    """
+
+    # all main page sections
+    sections = (
+        'learning_languages',
+        'collections',
+        'tags',
+        'images',
+        'definitions',
+        'examples',
+        'translations',
+        'words',
+        'due_words',
+    )
+    # model - main page sections built from its objects
+    invalidated_sections = {
+        Word: ('words', 'learning_languages'),
+        FavoriteWord: ('words',),
+        Collection: ('collections',),
+        FavoriteCollection: ('collections',),
+        WordsInCollections: ('words', 'collections'),
+        WordTag: ('words', 'tags'),
+        Word.tags.through: ('words', 'tags'),
+        Word.types.through: ('words',),
+        ImageAssociation: ('words', 'images'),
+        WordImageAssociations: ('words', 'images'),
+        QuoteAssociation: ('words',),
+        WordQuoteAssociations: ('words',),
+        Definition: ('words', 'definitions'),
+        WordDefinitions: ('words', 'definitions'),
+        UsageExample: ('words', 'examples'),
+        WordUsageExamples: ('words', 'examples'),
+        WordTranslation: ('words', 'translations'),
+        WordTranslations: ('words', 'translations'),
+        Synonym: ('words',),
+        Antonym: ('words',),
+        Form: ('words',),
+        Similar: ('words',),
+    }
+
+    section = models.CharField(
+        _('Main page section'),
+        max_length=32,
+    )
+    variant = models.CharField(
+        _('Language and host section is serialized for'),
+        max_length=256,
+    )
+    data = models.JSONField(
+        _('Serialized section data'),
+        encoder=DjangoJSONEncoder,
+    )
+
+    class Meta:
+        verbose_name = _('Main page section snapshot')
+        verbose_name_plural = _('Main page sections snapshots')
+        db_table_comment = _('Serialized users main page sections')
+        constraints = [
+            models.UniqueConstraint(
+                fields=('user', 'variant', 'section'),
+                name='unique_main_page_snapshot',
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f'Main page `{self.section}` section snapshot of {self.user}'
+
+    @classmethod
+    def invalidate(cls, sections=None, users_ids=None, words_ids=None) -> int:
+        """
+        Deletes passed sections (or all sections if None passed) snapshots of
+        given users or words authors (or of all users if None passed) with single
+        delete query. Returns deleted snapshots amount.
+        """
+        snapshots = cls.objects.all()
+        if sections is not None:
+            snapshots = snapshots.filter(section__in=sections)
+        if users_ids is not None:
+            snapshots = snapshots.filter(user_id__in=users_ids)
+        if words_ids is not None:
+            snapshots = snapshots.filter(
+                user_id__in=Word.objects.filter(pk__in=words_ids).values('author_id')
+            )
+        deleted, _ = snapshots.delete()
+        return deleted
+
+
 @receiver(pre_save, sender=Word)
 @receiver(pre_save, sender=Collection)
 @receiver(pre_save, sender=WordType)
@@ -1250,13 +1767,711 @@ def fill_slug(sender, instance, *args, **kwargs) -> None:
     logger.debug(f'Instance {instance} slug filled with value: {slug}')
 
 
-@receiver(post_delete, sender=Word)
-def clear_extra_objects(sender, *args, **kwargs) -> None:
-    """Delete word related objects if they no longer relate to other words."""
-    WordTranslation.objects.filter(words__isnull=True).delete()
-    UsageExample.objects.filter(words__isnull=True).delete()
-    Definition.objects.filter(words__isnull=True).delete()
-    WordTag.objects.filter(words__isnull=True).delete()
-    FormGroup.objects.filter(words__isnull=True).delete()
-    ImageAssociation.objects.filter(words__isnull=True).delete()
-    QuoteAssociation.objects.filter(words__isnull=True).delete()
+# word related model - (intermediary model, related object foreign key field
+# name), objects are deleted when they no longer relate to any word
+orphan_relations = {
+    WordTranslation: (WordTranslations, 'translation'),
+    UsageExample: (WordUsageExamples, 'example'),
+    Definition: (WordDefinitions, 'definition'),
+    WordTag: (Word.tags.through, 'wordtag'),
+    FormGroup: (WordsFormGroups, 'forms_group'),
+    ImageAssociation: (WordImageAssociations, 'image'),
+    QuoteAssociation: (WordQuoteAssociations, 'quote'),
+}
+# intermediary model - (word related model, related object id attribute)
+orphan_candidates_relations = {
+    through: (model, f'{field}_id')
+    for model, (through, field) in orphan_relations.items()
+}
+
+
+def get_orphans(model) -> models.QuerySet:
+    """Returns passed word related model objects which relate to no words."""
+    through, field = orphan_relations[model]
+    return model.objects.filter(
+        ~Exists(through.objects.filter(**{field: OuterRef('pk')}))
+    )
+
+
+def delete_orphans(candidates=None, batch_size: int = 1000) -> dict[str, int]:
+    """
+    Deletes word related objects which no longer relate to any word: only passed
+    candidates (dict of models and objects ids) or all objects if None passed,
+    in batches. Returns deleted objects amounts by models verbose names and
+    deleted image associations files amount (`files` key).
+    """
+    report = {'files': 0}
+    for model in orphan_relations:
+        orphans = get_orphans(model)
+        if candidates is None:
+            # deleted orphans are not selected again, select until none left
+            batches = iter(
+                lambda: list(orphans.values_list('pk', flat=True)[:batch_size]), []
+            )
+        else:
+            pks = list(candidates.get(model, ()))
+            batches = (
+                pks[index : index + batch_size]
+                for index in range(0, len(pks), batch_size)
+            )
+        deleted = 0
+        for batch in batches:
+            batch_orphans = orphans.filter(pk__in=batch)
+            if model is ImageAssociation:
+                # files are deleted by django_cleanup after objects are deleted
+                report['files'] += (
+                    batch_orphans.exclude(image='').exclude(image__isnull=True).count()
+                )
+            deleted += batch_orphans.delete()[1].get(model._meta.label, 0)
+        if deleted:
+            report[str(model._meta.verbose_name_plural)] = deleted
+    return report
+
+
+def delete_orphan_candidates(candidates: dict[type[models.Model], set]) -> None:
+    """Deletes orphans from collected candidates (runs after commit)."""
+    report = delete_orphans(candidates)
+    logger.info(f'Words related objects without words deleted: {report}')
+
+
+# objects which may no longer relate to any word, they are checked and deleted
+# once after current transaction is committed
+orphan_candidates = TransactionCollector(delete_orphan_candidates)
+
+
+@receiver(pre_delete, sender=Word)
+def remember_word_tags(sender, instance, *args, **kwargs) -> None:
+    """
+    Remember deleted word tags to delete them if they no longer relate to other
+    words (intermediary tags objects are deleted without signals).
+    """
+    orphan_candidates.add(WordTag, instance.tags.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=WordTranslations)
+@receiver(post_delete, sender=WordUsageExamples)
+@receiver(post_delete, sender=WordDefinitions)
+@receiver(post_delete, sender=WordsFormGroups)
+@receiver(post_delete, sender=WordImageAssociations)
+@receiver(post_delete, sender=WordQuoteAssociations)
+def remember_unlinked_objects(sender, instance, *args, **kwargs) -> None:
+    """
+    Remember object unlinked from word (word is deleted or object is removed
+    from it) to delete it if it no longer relates to other words.
+    """
+    model, attr = orphan_candidates_relations[sender]
+    orphan_candidates.add(model, [instance.__getattribute__(attr)])
+
+
+@receiver(m2m_changed, sender=Word.tags.through)
+def remember_removed_tags(
+    sender, instance, action, model, pk_set, *args, **kwargs
+) -> None:
+    """Remember tags removed from word to delete them if they have no words."""
+    if action == 'post_remove' and isinstance(instance, Word) and pk_set:
+        orphan_candidates.add(WordTag, pk_set)
+
+
+# intermediary model - (counter field name, words foreign keys attributes)
+word_counted_relations = {
+    model: (
+        field,
+        ('to_word_id', 'from_word_id')
+        if issubclass(model, WordSelfRelatedModel)
+        else (f'{word_field}_id',),
+    )
+    for field, (model, word_field) in WordCounter.counted_relations.items()
+}
+
+
+@receiver(post_save, sender=Word)
+def create_word_counters(sender, instance, created, *args, **kwargs) -> None:
+    """Create word related objects counters for new word."""
+    if created:
+        WordCounter.objects.get_or_create(word=instance)
+
+
+@receiver(post_save, sender=Collection)
+def create_collection_counters(sender, instance, created, *args, **kwargs) -> None:
+    """Create collection words counters for new collection."""
+    if created:
+        CollectionCounter.objects.get_or_create(collection=instance)
+
+
+@receiver(post_save, sender=Word)
+def update_word_search_document(
+    sender, instance, created, update_fields=None, *args, **kwargs
+) -> None:
+    """Create or update word search document after word is saved."""
+    if created:
+        WordSearchDocument.objects.get_or_create(
+            word=instance, defaults={'document': instance.text.lower()}
+        )
+    elif update_fields is None or 'text' in update_fields:
+        WordSearchDocument.refresh([instance.pk])
+
+
+@receiver([post_save, post_delete], sender=WordTranslations)
+@receiver([post_save, post_delete], sender=WordUsageExamples)
+@receiver([post_save, post_delete], sender=WordDefinitions)
+@receiver([post_save, post_delete], sender=WordImageAssociations)
+@receiver([post_save, post_delete], sender=WordQuoteAssociations)
+@receiver([post_save, post_delete], sender=WordsInCollections)
+@receiver([post_save, post_delete], sender=Synonym)
+@receiver([post_save, post_delete], sender=Antonym)
+@receiver([post_save, post_delete], sender=Form)
+@receiver([post_save, post_delete], sender=Similar)
+def update_word_counters(sender, instance, created=True, *args, **kwargs) -> None:
+    """
+    Recount word related objects counter when intermediary object is created or
+    deleted (including deletion with `remove`, `clear` related managers methods).
+    """
+    if not created:
+        return
+    counter_field, words_attrs = word_counted_relations[sender]
+    words_ids = {instance.__getattribute__(attr) for attr in words_attrs}
+    WordCounter.refresh(words_ids, counter_field)
+    logger.debug(f'Words {words_ids} `{counter_field}` counters updated')
+
+    if sender is WordsInCollections:
+        CollectionCounter.refresh(collections_ids={instance.collection_id})
+        logger.debug(f'Collection {instance.collection_id} counters updated')
+    elif counter_field in CollectionCounter.counted_words.values():
+        CollectionCounter.refresh(words_ids=words_ids)
+        logger.debug(f'Words {words_ids} collections counters updated')
+
+    if sender in WordSearchDocument.indexed_relations:
+        WordSearchDocument.refresh(words_ids)
+        logger.debug(f'Words {words_ids} search documents updated')
+
+
+@receiver(m2m_changed, sender=WordTranslations)
+@receiver(m2m_changed, sender=WordUsageExamples)
+@receiver(m2m_changed, sender=WordDefinitions)
+@receiver(m2m_changed, sender=WordImageAssociations)
+@receiver(m2m_changed, sender=WordQuoteAssociations)
+@receiver(m2m_changed, sender=WordsInCollections)
+@receiver(m2m_changed, sender=Synonym)
+@receiver(m2m_changed, sender=Antonym)
+@receiver(m2m_changed, sender=Form)
+@receiver(m2m_changed, sender=Similar)
+@receiver(m2m_changed, sender=Word.tags.through)
+@receiver(m2m_changed, sender=Word.types.through)
+def update_word_counters_on_m2m_change(
+    sender, instance, action, model, pk_set, *args, **kwargs
+) -> None:
+    """
+    Recount word related objects counter when objects are added with `add`, `set`
+    related managers methods (intermediary objects are bulk created, so
+    `post_save` signal is not sent). Objects removal is handled here only for
+    auto-created intermediary models, `post_delete` signal is not sent for them.
+    """
+    if action != 'post_add' and not sender._meta.auto_created:
+        return
+    if action in ('pre_add', 'pre_remove'):
+        return
+    if action == 'pre_clear':
+        if not isinstance(instance, Word):
+            remember_related_words(sender, instance)
+        return
+
+    counter_field = word_counted_relations[sender][0]
+    if isinstance(instance, Word):
+        words_ids = {instance.pk}
+    else:
+        words_ids = instance.__dict__.pop('_related_words_ids', set())
+    if pk_set and model is Word:
+        words_ids |= pk_set
+
+    WordCounter.refresh(words_ids, counter_field)
+    logger.debug(f'Words {words_ids} `{counter_field}` counters updated')
+
+    if sender is WordsInCollections:
+        collections_ids = pk_set if isinstance(instance, Word) else {instance.pk}
+        CollectionCounter.refresh(collections_ids=collections_ids)
+        logger.debug(f'Collections {collections_ids} counters updated')
+    elif counter_field in CollectionCounter.counted_words.values():
+        CollectionCounter.refresh(words_ids=words_ids)
+        logger.debug(f'Words {words_ids} collections counters updated')
+
+    if sender in WordSearchDocument.indexed_relations:
+        WordSearchDocument.refresh(words_ids)
+        logger.debug(f'Words {words_ids} search documents updated')
+
+
+@receiver(pre_delete, sender=WordTag)
+@receiver(pre_delete, sender=WordType)
+def remember_related_words(sender, instance, *args, **kwargs) -> None:
+    """
+    Remember related words to recount their counters after tag or type is deleted
+    or cleared from words.
+    """
+    instance._related_words_ids = set(instance.words.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=WordTag)
+@receiver(post_delete, sender=WordType)
+def update_related_words_counters(sender, instance, *args, **kwargs) -> None:
+    """Recount related words counters after tag or type is deleted."""
+    words_ids = instance.__dict__.pop('_related_words_ids', set())
+    counter_field = 'tags_count' if sender is WordTag else 'types_count'
+    WordCounter.refresh(words_ids, counter_field)
+    logger.debug(f'Words {words_ids} `{counter_field}` counters updated')
+
+    if sender is WordTag:
+        WordSearchDocument.refresh(words_ids)
+        logger.debug(f'Words {words_ids} search documents updated')
+
+
+@receiver(post_save, sender=WordTranslation)
+@receiver(post_save, sender=Definition)
+@receiver(post_save, sender=UsageExample)
+@receiver(post_save, sender=WordTag)
+def update_related_words_search_documents(
+    sender, instance, created, *args, **kwargs
+) -> None:
+    """Update related words search documents after object text is changed."""
+    if created:
+        return
+    words_ids = set(instance.words.values_list('pk', flat=True))
+    WordSearchDocument.refresh(words_ids)
+    logger.debug(f'Words {words_ids} search documents updated')
+
+
+def get_owners_ids(instance) -> set | None:
+    """Returns users ids of passed object owners or None if they are unknown."""
+    owner_id = getattr(instance, 'author_id', None) or getattr(
+        instance, 'user_id', None
+    )
+    return {owner_id} if owner_id else None
+
+
+@receiver([post_save, post_delete], sender=Word)
+@receiver([post_save, post_delete], sender=FavoriteWord)
+@receiver([post_save, post_delete], sender=Collection)
+@receiver([post_save, post_delete], sender=FavoriteCollection)
+@receiver([post_save, post_delete], sender=WordTag)
+@receiver([post_save, post_delete], sender=ImageAssociation)
+@receiver([post_save, post_delete], sender=QuoteAssociation)
+@receiver([post_save, post_delete], sender=Definition)
+@receiver([post_save, post_delete], sender=UsageExample)
+@receiver([post_save, post_delete], sender=WordTranslation)
+def invalidate_main_page_snapshots(
+    sender, instance, created=False, update_fields=None, *args, **kwargs
+) -> None:
+    """
+    Delete owner's main page sections snapshots built from saved or deleted
+    object. Word text is shown in other sections too, so all sections are
+    deleted when it changes.
+    """
+    sections = MainPageSnapshot.invalidated_sections[sender]
+    if (
+        sender is Word
+        and not created
+        and (update_fields is None or 'text' in update_fields)
+    ):
+        sections = MainPageSnapshot.sections
+    MainPageSnapshot.invalidate(sections, users_ids=get_owners_ids(instance))
+    logger.debug(f'Main page snapshots {sections} of {instance} owner deleted')
+
+
+@receiver([post_save, post_delete], sender=WordTranslations)
+@receiver([post_save, post_delete], sender=WordUsageExamples)
+@receiver([post_save, post_delete], sender=WordDefinitions)
+@receiver([post_save, post_delete], sender=WordImageAssociations)
+@receiver([post_save, post_delete], sender=WordQuoteAssociations)
+@receiver([post_save, post_delete], sender=WordsInCollections)
+@receiver([post_save, post_delete], sender=Synonym)
+@receiver([post_save, post_delete], sender=Antonym)
+@receiver([post_save, post_delete], sender=Form)
+@receiver([post_save, post_delete], sender=Similar)
+def invalidate_words_main_page_snapshots(sender, instance, *args, **kwargs) -> None:
+    """
+    Delete words authors main page sections snapshots built from intermediary
+    object when it is saved or deleted.
+    """
+    sections = MainPageSnapshot.invalidated_sections[sender]
+    words_ids = {
+        instance.__getattribute__(attr) for attr in word_counted_relations[sender][1]
+    }
+    MainPageSnapshot.invalidate(sections, words_ids=words_ids)
+    logger.debug(f'Main page snapshots {sections} of words {words_ids} deleted')
+
+
+@receiver(m2m_changed, sender=WordTranslations)
+@receiver(m2m_changed, sender=WordUsageExamples)
+@receiver(m2m_changed, sender=WordDefinitions)
+@receiver(m2m_changed, sender=WordImageAssociations)
+@receiver(m2m_changed, sender=WordQuoteAssociations)
+@receiver(m2m_changed, sender=WordsInCollections)
+@receiver(m2m_changed, sender=Synonym)
+@receiver(m2m_changed, sender=Antonym)
+@receiver(m2m_changed, sender=Form)
+@receiver(m2m_changed, sender=Similar)
+@receiver(m2m_changed, sender=Word.tags.through)
+@receiver(m2m_changed, sender=Word.types.through)
+def invalidate_main_page_snapshots_on_m2m_change(
+    sender, instance, action, model, pk_set, *args, **kwargs
+) -> None:
+    """
+    Delete main page sections snapshots when objects are added, removed with
+    related managers methods. Snapshots of all users are deleted when owners are
+    unknown (word types are cleared).
+    """
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    sections = MainPageSnapshot.invalidated_sections[sender]
+    users_ids = get_owners_ids(instance)
+    if users_ids is None and pk_set and model is Word:
+        MainPageSnapshot.invalidate(sections, words_ids=pk_set)
+    else:
+        MainPageSnapshot.invalidate(sections, users_ids=users_ids)
+    logger.debug(f'Main page snapshots {sections} of {instance} owner deleted')
+
+
+@receiver([post_save, post_delete], sender='languages.UserLearningLanguage')
+@receiver([post_save, post_delete], sender='languages.Language')
+def invalidate_languages_main_page_snapshots(sender, instance, *args, **kwargs) -> None:
+    """
+    Delete main page learning languages and due words (listed by learning
+    languages) sections snapshots when user's learning language or language
+    itself is changed.
+    """
+    MainPageSnapshot.invalidate(
+        ('learning_languages', 'due_words'), users_ids=get_owners_ids(instance)
+    )
+    logger.debug(f'Main page learning languages snapshots of {instance} deleted')
+
+
+def get_associations_feed(
+    images: models.QuerySet, quotes: models.QuerySet
+) -> UnionQuerySet:
+    """
+    Returns merged feed of passed image and quote associations, every feed row
+    contains association type, id, creation and modification dates.
+    """
+    fields = ('association_type', 'id', 'created', 'modified')
+    return UnionQuerySet(
+        images.annotate(association_type=Value('image')).values(*fields),
+        quotes.annotate(association_type=Value('quote')).values(*fields),
+    )
+
+
+# collection aggregates are cached separately for every interface language, as
+# they contain translated languages names
+COLLECTION_AGGREGATES_CACHE_KEY = 'collection-aggregates-{collection_id}-{language}'
+COLLECTION_AGGREGATES_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def in_collection(collection, word_ref: str = 'word') -> Exists:
+    """
+    Returns EXISTS condition to check if word referenced by `word_ref` outer
+    query field is in passed collection (semi-join, no duplicated rows).
+    """
+    return Exists(
+        WordsInCollections.objects.filter(
+            collection=collection, word=OuterRef(word_ref)
+        )
+    )
+
+
+def get_collection_words_objs(collection, model) -> models.QuerySet:
+    """
+    Returns passed word related model objects related to any word in passed
+    collection, annotated with amount of collection words they relate to.
+    """
+    through, field = orphan_relations[model]
+    collection_links = through.objects.filter(in_collection(collection))
+    words_count = (
+        collection_links.filter(**{field: OuterRef('pk')})
+        .order_by()
+        .values(field)
+        .annotate(_amount=Count('pk'))
+        .values('_amount')
+    )
+    return model.objects.filter(
+        Exists(collection_links.filter(**{field: OuterRef('pk')}))
+    ).annotate(words_count=Coalesce(Subquery(words_count), 0))
+
+
+def get_collection_aggregates(collection) -> dict:
+    """
+    Returns collection words languages with words amounts and collection words
+    images (image file name, image url pairs, latest words first). Aggregates are
+    cached until collection words or their images change.
+    """
+    key = COLLECTION_AGGREGATES_CACHE_KEY.format(
+        collection_id=collection.pk, language=get_language()
+    )
+    aggregates = cache.get(key)
+    if aggregates is None:
+        aggregates = {
+            'words_languages': list(
+                Word.objects.filter(in_collection(collection, 'pk'))
+                .order_by()
+                .values('language__name', 'language__country', 'language__isocode')
+                .annotate(words_count=Count('language'))
+                .order_by('-words_count')
+            ),
+            'words_images': list(
+                WordImageAssociations.objects.filter(in_collection(collection))
+                .order_by('-word__created')
+                .values_list('image__image', 'image__image_url')
+            ),
+        }
+        cache.set(key, aggregates, COLLECTION_AGGREGATES_CACHE_TIMEOUT)
+        logger.debug(f'Collection {collection} aggregates cached')
+    return aggregates
+
+
+def invalidate_collections_aggregates(collections_ids=None, words_ids=None) -> None:
+    """
+    Deletes cached aggregates of passed collections and of collections with
+    passed words.
+    """
+    collections_ids = set(collections_ids or ())
+    if words_ids:
+        collections_ids.update(
+            WordsInCollections.objects.filter(word_id__in=words_ids).values_list(
+                'collection_id', flat=True
+            )
+        )
+    cache.delete_many(
+        [
+            COLLECTION_AGGREGATES_CACHE_KEY.format(
+                collection_id=collection_id, language=language
+            )
+            for collection_id in collections_ids
+            for language, _name in settings.LANGUAGES
+        ]
+    )
+    logger.debug(f'Collections {collections_ids} aggregates deleted')
+
+
+@receiver([post_save, post_delete], sender=WordsInCollections)
+def invalidate_collection_aggregates(sender, instance, *args, **kwargs) -> None:
+    """Delete collection cached aggregates when word is added or removed."""
+    invalidate_collections_aggregates([instance.collection_id])
+
+
+@receiver([post_save, post_delete], sender=WordImageAssociations)
+def invalidate_word_collections_aggregates(sender, instance, *args, **kwargs) -> None:
+    """Delete cached aggregates of word collections when word image changes."""
+    invalidate_collections_aggregates(words_ids=[instance.word_id])
+
+
+@receiver(m2m_changed, sender=WordsInCollections)
+@receiver(m2m_changed, sender=WordImageAssociations)
+def invalidate_collections_aggregates_on_m2m_change(
+    sender, instance, action, model, pk_set, *args, **kwargs
+) -> None:
+    """
+    Delete collections cached aggregates when objects are added with related
+    managers methods (removal sends `post_delete` signals).
+    """
+    if action != 'post_add':
+        return
+    if sender is WordsInCollections:
+        if isinstance(instance, Collection):
+            invalidate_collections_aggregates([instance.pk])
+        else:
+            invalidate_collections_aggregates(pk_set)
+    elif isinstance(instance, Word):
+        invalidate_collections_aggregates(words_ids=[instance.pk])
+    else:
+        invalidate_collections_aggregates(words_ids=pk_set)
+
+
+@receiver(post_save, sender=Word)
+def invalidate_word_collections_aggregates_on_change(
+    sender, instance, created, update_fields=None, *args, **kwargs
+) -> None:
+    """Delete cached aggregates of word collections when word language changes."""
+    if created or update_fields is not None and 'language' not in update_fields:
+        return
+    invalidate_collections_aggregates(words_ids=[instance.pk])
+
+
+@receiver(post_save, sender=ImageAssociation)
+def invalidate_image_collections_aggregates(
+    sender, instance, created, *args, **kwargs
+) -> None:
+    """Delete cached aggregates of image words collections when image changes."""
+    if created:
+        return
+    invalidate_collections_aggregates(
+        words_ids=instance.words.values_list('pk', flat=True)
+    )
+
+
+# vocabulary modification markers are used as conditional requests validators,
+# versions are used in cached responses keys, marker and version of all users
+# are set when shared objects (languages) change
+VOCABULARY_MODIFIED_CACHE_KEY = 'vocabulary-modified-{user_id}'
+VOCABULARY_VERSION_CACHE_KEY = 'vocabulary-version-{user_id}'
+VOCABULARY_MODIFIED_CACHE_TIMEOUT = 60 * 60 * 24 * 30
+ALL_USERS_MARKER = 'all'
+
+
+def set_vocabulary_modified(modified: dict[str, set]) -> None:
+    """
+    Sets vocabulary modification markers of collected users and words authors to
+    current time and increments their vocabulary versions (words authors are
+    fetched with single query).
+    """
+    users_ids = set(modified['users'])
+    if modified['words']:
+        users_ids.update(
+            Word.objects.filter(pk__in=modified['words']).values_list(
+                'author_id', flat=True
+            )
+        )
+    cache.set_many(
+        {
+            VOCABULARY_MODIFIED_CACHE_KEY.format(user_id=user_id): timezone.now()
+            for user_id in users_ids
+        },
+        VOCABULARY_MODIFIED_CACHE_TIMEOUT,
+    )
+    for user_id in users_ids:
+        key = VOCABULARY_VERSION_CACHE_KEY.format(user_id=user_id)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # version is not set yet or expired
+            cache.add(key, time.time_ns(), VOCABULARY_MODIFIED_CACHE_TIMEOUT)
+
+
+vocabulary_modifications = TransactionCollector(set_vocabulary_modified)
+
+
+def mark_vocabulary_modified(users_ids=None, words_ids=None) -> None:
+    """
+    Marks vocabulary of given users or words authors (or of all users if None
+    passed) modified. Markers are set once after transaction commit, so
+    responses built before commit are not validated. Deleted words authors are
+    not fetched, words deletion marks them itself.
+    """
+    if words_ids is not None:
+        vocabulary_modifications.add('words', words_ids)
+    else:
+        vocabulary_modifications.add(
+            'users', (ALL_USERS_MARKER,) if users_ids is None else users_ids
+        )
+
+
+def get_vocabulary_modified(user_id) -> datetime:
+    """
+    Returns user's vocabulary last modification time (marker is set to current
+    time if it is not set yet).
+    """
+    user_key = VOCABULARY_MODIFIED_CACHE_KEY.format(user_id=user_id)
+    all_users_key = VOCABULARY_MODIFIED_CACHE_KEY.format(user_id=ALL_USERS_MARKER)
+    markers = cache.get_many([user_key, all_users_key])
+    if user_key not in markers:
+        cache.add(user_key, timezone.now(), VOCABULARY_MODIFIED_CACHE_TIMEOUT)
+        markers[user_key] = cache.get(user_key)
+    return max(marker for marker in markers.values() if marker is not None)
+
+
+def get_vocabulary_version(user_id) -> str:
+    """
+    Returns user's vocabulary version combined with version of all users. Missing
+    versions are initialized with current time in nanoseconds, so version never
+    repeats after cache eviction.
+    """
+    keys = [
+        VOCABULARY_VERSION_CACHE_KEY.format(user_id=user_id)
+        for user_id in (user_id, ALL_USERS_MARKER)
+    ]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if versions.get(key) is None:
+            cache.add(key, time.time_ns(), VOCABULARY_MODIFIED_CACHE_TIMEOUT)
+            versions[key] = cache.get(key)
+    return '.'.join(str(versions[key]) for key in keys)
+
+
+@receiver([post_save, post_delete], sender=Word)
+@receiver([post_save, post_delete], sender=FavoriteWord)
+@receiver([post_save, post_delete], sender=Collection)
+@receiver([post_save, post_delete], sender=FavoriteCollection)
+@receiver([post_save, post_delete], sender=WordTag)
+@receiver([post_save, post_delete], sender=WordType)
+@receiver([post_save, post_delete], sender=FormGroup)
+@receiver([post_save, post_delete], sender=ImageAssociation)
+@receiver([post_save, post_delete], sender=QuoteAssociation)
+@receiver([post_save, post_delete], sender=Definition)
+@receiver([post_save, post_delete], sender=UsageExample)
+@receiver([post_save, post_delete], sender=WordTranslation)
+@receiver([post_save, post_delete], sender=DefaultWordCards)
+@receiver([post_save, post_delete], sender='languages.UserLearningLanguage')
+@receiver([post_save, post_delete], sender='languages.UserNativeLanguage')
+@receiver([post_save, post_delete], sender='languages.Language')
+@receiver([post_save, post_delete], sender='languages.LanguageCoverImage')
+def mark_owner_vocabulary_modified(sender, instance, *args, **kwargs) -> None:
+    """
+    Set saved or deleted object owner's vocabulary modification marker (marker of
+    all users if owner is unknown).
+    """
+    mark_vocabulary_modified(users_ids=get_owners_ids(instance))
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def mark_user_vocabulary_modified(sender, instance, *args, **kwargs) -> None:
+    """Set user's vocabulary modification marker when user's profile changes."""
+    mark_vocabulary_modified(users_ids={instance.pk})
+
+
+@receiver([post_save, post_delete], sender=WordTranslations)
+@receiver([post_save, post_delete], sender=WordUsageExamples)
+@receiver([post_save, post_delete], sender=WordDefinitions)
+@receiver([post_save, post_delete], sender=WordImageAssociations)
+@receiver([post_save, post_delete], sender=WordQuoteAssociations)
+@receiver([post_save, post_delete], sender=WordsInCollections)
+@receiver([post_save, post_delete], sender=WordsFormGroups)
+@receiver([post_save, post_delete], sender=Synonym)
+@receiver([post_save, post_delete], sender=Antonym)
+@receiver([post_save, post_delete], sender=Form)
+@receiver([post_save, post_delete], sender=Similar)
+def mark_words_vocabulary_modified(sender, instance, *args, **kwargs) -> None:
+    """
+    Set words authors vocabulary modification markers when intermediary object
+    is saved or deleted.
+    """
+    if sender is WordsFormGroups:
+        words_ids = {instance.word_id}
+    else:
+        words_ids = {
+            getattr(instance, attr) for attr in word_counted_relations[sender][1]
+        }
+    mark_vocabulary_modified(words_ids=words_ids)
+
+
+@receiver(m2m_changed, sender=WordTranslations)
+@receiver(m2m_changed, sender=WordUsageExamples)
+@receiver(m2m_changed, sender=WordDefinitions)
+@receiver(m2m_changed, sender=WordImageAssociations)
+@receiver(m2m_changed, sender=WordQuoteAssociations)
+@receiver(m2m_changed, sender=WordsInCollections)
+@receiver(m2m_changed, sender=WordsFormGroups)
+@receiver(m2m_changed, sender=Synonym)
+@receiver(m2m_changed, sender=Antonym)
+@receiver(m2m_changed, sender=Form)
+@receiver(m2m_changed, sender=Similar)
+@receiver(m2m_changed, sender=Word.tags.through)
+@receiver(m2m_changed, sender=Word.types.through)
+def mark_vocabulary_modified_on_m2m_change(
+    sender, instance, action, model, pk_set, *args, **kwargs
+) -> None:
+    """
+    Set vocabulary modification markers when objects are added, removed with
+    related managers methods.
+    """
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    users_ids = get_owners_ids(instance)
+    if users_ids is None and pk_set and model is Word:
+        mark_vocabulary_modified(words_ids=pk_set)
+    else:
+        mark_vocabulary_modified(users_ids=users_ids)
@@ -0,0 +1,13 @@
+import os
+
+# Cache must be shared between application workers (users preferences and
+# vocabulary versions are invalidated on change) and must not query database
+# (it is read on most requests), so Redis cache is used by default
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv(
+            'CACHE_BACKEND', default='django.core.cache.backends.redis.RedisCache'
+        ),
+        'LOCATION': os.getenv('CACHE_LOCATION', default='redis://localhost:6379/0'),
+    }
+}
@@ -0,0 +1,12 @@
+"""Tests config."""
+
+from .settings import *  # noqa: F403
+
+# Tests run in single process without Redis server, so local memory cache is
+# used: as Redis cache used in production, it keeps data in memory and does not
+# query database, so routes queries budgets match production ones
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
@@ -1,12 +1,82 @@
+import time
 import pytest
+from itertools import chain
+
 from rest_framework.test import APIClient
 from rest_framework.authtoken.models import Token
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from model_bakery import baker
 
+from apps.vocabulary.models import (
+    Word,
+    WordTag,
+    WordType,
+    WordTranslation,
+    WordTranslations,
+    Definition,
+    WordDefinitions,
+    UsageExample,
+    WordUsageExamples,
+    ImageAssociation,
+    WordImageAssociations,
+    QuoteAssociation,
+    WordQuoteAssociations,
+    Collection,
+    WordsInCollections,
+    Synonym,
+    Antonym,
+    Form,
+    Similar,
+    FavoriteWord,
+    FavoriteCollection,
+    WordCounter,
+    WordSearchDocument,
+)
+from apps.languages.models import Language, UserLearningLanguage, UserNativeLanguage
+
+from .query_budgets import LATENCY_FACTOR, QUERY_BUDGETS, SEEDED_WORDS_AMOUNT
+
 User = get_user_model()
 
 
+@pytest.fixture(autouse=True)
+def clear_cache(request):
+    """
+    Clears cache between tests with database access, as database objects ids
+    may be reused after rollbacks.
+    """
+    uses_db = request.node.get_closest_marker('django_db') or {
+        'db',
+        'transactional_db',
+    } & set(request.fixturenames)
+    if not uses_db:
+        yield
+        return
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def run_commit_callbacks():
+    """
+    Returns function to run and clear transaction commit callbacks registered in
+    test transaction (including ones registered by callbacks), as if data written
+    by test so far was committed.
+    """
+
+    def run_callbacks() -> None:
+        while connection.run_on_commit:
+            callbacks, connection.run_on_commit = connection.run_on_commit, []
+            for _, callback, _ in callbacks:
+                callback()
+
+    return run_callbacks
+
+
 @pytest.fixture
 def api_client():
     return APIClient
@@ -26,3 +96,176 @@ def auth_api_client():
 @pytest.fixture
 def user():
     return baker.make(User, username='test_user')
+
+
+@pytest.fixture
+def large_vocabulary(request):
+    """
+    Seeds user vocabulary with given amount of words with all related objects
+    (bulk inserts are used, so words counters and search documents are rebuilt
+    after seeding). Returns dict of seeded objects lookups to use in urls.
+    """
+
+    def get_large_vocabulary(user, words_amount=SEEDED_WORDS_AMOUNT, **kwargs):
+        language = baker.make(Language, learning_available=True)
+        native_language = baker.make(Language)
+        UserLearningLanguage.objects.create(user=user, language=language)
+        UserNativeLanguage.objects.create(user=user, language=native_language)
+
+        words = Word.objects.bulk_create(
+            baker.prepare(Word, author=user, language=language, _quantity=words_amount),
+            batch_size=1000,
+        )
+
+        def bulk_make(model, amount, **fields):
+            return model.objects.bulk_create(
+                baker.prepare(model, author=user, _quantity=amount, **fields),
+                batch_size=1000,
+            )
+
+        def bulk_relate(through_model, field, objs, step=1):
+            through_model.objects.bulk_create(
+                (
+                    through_model(word=word, **{field: objs[index // step]})
+                    for index, word in enumerate(words[: len(objs) * step])
+                ),
+                batch_size=1000,
+            )
+
+        translations = bulk_make(
+            WordTranslation, words_amount, language=native_language
+        )
+        bulk_relate(WordTranslations, 'translation', translations)
+        # every word has two translations
+        WordTranslations.objects.bulk_create(
+            (
+                WordTranslations(word=word, translation=translation)
+                for word, translation in zip(words, translations[1:])
+            ),
+            batch_size=1000,
+        )
+        definitions = bulk_make(Definition, words_amount, language=language)
+        bulk_relate(WordDefinitions, 'definition', definitions)
+        examples = bulk_make(UsageExample, words_amount, language=language)
+        bulk_relate(WordUsageExamples, 'example', examples)
+        images = bulk_make(
+            ImageAssociation, words_amount // 10 or 1, image_url='image.jpg'
+        )
+        bulk_relate(WordImageAssociations, 'image', images, step=10)
+        quotes = bulk_make(QuoteAssociation, words_amount // 10 or 1)
+        bulk_relate(WordQuoteAssociations, 'quote', quotes, step=10)
+
+        tags = [
+            WordTag.objects.create(author=user, name=f'tag{index}')
+            for index in range(20)
+        ]
+        Word.tags.through.objects.bulk_create(
+            (
+                Word.tags.through(word=word, wordtag=tags[index % len(tags)])
+                for index, word in enumerate(words)
+            ),
+            batch_size=1000,
+        )
+        types = baker.make(WordType, _quantity=5)
+        Word.types.through.objects.bulk_create(
+            (
+                Word.types.through(word=word, wordtype=types[index % len(types)])
+                for index, word in enumerate(words)
+            ),
+            batch_size=1000,
+        )
+
+        collections = [
+            baker.make(Collection, author=user, title=f'collection {index}')
+            for index in range(20)
+        ]
+        WordsInCollections.objects.bulk_create(
+            (
+                WordsInCollections(
+                    word=word, collection=collections[index % len(collections)]
+                )
+                for index, word in enumerate(words)
+            ),
+            batch_size=1000,
+        )
+
+        # symmetrical relations between neighbouring words
+        for model in (Synonym, Antonym, Form, Similar):
+            model.objects.bulk_create(
+                chain.from_iterable(
+                    (
+                        model(from_word=first_word, to_word=second_word),
+                        model(from_word=second_word, to_word=first_word),
+                    )
+                    for first_word, second_word in zip(words[::2], words[1::2])
+                ),
+                batch_size=1000,
+            )
+
+        FavoriteWord.objects.bulk_create(
+            FavoriteWord(user=user, word=word) for word in words[:50]
+        )
+        FavoriteCollection.objects.bulk_create(
+            FavoriteCollection(user=user, collection=collection)
+            for collection in collections[:5]
+        )
+
+        WordCounter.objects.bulk_create(
+            (WordCounter(word=word) for word in words), batch_size=1000
+        )
+        WordCounter.refresh()
+        WordSearchDocument.objects.bulk_create(
+            (WordSearchDocument(word=word) for word in words), batch_size=1000
+        )
+        WordSearchDocument.refresh()
+
+        return {
+            'words': words,
+            'collections': collections,
+            'word': words[0].slug,
+            'word_id': words[0].id,
+            'related_word': words[1].slug,
+            'translation': translations[0].slug,
+            'definition': definitions[0].slug,
+            'example': examples[0].slug,
+            'image': images[0].id,
+            'quote': quotes[0].id,
+            'collection': collections[0].slug,
+            'language': language.isocode,
+        }
+
+    return get_large_vocabulary
+
+
+@pytest.fixture
+def check_query_budget():
+    """
+    Requests given route with passed client and asserts that database queries
+    amount and response time are within route budget.
+    """
+
+    def check(client, route, **lookups):
+        url, max_queries_amount, max_response_time = QUERY_BUDGETS[route]
+        url = url.format(**lookups)
+
+        with CaptureQueriesContext(connection) as context:
+            start_time = time.monotonic()
+            response = client.get(url)
+            if response.status_code == 307:
+                response = client.get(response['Location'])
+            response_time = time.monotonic() - start_time
+
+        assert (
+            response.status_code == 200
+        ), f'Route `{route}` ({url}) returned {response.status_code} status code'
+        assert len(context.captured_queries) <= max_queries_amount, (
+            f'Route `{route}` ({url}) made {len(context.captured_queries)} '
+            f'database queries, budget is {max_queries_amount}'
+        )
+        assert response_time <= max_response_time * LATENCY_FACTOR, (
+            f'Route `{route}` ({url}) responded in {response_time:.3f}s, '
+            f'budget is {max_response_time * LATENCY_FACTOR:.3f}s'
+        )
+        return response
+
+    return check
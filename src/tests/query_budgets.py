@@ -0,0 +1,154 @@
+"""
+Database queries and response time budgets for API read routes.
+
+Every route is requested by the user with large seeded vocabulary (see
+`large_vocabulary` fixture), so budgets must not depend on objects amount:
+route that queries database for every listed object exceeds its budget.
+Url placeholders are replaced with seeded objects lookups.
+"""
+
+import os
+
+# Words amount seeded for the user before every budget check
+SEEDED_WORDS_AMOUNT = int(os.getenv('QUERY_BUDGETS_WORDS_AMOUNT', default=2000))
+
+# Response time ceilings are multiplied by this factor (to run on slow machines)
+LATENCY_FACTOR = float(os.getenv('QUERY_BUDGETS_LATENCY_FACTOR', default=1))
+
+# Routes names prefix to check budgets within exercises tests (with exercises data)
+EXERCISES_ROUTES_PREFIX = 'exercises-'
+
+# route name: (url, max queries amount, max response time in seconds)
+QUERY_BUDGETS = {
+    'vocabulary-list': ('/api/vocabulary/', 13, 2.0),
+    'vocabulary-list-search': ('/api/vocabulary/?search=word', 13, 2.0),
+    'vocabulary-list-cursor': ('/api/vocabulary/?pagination=cursor', 12, 2.0),
+    'vocabulary-detail': ('/api/vocabulary/{word}/', 43, 1.0),
+    'vocabulary-random': ('/api/vocabulary/random/', 15, 1.0),
+    'vocabulary-favorites': ('/api/vocabulary/favorites/', 15, 1.0),
+    'vocabulary-share': ('/api/vocabulary/share/{word_id}/', 44, 1.0),
+    'vocabulary-share-link': ('/api/vocabulary/{word}/share-link/', 4, 0.5),
+    'vocabulary-tags': ('/api/vocabulary/{word}/tags/', 7, 0.5),
+    'vocabulary-collections': ('/api/vocabulary/{word}/collections/', 10, 0.5),
+    'vocabulary-translations': ('/api/vocabulary/{word}/translations/', 13, 0.5),
+    'vocabulary-translations-detail': (
+        '/api/vocabulary/{word}/translations/{translation}/',
+        10,
+        0.5,
+    ),
+    'vocabulary-definitions': ('/api/vocabulary/{word}/definitions/', 9, 0.5),
+    'vocabulary-definitions-detail': (
+        '/api/vocabulary/{word}/definitions/{definition}/',
+        10,
+        0.5,
+    ),
+    'vocabulary-examples': ('/api/vocabulary/{word}/examples/', 9, 0.5),
+    'vocabulary-examples-detail': (
+        '/api/vocabulary/{word}/examples/{example}/',
+        10,
+        0.5,
+    ),
+    'vocabulary-synonyms': ('/api/vocabulary/{word}/synonyms/', 22, 0.5),
+    'vocabulary-synonyms-detail': (
+        '/api/vocabulary/{word}/synonyms/{related_word}/',
+        23,
+        0.5,
+    ),
+    'vocabulary-antonyms': ('/api/vocabulary/{word}/antonyms/', 22, 0.5),
+    'vocabulary-antonyms-detail': (
+        '/api/vocabulary/{word}/antonyms/{related_word}/',
+        23,
+        0.5,
+    ),
+    'vocabulary-forms': ('/api/vocabulary/{word}/forms/', 22, 0.5),
+    'vocabulary-forms-detail': (
+        '/api/vocabulary/{word}/forms/{related_word}/',
+        23,
+        0.5,
+    ),
+    'vocabulary-similars': ('/api/vocabulary/{word}/similars/', 22, 0.5),
+    'vocabulary-similars-detail': (
+        '/api/vocabulary/{word}/similars/{related_word}/',
+        23,
+        0.5,
+    ),
+    'vocabulary-associations': ('/api/vocabulary/{word}/associations/', 9, 0.5),
+    'vocabulary-images': ('/api/vocabulary/{word}/images/', 8, 0.5),
+    'vocabulary-images-detail': ('/api/vocabulary/{word}/images/{image}/', 9, 0.5),
+    'vocabulary-quotes': ('/api/vocabulary/{word}/quotes/', 8, 0.5),
+    'vocabulary-quotes-detail': ('/api/vocabulary/{word}/quotes/{quote}/', 9, 0.5),
+    'translations-list': ('/api/translations/', 8, 2.0),
+    'translations-detail': ('/api/translations/{translation}/', 25, 1.0),
+    'definitions-list': ('/api/definitions/', 8, 2.0),
+    'definitions-detail': ('/api/definitions/{definition}/', 25, 1.0),
+    'examples-list': ('/api/examples/', 8, 2.0),
+    'examples-detail': ('/api/examples/{example}/', 25, 1.0),
+    'synonyms-detail': ('/api/synonyms/{word}/', 25, 1.0),
+    'antonyms-detail': ('/api/antonyms/{word}/', 25, 1.0),
+    'similars-detail': ('/api/similars/{word}/', 25, 1.0),
+    'tags-list': ('/api/tags/', 4, 1.0),
+    'types-list': ('/api/types/', 4, 1.0),
+    'forms-groups-list': ('/api/forms-groups/', 6, 1.0),
+    'images-list': ('/api/images/', 7, 2.0),
+    'images-detail': ('/api/images/{image}/', 24, 1.0),
+    'quotes-detail': ('/api/quotes/{quote}/', 24, 1.0),
+    'associations-list': ('/api/associations/', 8, 2.0),
+    'collections-list': ('/api/collections/', 9, 2.0),
+    'collections-detail': ('/api/collections/{collection}/', 27, 2.0),
+    'collections-favorites': ('/api/collections/favorites/', 10, 1.0),
+    'collections-images': ('/api/collections/{collection}/images/', 13, 2.0),
+    'collections-translations': (
+        '/api/collections/{collection}/translations/',
+        14,
+        2.0,
+    ),
+    'collections-definitions': ('/api/collections/{collection}/definitions/', 14, 2.0),
+    'collections-examples': ('/api/collections/{collection}/examples/', 14, 2.0),
+    'languages-list': ('/api/languages/', 13, 2.0),
+    'languages-detail': ('/api/languages/{language}/', 16, 1.0),
+    'languages-collections': ('/api/languages/{language}/collections/', 12, 1.0),
+    'languages-all': ('/api/languages/all/', 4, 1.0),
+    'languages-native': ('/api/languages/native/', 5, 0.5),
+    'languages-learning-available': ('/api/languages/learning-available/', 4, 0.5),
+    'languages-cover-choices': ('/api/languages/{language}/cover-choices/', 7, 0.5),
+    'global-languages-list': ('/api/global-languages/', 4, 0.5),
+    'global-languages-interface': ('/api/global-languages/interface/', 6, 0.5),
+    'main-list': ('/api/main/', 46, 3.0),
+    'users-list': ('/api/users/', 5, 0.5),
+    'exercises-list': ('/api/exercises/', 14, 0.5),
+    'exercises-anonymous': ('/api/exercises/anonymous/', 20, 0.5),
+    'exercises-favorites': ('/api/exercises/favorites/', 14, 0.5),
+    'exercises-detail': ('/api/exercises/{exercise}/', 12, 1.0),
+    'exercises-word-sets': ('/api/exercises/{exercise}/word-sets/', 9, 1.0),
+    'exercises-word-sets-detail': (
+        '/api/exercises/{exercise}/word-sets/{word_set}/',
+        15,
+        1.0,
+    ),
+    'exercises-last-approach': ('/api/exercises/{exercise}/last-approach/', 25, 1.0),
+    'exercises-available-words': (
+        '/api/exercises/{exercise}/available-words/',
+        23,
+        2.0,
+    ),
+    'exercises-available-collections': (
+        '/api/exercises/{exercise}/available-collections/',
+        7,
+        2.0,
+    ),
+    'exercises-translator-default-settings': (
+        '/api/exercises/translator-default-settings/',
+        5,
+        0.5,
+    ),
+    'exercises-session': ('/api/exercises/{exercise}/session/?amount=50', 13, 1.0),
+}
+
+
+def get_routes_params(exercises_routes: bool = False) -> list[str]:
+    """Returns exercises or other routes names as tests parameters."""
+    return [
+        route
+        for route in QUERY_BUDGETS
+        if route.startswith(EXERCISES_ROUTES_PREFIX) == exercises_routes
+    ]
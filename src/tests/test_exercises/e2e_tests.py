@@ -3,11 +3,21 @@ import pytest
 import logging
 from model_bakery import baker
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 
 from apps.vocabulary.models import Word, WordTranslation, Collection
-from apps.exercises.models import FavoriteExercise, TranslatorUserDefaultSettings
+from apps.core.models import ActivityStatusModel
+from apps.exercises.models import (
+    ExerciseHistoryDetails,
+    FavoriteExercise,
+    Hint,
+    TranslatorUserDefaultSettings,
+    UsersExercisesHistory,
+)
+from apps.exercises.constants import hints_codes
 
 logger = logging.getLogger(__name__)
 
@@ -125,6 +135,78 @@ class TestExercisesEndpoints:
 
         assert response.status_code == 200
         assert response_content['collections']['count'] == 2
+        assert [
+            collection['available_words_count']
+            for collection in response_content['collections']['results']
+        ] == [1, 1]
+
+    def test_retrieve_session(self, auth_api_client, user, exercises):
+        """
+        Сессия упражнения строится по настройкам пользователя: каждое слово с
+        переводами повторяется заданное количество раз, задания содержат
+        варианты ответа и подсказки, количество запросов не зависит от
+        количества заданий.
+        """
+        exercise = exercises(
+            extra_data={'available': True, 'name': 'translator', 'slug': 'translator'}
+        )[0]
+        exercise.hints_available.set(
+            [
+                baker.make(Hint, code=hints_codes.SHOW_FIRST_LETTER),
+                baker.make(Hint, code=hints_codes.REMOVE_INCORRECT),
+            ]
+        )
+        TranslatorUserDefaultSettings.objects.create(
+            user=user,
+            mode=UsersExercisesHistory.VARIANTS,
+            repetitions_amount=2,
+            from_language=TranslatorUserDefaultSettings.FROM_LEARNING,
+        )
+        words = baker.make(Word, author=user, _quantity=3, _fill_optional=True)
+        for word in words:
+            word.translations.add(
+                *baker.make(
+                    WordTranslation, author=user, _quantity=2, _fill_optional=True
+                )
+            )
+        baker.make(Word, author=user, _fill_optional=True)
+        Word.objects.filter(author=user).update(next_exercise_date=None)
+
+        def retrieve(amount):
+            response = auth_api_client(user).get(
+                f'{self.endpoint}{exercise.slug}/session/?amount={amount}'
+            )
+            if response.status_code == 307:
+                response = auth_api_client(user).get(response['Location'])
+            assert response.status_code == 200
+            return json.loads(response.content)
+
+        response_content = retrieve(10)
+
+        assert len(response_content['tasks']) == 6
+        assert response_content['hints_available'] == sorted(
+            (hints_codes.REMOVE_INCORRECT, hints_codes.SHOW_FIRST_LETTER)
+        )
+        for task in response_content['tasks']:
+            word = Word.objects.get(slug=task['word'])
+            assert task['question'] == word.text
+            assert sorted(task['answers']) == sorted(
+                word.translations.values_list('text', flat=True)
+            )
+            assert len(set(task['options']) & set(task['answers'])) == 1
+            assert task['hints'][hints_codes.REMOVE_INCORRECT] not in task['answers']
+            assert task['hints'][hints_codes.SHOW_FIRST_LETTER] in {
+                answer[0] for answer in task['answers']
+            }
+
+        with CaptureQueriesContext(connection) as one_word_queries:
+            retrieve(1)
+        with CaptureQueriesContext(connection) as all_words_queries:
+            retrieve(10)
+
+        # words and options are sampled by random keys, each sampling takes from
+        # one to four queries (three probes rounds and fallback query)
+        assert abs(len(one_word_queries) - len(all_words_queries)) <= 2 * 3
 
     def test_retrieve_last_approach(
         self, auth_api_client, user, exercises, exercise_history
@@ -141,6 +223,173 @@ class TestExercisesEndpoints:
 
         assert response.status_code == 200
 
+    def test_create_approach(self, auth_api_client, user, exercises):
+        """
+        Подход сохраняется вместе со всеми ответами и использованными
+        подсказками, статусы и дата последнего упражнения слов обновляются.
+        """
+        exercise = exercises(extra_data={'available': True})[0]
+        hint = baker.make(Hint, code=hints_codes.SHOW_FIRST_LETTER)
+        exercise.hints_available.add(hint)
+        inactive_word, active_word = baker.make(
+            Word, author=user, _quantity=2, _fill_optional=True
+        )
+        Word.objects.filter(pk=active_word.pk).update(
+            activity_status=ActivityStatusModel.ACTIVE
+        )
+        translation = baker.make(WordTranslation, author=user, _fill_optional=True)
+        answers = [
+            {
+                'word': inactive_word.slug,
+                'translation': translation.slug,
+                'text_answer': translation.text,
+                'verdict': ExerciseHistoryDetails.INCORRECT,
+                'hints_used': [hint.code],
+            },
+            {
+                'word': active_word.slug,
+                'text_answer': 'answer',
+                'verdict': ExerciseHistoryDetails.CORRECT,
+                'answer_time': '00:00:10',
+            },
+            {
+                'word': active_word.slug,
+                'text_answer': 'answer',
+                'verdict': ExerciseHistoryDetails.CORRECT,
+            },
+        ]
+
+        response = auth_api_client(user).post(
+            f'{self.endpoint}{exercise.slug}/approaches/',
+            data={'mode': UsersExercisesHistory.VARIANTS, 'answers': answers},
+            format='json',
+        )
+        if response.status_code == 307:
+            response = auth_api_client(user).post(
+                response['Location'],
+                data={'mode': UsersExercisesHistory.VARIANTS, 'answers': answers},
+                format='json',
+            )
+        response_content = json.loads(response.content)
+
+        assert response.status_code == 201
+        assert response_content['words_amount'] == 2
+        assert response_content['corrects_amount'] == 2
+        assert response_content['incorrects_amount'] == 1
+        assert len(response_content['details']) == 3
+        assert response_content['status_counters'] == {
+            ActivityStatusModel.ACTIVE: 1,
+            ActivityStatusModel.MASTERED: 1,
+        }
+        approach = user.exercises_history.get()
+        assert list(approach.hints_available.all()) == [hint]
+        assert list(
+            approach.details.filter(hints_used=hint).values_list(
+                'task_word', 'task_translation'
+            )
+        ) == [(inactive_word.pk, translation.pk)]
+        assert dict(
+            Word.objects.filter(
+                last_exercise_date__gte=approach.created,
+                pk__in=(inactive_word.pk, active_word.pk),
+            ).values_list('pk', 'activity_status')
+        ) == {
+            inactive_word.pk: ActivityStatusModel.ACTIVE,
+            active_word.pk: ActivityStatusModel.MASTERED,
+        }
+
+    def test_approach_schedules_words(self, auth_api_client, user, exercises):
+        """
+        Интервал повторения слова растет с каждым правильным ответом и
+        сбрасывается после неправильного, слово выбирается в сессию упражнения
+        в первую очередь, когда подходит дата его следующего упражнения.
+        """
+        exercise = exercises(
+            extra_data={'available': True, 'name': 'translator', 'slug': 'translator'}
+        )[0]
+        word, *other_words = baker.make(
+            Word, author=user, _quantity=3, _fill_optional=True
+        )
+        Word.objects.filter(author=user).update(next_exercise_date=None)
+        for obj in (word, *other_words):
+            obj.translations.add(
+                baker.make(WordTranslation, author=user, _fill_optional=True)
+            )
+
+        def submit(verdict):
+            data = {
+                'answers': [
+                    {'word': word.slug, 'text_answer': 'answer', 'verdict': verdict}
+                ]
+            }
+            response = auth_api_client(user).post(
+                f'{self.endpoint}{exercise.slug}/approaches/', data=data, format='json'
+            )
+            if response.status_code == 307:
+                response = auth_api_client(user).post(
+                    response['Location'], data=data, format='json'
+                )
+            assert response.status_code == 201
+            word.refresh_from_db()
+            return word.exercise_interval.days
+
+        assert submit(ExerciseHistoryDetails.CORRECT) == 1
+        assert submit(ExerciseHistoryDetails.CORRECT) == 6
+        assert submit(ExerciseHistoryDetails.CORRECT) == 16
+        assert word.next_exercise_date == (
+            word.last_exercise_date + timezone.timedelta(days=16)
+        )
+        assert submit(ExerciseHistoryDetails.INCORRECT) == 1
+        assert word.exercise_repetitions == 0
+
+        Word.objects.filter(pk=word.pk).update(
+            next_exercise_date=timezone.now() - timezone.timedelta(hours=1)
+        )
+        response = auth_api_client(user).get(
+            f'{self.endpoint}{exercise.slug}/session/?amount=1'
+        )
+        if response.status_code == 307:
+            response = auth_api_client(user).get(response['Location'])
+        response_content = json.loads(response.content)
+
+        assert response.status_code == 200
+        assert {task['word'] for task in response_content['tasks']} == {word.slug}
+
+    def test_create_approach_unknown_words(self, auth_api_client, user, exercises):
+        """
+        Подход с чужими словами или недоступными подсказками не сохраняется.
+        """
+        exercise = exercises(extra_data={'available': True})[0]
+        other_word = baker.make(Word, _fill_optional=True)
+        word = baker.make(Word, author=user, _fill_optional=True)
+        last_exercise_date = word.last_exercise_date
+
+        for answer in (
+            {'word': other_word.slug, 'hints_used': []},
+            {'word': word.slug, 'hints_used': [hints_codes.SHOW_FIRST_LETTER]},
+        ):
+            data = {
+                'answers': [
+                    {
+                        **answer,
+                        'text_answer': 'answer',
+                        'verdict': ExerciseHistoryDetails.CORRECT,
+                    }
+                ]
+            }
+            response = auth_api_client(user).post(
+                f'{self.endpoint}{exercise.slug}/approaches/', data=data, format='json'
+            )
+            if response.status_code == 307:
+                response = auth_api_client(user).post(
+                    response['Location'], data=data, format='json'
+                )
+
+            assert response.status_code == 400
+        assert not user.exercises_history.exists()
+        word.refresh_from_db()
+        assert word.last_exercise_date == last_exercise_date
+
     def test_set_list(self, auth_api_client, user, exercises, word_sets):
         exercise = exercises(extra_data={'available': True})[0]
         word_sets(extra_data={'author': user, 'exercise': exercise})
@@ -269,6 +518,33 @@ class TestExercisesEndpoints:
 
         assert response.status_code == 200
 
+    def test_default_settings_cache_invalidated(self, auth_api_client, user):
+        """
+        Настройки пользователя кэшируются, после изменения настроек возвращаются
+        обновленные значения.
+        """
+        client = auth_api_client(user)
+        url = f'{self.endpoint}translator-default-settings/'
+        TranslatorUserDefaultSettings.objects.create(user=user, repetitions_amount=2)
+
+        def get_settings():
+            response = client.get(url)
+            if response.status_code == 307:
+                response = client.get(response['Location'])
+            assert response.status_code == 200
+            return response.data
+
+        assert get_settings()['repetitions_amount'] == 2
+
+        response = client.patch(url, data={'repetitions_amount': 4}, format='json')
+        if response.status_code == 307:
+            response = client.patch(
+                response['Location'], data={'repetitions_amount': 4}, format='json'
+            )
+        assert response.status_code == 200
+
+        assert get_settings()['repetitions_amount'] == 4
+
     def test_word_favorites_list_action(self, auth_api_client, user, exercises):
         exercise = exercises()[0]
         FavoriteExercise.objects.create(user=user, exercise=exercise)
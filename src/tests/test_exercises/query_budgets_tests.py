@@ -0,0 +1,66 @@
+import pytest
+from model_bakery import baker
+
+from apps.exercises.models import (
+    FavoriteExercise,
+    TranslatorUserDefaultSettings,
+    WordsUpdateHistory,
+)
+from apps.exercises.constants import exercises_lookups
+from tests.query_budgets import get_routes_params
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.e2e,
+    pytest.mark.exercises,
+    pytest.mark.query_budgets,
+]
+
+
+@pytest.mark.parametrize('route', get_routes_params(exercises_routes=True))
+def test_query_budget(
+    auth_api_client,
+    user,
+    large_vocabulary,
+    check_query_budget,
+    exercises,
+    exercise_history,
+    word_sets,
+    route,
+):
+    """
+    Количество запросов к базе данных для маршрута упражнений с большим
+    словарем и историей упражнений пользователя не превышает бюджет маршрута.
+    """
+    lookups = large_vocabulary(user)
+    exercise = exercises(
+        extra_data={
+            'available': True,
+            'name': exercises_lookups.TRANSLATOR_EXERCISE_SLUG,
+            'slug': exercises_lookups.TRANSLATOR_EXERCISE_SLUG,
+        }
+    )[0]
+    exercises(extra_data={'available': False}, _quantity=3)
+    FavoriteExercise.objects.create(user=user, exercise=exercise)
+    TranslatorUserDefaultSettings.objects.get_or_create(user=user)
+
+    approaches = exercise_history(
+        extra_data={'user': user, 'exercise': exercise}, _quantity=20
+    )
+    for approach in approaches:
+        baker.make(
+            WordsUpdateHistory,
+            word=lookups['words'][0],
+            approach=approach,
+            _quantity=5,
+        )
+    word_set = word_sets(extra_data={'author': user, 'exercise': exercise})[0]
+    word_set.words.set(lookups['words'][:100])
+
+    check_query_budget(
+        auth_api_client(user),
+        route,
+        exercise=exercise.slug,
+        word_set=word_set.slug,
+        **lookups,
+    )
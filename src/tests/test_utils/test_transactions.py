@@ -0,0 +1,37 @@
+import pytest
+
+from django.db import transaction
+
+from utils.transactions import TransactionCollector
+
+pytestmark = [pytest.mark.utils]
+
+
+class TestTransactionCollector:
+    @pytest.mark.django_db
+    def test_collected_once_per_transaction(self, django_capture_on_commit_callbacks):
+        calls = []
+        collector = TransactionCollector(calls.append)
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            collector.add('key', [1, 2])
+            collector.add('key', [2, 3])
+            collector.add('other', [4])
+
+        assert len(callbacks) == 1
+        assert calls == [{'key': {1, 2, 3}, 'other': {4}}]
+
+    @pytest.mark.django_db
+    def test_rolled_back_values_reset(self, django_capture_on_commit_callbacks):
+        calls = []
+        collector = TransactionCollector(calls.append)
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            with pytest.raises(ValueError):
+                with transaction.atomic():
+                    collector.add('key', [1])
+                    raise ValueError
+            collector.add('key', [2])
+
+        assert len(callbacks) == 1
+        assert calls == [{'key': {2}}]
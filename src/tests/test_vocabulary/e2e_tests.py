@@ -3,6 +3,8 @@ import json
 import pytest
 import logging
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from django.db.models import Max, Min, Count
 from django.contrib.auth import get_user_model
@@ -21,6 +23,7 @@ from apps.vocabulary.models import (
     WordsInCollections,
     ImageAssociation,
     QuoteAssociation,
+    MainPageSnapshot,
 )
 from apps.languages.models import Language, UserLearningLanguage, UserNativeLanguage
 from apps.core.constants import AmountLimits
@@ -84,6 +87,271 @@ class TestVocabularyEndpoints:
 
         assert response.status_code == 401
 
+    def test_list_cursor_pagination(self, auth_api_client, user):
+        """
+        При запросе словаря с параметром `pagination=cursor` возвращаются все слова
+        пользователя по страницам без повторов, без подсчета общего количества.
+        """
+        user_words = baker.make(Word, author=user, _quantity=5, _fill_optional=True)
+        expected_slugs = [
+            word.slug
+            for word in sorted(
+                user_words, key=lambda word: (word.created, word.id), reverse=True
+            )
+        ]
+
+        response = auth_api_client(user).get(
+            self.endpoint, {'pagination': 'cursor', 'limit': 2}
+        )
+        slugs = []
+        while True:
+            if response.status_code == 307:
+                response = auth_api_client(user).get(response['Location'])
+            assert response.status_code == 200
+            assert 'count' not in response.data
+            slugs += [word['slug'] for word in response.data['results']]
+            if not response.data['next']:
+                break
+            response = auth_api_client(user).get(response.data['next'])
+
+        assert slugs == expected_slugs
+
+    @pytest.mark.parametrize(
+        'ordering, sort_key, reverse_ordering',
+        [
+            (
+                '-translations_count',
+                lambda word: word.translations.count(),
+                True,
+            ),
+            (
+                'last_exercise_date',
+                lambda word: (
+                    word.last_exercise_date is not None,
+                    word.last_exercise_date,
+                ),
+                False,
+            ),
+        ],
+    )
+    def test_list_cursor_pagination_tied_ordering(
+        self, auth_api_client, user, ordering, sort_key, reverse_ordering
+    ):
+        """
+        При запросе словаря с параметром `pagination=cursor` и сортировкой по полю
+        с повторяющимися или пустыми значениями возвращаются все слова
+        пользователя по страницам без пропусков и повторов в обе стороны.
+        """
+        user_words = baker.make(Word, author=user, _quantity=7, _fill_optional=True)
+        for word in user_words[:3]:
+            word.translations.add(
+                baker.make(WordTranslation, author=user, _fill_optional=True)
+            )
+        for word in user_words[::2]:
+            word.last_exercise_date = None
+            word.save()
+        # words with equal ordering field values are ordered by unique keys
+        user_words.sort(key=lambda word: (word.created, word.id), reverse=True)
+        expected_slugs = [
+            word.slug
+            for word in sorted(user_words, key=sort_key, reverse=reverse_ordering)
+        ]
+
+        client = auth_api_client(user)
+        response = client.get(
+            self.endpoint,
+            {'pagination': 'cursor', 'limit': 2, 'ordering': ordering},
+            follow=True,
+        )
+        pages = []
+        while True:
+            assert response.status_code == 200
+            pages.append([word['slug'] for word in response.data['results']])
+            if not response.data['next']:
+                break
+            response = client.get(response.data['next'])
+        previous_pages = [pages[-1]]
+        while response.data['previous']:
+            response = client.get(response.data['previous'])
+            assert response.status_code == 200
+            previous_pages.insert(
+                0, [word['slug'] for word in response.data['results']]
+            )
+
+        assert [slug for page in pages for slug in page] == expected_slugs
+        assert previous_pages == pages
+
+    @pytest.mark.parametrize('cards_type', ['standart', 'short', 'long'])
+    def test_list_cards_queries_amount(
+        self, auth_api_client, user, cards_type, run_commit_callbacks
+    ):
+        """
+        Количество запросов к базе данных при получении словаря не зависит
+        от количества слов на странице для всех типов карточек.
+        """
+
+        def make_words(amount):
+            words = baker.make(Word, author=user, _quantity=amount, _fill_optional=True)
+            for word in words:
+                word.translations.add(
+                    *baker.make(
+                        WordTranslation, author=user, _quantity=7, _fill_optional=True
+                    )
+                )
+                word.image_associations.add(
+                    baker.make(ImageAssociation, author=user, image_url='image.jpg')
+                )
+                baker.make(FavoriteWord, user=user, word=word)
+            return words
+
+        client = auth_api_client(user)
+
+        def get_queries_amount():
+            with CaptureQueriesContext(connection) as context:
+                response = client.get(self.endpoint, {'cards_type': cards_type})
+                if response.status_code == 307:
+                    response = client.get(response['Location'])
+            assert response.status_code == 200
+            return len(context.captured_queries), response.data['results']
+
+        make_words(2)
+        queries_amount, _ = get_queries_amount()
+        make_words(6)
+        run_commit_callbacks()
+        more_words_queries_amount, results = get_queries_amount()
+
+        assert more_words_queries_amount == queries_amount
+        assert len(results) == 8
+        assert all(word['favorite'] for word in results)
+
+    def test_list_long_cards_last_translations(self, auth_api_client, user):
+        """
+        В длинных карточках слов возвращаются 6 последних добавленных переводов,
+        количество остальных переводов и последняя добавленная ассоциация-картинка.
+        """
+        word = baker.make(Word, author=user, _fill_optional=True)
+        translations = baker.make(
+            WordTranslation, author=user, _quantity=8, _fill_optional=True
+        )
+        for translation in translations:
+            word.translations.add(translation)
+        for image_url in ('first.jpg', 'last.jpg'):
+            word.image_associations.add(
+                baker.make(ImageAssociation, author=user, image_url=image_url)
+            )
+
+        response = auth_api_client(user).get(self.endpoint, {'cards_type': 'long'})
+        if response.status_code == 307:
+            response = auth_api_client(user).get(response['Location'])
+
+        assert response.status_code == 200
+        word_card = response.data['results'][0]
+        assert word_card['last_6_translations'] == [
+            translation.text for translation in reversed(translations[2:])
+        ]
+        assert word_card['other_translations_count'] == 2
+        assert word_card['image'].endswith('last.jpg')
+
+    def test_list_sparse_fieldsets(self, auth_api_client, user):
+        """
+        При запросе словаря с параметрами `fields`, `expand` возвращаются только
+        запрошенные поля, связанные объекты пропущенных полей не запрашиваются.
+        """
+        words = baker.make(Word, author=user, _quantity=3, _fill_optional=True)
+        for word in words:
+            word.translations.add(
+                *baker.make(
+                    WordTranslation, author=user, _quantity=2, _fill_optional=True
+                )
+            )
+        client = auth_api_client(user)
+
+        def get_list(params):
+            with CaptureQueriesContext(connection) as context:
+                response = client.get(self.endpoint, params)
+                if response.status_code == 307:
+                    response = client.get(response['Location'])
+            assert response.status_code == 200
+            return len(context.captured_queries), response.data['results']
+
+        full_queries_amount, results = get_list({})
+        sparse_queries_amount, sparse_results = get_list({'fields': 'slug,text'})
+
+        assert sparse_queries_amount < full_queries_amount
+        assert sparse_results == [
+            {'slug': word['slug'], 'text': word['text']} for word in results
+        ]
+
+        _, expand_results = get_list({'expand': 'tags'})
+
+        assert 'tags' in expand_results[0]
+        assert 'translations' not in expand_results[0]
+        assert 'translations_count' in expand_results[0]
+
+    def test_retrieve_conditional_get(
+        self, auth_api_client, user, run_commit_callbacks
+    ):
+        """
+        При повторном запросе слова с полученным ETag возвращается 304,
+        после изменения словаря возвращаются новые данные. Last-Modified
+        не передается, так как его точность - одна секунда.
+        """
+        word = baker.make(Word, author=user, _fill_optional=True)
+        client = auth_api_client(user)
+
+        def retrieve(**headers):
+            response = client.get(f'{self.endpoint}{word.slug}/', **headers)
+            if response.status_code == 307:
+                response = client.get(response['Location'], **headers)
+            return response
+
+        response = retrieve()
+        etag = response['ETag']
+
+        assert response.status_code == 200
+        assert not response.has_header('Last-Modified')
+        assert retrieve(HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+        word.translations.add(
+            baker.make(WordTranslation, author=user, _fill_optional=True)
+        )
+        run_commit_callbacks()
+        response = retrieve(HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response['ETag'] != etag
+        assert response.data['translations_count'] == 1
+
+    def test_list_response_cache(self, auth_api_client, user, run_commit_callbacks):
+        """
+        Повторный запрос списка слов возвращается из кэша без запросов к базе
+        данных, после изменения словаря пользователя кэш не используется.
+        """
+        baker.make(Word, author=user, _quantity=2, _fill_optional=True)
+        client = auth_api_client(user)
+
+        def list_words():
+            response = client.get(self.endpoint)
+            if response.status_code == 307:
+                response = client.get(response['Location'])
+            return response
+
+        with CaptureQueriesContext(connection) as first_queries:
+            response = list_words()
+        with CaptureQueriesContext(connection) as second_queries:
+            cached_response = list_words()
+
+        assert cached_response.status_code == 200
+        assert cached_response.data == response.data
+        assert len(second_queries) < len(first_queries)
+
+        baker.make(Word, author=user, _fill_optional=True)
+        run_commit_callbacks()
+        response = list_words()
+
+        assert response.status_code == 200
+        assert response.data['count'] == 3
+
     @pytest.mark.parametrize(
         'order_field, reverse_ordering, format',
         [
@@ -240,6 +508,32 @@ class TestVocabularyEndpoints:
         )
         assert len(response.data['results']) == 1
 
+    def test_search_relevance_ordering(self, auth_api_client, user):
+        """
+        Найденные слова сортируются по релевантности: сначала слово с совпадающим
+        текстом, затем слова, начинающиеся с искомого текста.
+        """
+        translation = baker.make(WordTranslation, text='home', _fill_optional=True)
+        word_with_translation = baker.make(
+            Word, author=user, text='дом', _fill_optional=True
+        )
+        word_with_translation.translations.add(translation)
+        word_with_prefix = baker.make(
+            Word, author=user, text='homework', _fill_optional=True
+        )
+        word = baker.make(Word, author=user, text='home', _fill_optional=True)
+
+        response = auth_api_client(user).get(self.endpoint, {'search': 'Home'})
+        if response.status_code == 307:
+            response = auth_api_client(user).get(response['Location'])
+
+        assert response.status_code == 200
+        assert [obj['slug'] for obj in response.data['results']] == [
+            word.slug,
+            word_with_prefix.slug,
+            word_with_translation.slug,
+        ]
+
     @pytest.mark.parametrize(
         'filter_field, related_model',
         [
@@ -715,6 +1009,55 @@ class TestVocabularyEndpoints:
             'existing_object' in response.data
         ), 'В ответе с кодом 409 должен возвращаться параметр `existing_object`.'
 
+    def test_word_create_related_objs_existing_and_repeated(
+        self, auth_api_client, user, learning_language, native_language
+    ):
+        """
+        Существующие и повторяющиеся вложенные объекты не создаются заново,
+        при конфликте возвращается ошибка 409 с индексом вложенного объекта.
+        """
+        language = learning_language(user)
+        translations_language = native_language(user)
+        baker.make(
+            WordTranslation, author=user, language=translations_language, text='first'
+        )
+
+        def create_word(text, translations_texts):
+            source_json = {
+                'language': language.isocode,
+                'text': text,
+                'translations': [
+                    {
+                        'text': translation_text,
+                        'language': translations_language.isocode,
+                    }
+                    for translation_text in translations_texts
+                ],
+            }
+            response = auth_api_client(user).post(
+                self.endpoint, data=source_json, format='json'
+            )
+            if response.status_code == 307:
+                response = auth_api_client(user).post(
+                    response['Location'], data=source_json, format='json'
+                )
+            return response
+
+        response = create_word('word', ['first', 'second', 'second'])
+
+        assert response.status_code == 201
+        assert set(
+            Word.objects.get(author=user, text='word').translations.values_list(
+                'text', flat=True
+            )
+        ) == {'first', 'second'}
+        assert WordTranslation.objects.filter(author=user).count() == 2
+
+        response = create_word('other', ['third', 'Second'])
+
+        assert response.status_code == 409
+        assert response.data['conflict_object_index'] == 1
+
     def test_word_create_not_auth(self, api_client):
         """
         На запрос создания слова от неавторизованного пользователя
@@ -1014,6 +1357,7 @@ class TestVocabularyEndpoints:
         learning_language,
         res_name,
         request,
+        django_capture_on_commit_callbacks,
     ):
         """
         Вложенные объекты успешно обновляются при обновлении слова с валидными
@@ -1029,17 +1373,19 @@ class TestVocabularyEndpoints:
             fixture_name
         )(user, data=True, language=language)
 
-        response = auth_api_client(user).patch(
-            f'{self.endpoint}{word.slug}/',
-            data={objs_related_name: new_objs_source_data},
-            format='json',
-        )
-        if response.status_code == 307:
+        # objects without words are deleted after transaction commit
+        with django_capture_on_commit_callbacks(execute=True):
             response = auth_api_client(user).patch(
-                response['Location'],
+                f'{self.endpoint}{word.slug}/',
                 data={objs_related_name: new_objs_source_data},
                 format='json',
             )
+            if response.status_code == 307:
+                response = auth_api_client(user).patch(
+                    response['Location'],
+                    data={objs_related_name: new_objs_source_data},
+                    format='json',
+                )
 
         response_objs_content = json.loads(response.content)[
             res_name or objs_related_name
@@ -1139,6 +1485,58 @@ class TestVocabularyEndpoints:
         assert response.status_code == 200
         assert response.data['favorite'] == update_data['favorite']
 
+    def test_word_partial_update_related_objs_by_ids(
+        self, auth_api_client, user, learning_language, native_language
+    ):
+        """
+        Переданные по id переводы пользователя добавляются к слову, переводы
+        других пользователей не находятся.
+        """
+        language = learning_language(user)
+        translations_language = native_language(user)
+        word = baker.make(Word, author=user, language=language)
+        translations = [
+            baker.make(
+                WordTranslation, author=user, language=translations_language, text=text
+            )
+            for text in ('first', 'second', 'third')
+        ]
+        word.translations.add(translations[0])
+        other_translation = baker.make(
+            WordTranslation, language=translations_language, text='other'
+        )
+
+        def patch_translations(objs):
+            source_json = {
+                'translations': [
+                    {
+                        'id': str(obj.id),
+                        'text': obj.text,
+                        'language': translations_language.isocode,
+                    }
+                    for obj in objs
+                ]
+            }
+            response = auth_api_client(user).patch(
+                f'{self.endpoint}{word.slug}/', data=source_json, format='json'
+            )
+            if response.status_code == 307:
+                response = auth_api_client(user).patch(
+                    response['Location'], data=source_json, format='json'
+                )
+            return response
+
+        response = patch_translations(translations)
+
+        assert response.status_code == 200
+        assert set(word.translations.values_list('pk', flat=True)) == {
+            translation.pk for translation in translations
+        }
+
+        response = patch_translations([other_translation])
+
+        assert response.status_code == 404
+
     def test_word_partial_update_already_exist(
         self, auth_api_client, user, learning_language
     ):
@@ -1192,7 +1590,12 @@ class TestVocabularyEndpoints:
         ],
     )
     def test_word_destroy(
-        self, auth_api_client, user, objs_related_name, related_model
+        self,
+        auth_api_client,
+        user,
+        objs_related_name,
+        related_model,
+        django_capture_on_commit_callbacks,
     ):
         """
         Слово успешно удаляется при запросе от автора.
@@ -1204,9 +1607,11 @@ class TestVocabularyEndpoints:
         other_word = baker.make(Word, author=user, _fill_optional=True)
         other_word.__getattribute__(objs_related_name).add(objs[0])
 
-        response = auth_api_client(user).delete(f'{self.endpoint}{word.slug}/')
-        if response.status_code == 307:
-            response = auth_api_client(user).delete(response['Location'])
+        # objects without words are deleted after transaction commit
+        with django_capture_on_commit_callbacks(execute=True):
+            response = auth_api_client(user).delete(f'{self.endpoint}{word.slug}/')
+            if response.status_code == 307:
+                response = auth_api_client(user).delete(response['Location'])
 
         assert response.status_code in (204, 200)
         assert not related_model.objects.filter(pk=objs[1].id, author=user).exists()
@@ -1237,6 +1642,57 @@ class TestVocabularyEndpoints:
 
         assert response.status_code == 200
 
+    def test_random_words_amount(self, auth_api_client, user):
+        """
+        При передаче параметра `count` возвращается список из указанного
+        количества разных случайных слов с учетом фильтров.
+        """
+        words = baker.make(
+            Word, author=user, is_problematic=True, _quantity=5, _fill_optional=True
+        )
+        baker.make(Word, author=user, is_problematic=False, _fill_optional=True)
+
+        response = auth_api_client(user).get(
+            f'{self.endpoint}random/', {'count': 3, 'is_problematic': True}
+        )
+        if response.status_code == 307:
+            response = auth_api_client(user).get(response['Location'])
+
+        assert response.status_code == 200
+        assert len(response.data) == 3
+        assert len({word['slug'] for word in response.data}) == 3
+        assert {word['slug'] for word in response.data} <= {word.slug for word in words}
+
+    def test_random_words_amount_exceeds_vocabulary(self, auth_api_client, user):
+        """
+        Если в словаре меньше слов, чем передано в параметре `count`, возвращаются
+        все слова словаря без повторов.
+        """
+        words = baker.make(Word, author=user, _quantity=3, _fill_optional=True)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = auth_api_client(user).get(
+                f'{self.endpoint}random/', {'count': 10}, follow=True
+            )
+
+        assert response.status_code == 200
+        assert sorted(word['slug'] for word in response.data) == sorted(
+            word.slug for word in words
+        )
+        # probes are scalar subqueries, LIMIT in IN subquery is not supported by
+        # some databases
+        assert not any(
+            ' IN (SELECT' in query['sql'] for query in queries.captured_queries
+        )
+
+    def test_random_words_invalid_amount(self, auth_api_client, user):
+        """При передаче неправильного параметра `count` возвращается ошибка 400."""
+        response = auth_api_client(user).get(f'{self.endpoint}random/', {'count': 0})
+        if response.status_code == 307:
+            response = auth_api_client(user).get(response['Location'])
+
+        assert response.status_code == 400
+
     def test_random_word_action_not_auth(self, api_client):
         """
         На запрос получения случайного слова из своего словаря от неавторизованного
@@ -1383,6 +1839,109 @@ class TestVocabularyEndpoints:
 
         assert response.status_code == 401
 
+    def test_import_json_lines(
+        self, auth_api_client, user, learning_language, native_language
+    ):
+        """
+        Слова импортируются из JSON lines со связанными объектами, в ответе
+        возвращается результат импорта каждой строки.
+        """
+        language = learning_language(user)
+        translations_language = native_language(user)
+        existing_word = baker.make(Word, author=user, language=language, text='apple')
+        existing_tag = baker.make(WordTag, author=user, name='Food')
+        rows = [
+            {
+                'text': 'orange',
+                'language': language.isocode,
+                'tags': ['food', 'fruits'],
+                'translations': [
+                    {'text': 'апельсин', 'language': translations_language.isocode}
+                ],
+                'definitions': [{'text': 'A round juicy citrus fruit'}],
+                'examples': [{'text': 'I ate an orange', 'translation': ''}],
+            },
+            {'text': existing_word.text, 'language': language.isocode},
+            {'text': 'orange', 'language': language.isocode},
+            {'text': 'pear', 'language': translations_language.isocode},
+            {
+                'text': 'lemon',
+                'language': language.isocode,
+                'tags': [
+                    f'tag{i}'
+                    for i in range(AmountLimits.Vocabulary.MAX_TAGS_AMOUNT + 1)
+                ],
+            },
+        ]
+        body = '\n'.join(json.dumps(row) for row in rows) + '\nnot json\n'
+
+        response = auth_api_client(user).post(
+            f'{self.endpoint}import/', data=body, content_type='application/x-ndjson'
+        )
+        if response.status_code == 307:
+            response = auth_api_client(user).post(
+                response['Location'], data=body, content_type='application/x-ndjson'
+            )
+
+        assert response.status_code == 201
+        assert [row['status'] for row in response.data['rows']] == [
+            'created',
+            'exists',
+            'duplicate',
+            'error',
+            'error',
+            'error',
+        ]
+        assert response.data['created'] == 1
+        assert 'language' in response.data['rows'][3]['errors']
+        assert 'tags' in response.data['rows'][4]['errors']
+        word = Word.objects.get(author=user, text='orange')
+        assert word.slug == response.data['rows'][0]['slug']
+        assert set(word.tags.values_list('pk', flat=True)) == set(
+            WordTag.objects.filter(author=user).values_list('pk', flat=True)
+        )
+        assert existing_tag in word.tags.all()
+        assert word.translations.get().language == translations_language
+        assert word.definitions.get().language == language
+        assert word.examples.count() == 1
+        assert word.counters.tags_count == 2
+        assert word.counters.translations_count == 1
+        assert 'апельсин' in word.search_document.document
+
+    def test_import_csv(self, auth_api_client, user, learning_language):
+        """Слова импортируются из CSV, списки значений разделяются символом `|`."""
+        language = learning_language(user)
+        body = (
+            'text,language,tags,definitions\n'
+            f'orange,{language.isocode},food|fruits,A round juicy citrus fruit\n'
+            f'pear,{language.isocode},,\n'
+        )
+
+        response = auth_api_client(user).post(
+            f'{self.endpoint}import/', data=body, content_type='text/csv'
+        )
+        if response.status_code == 307:
+            response = auth_api_client(user).post(
+                response['Location'], data=body, content_type='text/csv'
+            )
+
+        assert response.status_code == 201
+        assert response.data['created'] == 2
+        assert Word.objects.filter(author=user).count() == 2
+        assert Word.objects.get(text='orange').tags.count() == 2
+
+    def test_import_unsupported_media_type(self, auth_api_client, user):
+        """На запрос импорта в неподдерживаемом формате возвращается ошибка 415."""
+        response = auth_api_client(user).post(
+            f'{self.endpoint}import/', data={}, format='json'
+        )
+        if response.status_code == 307:
+            response = auth_api_client(user).post(
+                response['Location'], data={}, format='json'
+            )
+
+        assert response.status_code == 415
+
     @pytest.mark.parametrize(
         'objs_related_name, related_model, res_name',
         [
@@ -2920,6 +3479,78 @@ class TestMainPageEndpoints:
         assert len(response_content['learning_languages']) == 1
         assert response_content['learning_languages_count'] == 1
 
+    def test_main_page_snapshots(
+        self, auth_api_client, user, learning_language, run_commit_callbacks
+    ):
+        """
+        Данные главной страницы сохраняются по разделам, при изменении объектов
+        пользователя пересобираются только связанные с ними разделы.
+        """
+        client = auth_api_client(user)
+        language = learning_language(user)
+        baker.make(Word, author=user, language=language, _quantity=3)
+        baker.make(Collection, author=user, _quantity=2)
+
+        def get_main_page():
+            with CaptureQueriesContext(connection) as context:
+                response = client.get(self.endpoint)
+                if response.status_code == 307:
+                    response = client.get(response['Location'])
+            assert response.status_code == 200
+            return len(context.captured_queries), json.loads(response.content)
+
+        first_queries_amount, first_content = get_main_page()
+        queries_amount, content = get_main_page()
+
+        assert queries_amount < first_queries_amount
+        assert content == first_content
+        assert MainPageSnapshot.objects.filter(user=user).count() == len(
+            MainPageSnapshot.sections
+        )
+
+        baker.make(Word, author=user, language=language)
+        run_commit_callbacks()
+
+        assert set(
+            MainPageSnapshot.objects.filter(user=user).values_list('section', flat=True)
+        ) == set(MainPageSnapshot.sections) - {'words', 'learning_languages'}
+        _, content = get_main_page()
+        assert content['words_count'] == 4
+        assert content['collections_count'] == 2
+
+    def test_main_page_due_words(self, auth_api_client, user, learning_language):
+        """
+        Для каждого изучаемого языка выводятся слова пользователя в порядке
+        даты следующего упражнения, слова без расписания не выводятся.
+        """
+        language = learning_language(user)
+        other_language = learning_language(user)
+        later_word, due_word, new_word = baker.make(
+            Word, author=user, language=language, _quantity=3
+        )
+        now = timezone.now()
+        Word.objects.filter(pk=later_word.pk).update(
+            next_exercise_date=now + timezone.timedelta(days=1),
+            exercise_interval=timezone.timedelta(days=21),
+        )
+        Word.objects.filter(pk=due_word.pk).update(
+            next_exercise_date=now - timezone.timedelta(days=1)
+        )
+
+        response = auth_api_client(user).get(self.endpoint)
+        if response.status_code == 307:
+            response = auth_api_client(user).get(response['Location'])
+        response_content = json.loads(response.content)
+
+        assert response.status_code == 200
+        assert response_content['next_due_words'][other_language.isocode] == []
+        due_words = response_content['next_due_words'][language.isocode]
+        assert [word['slug'] for word in due_words] == [
+            due_word.slug,
+            later_word.slug,
+        ]
+        assert [word['activity_progress'] for word in due_words] == [0, 100]
+
 
 @pytest.mark.associations
 class TestAssociationsEndpoints:
@@ -2942,7 +3573,44 @@ class TestAssociationsEndpoints:
         response_content = json.loads(response.content)
 
         assert response.status_code == 200
-        assert len(response_content) == len(objs)
+        assert len(response_content['results']) == len(objs)
+
+    def test_list_merged_feed_pagination(self, auth_api_client, user):
+        """
+        Ассоциации всех типов возвращаются единой лентой по дате создания,
+        страницы ленты получаются курсором.
+        """
+        quotes = baker.make(QuoteAssociation, author=user, _quantity=3)
+        images = baker.make(
+            ImageAssociation,
+            author=user,
+            image_url='https://example.com/1.png',
+            _quantity=3,
+        )
+        objs = sorted([*quotes, *images], key=lambda obj: obj.created, reverse=True)
+
+        response = auth_api_client(user).get(self.endpoint, {'limit': 4})
+        if response.status_code == 307:
+            response = auth_api_client(user).get(response['Location'])
+        response_content = json.loads(response.content)
+
+        assert response.status_code == 200
+        assert [data['id'] for data in response_content['results']] == [
+            str(obj.id) for obj in objs[:4]
+        ]
+        assert {data['association_type'] for data in response_content['results']} == {
+            'image',
+            'quote',
+        }
+
+        response = auth_api_client(user).get(response_content['next'])
+        response_content = json.loads(response.content)
+
+        assert response.status_code == 200
+        assert [data['id'] for data in response_content['results']] == [
+            str(obj.id) for obj in objs[4:]
+        ]
+        assert response_content['next'] is None
 
 
 @pytest.mark.word_collections
@@ -2982,6 +3650,55 @@ class TestWordCollectionsEndpoints:
         )
         assert len(response.data['results']) == len(objs)
 
+    def test_list_last_words(self, auth_api_client, user, run_commit_callbacks):
+        """
+        В списке коллекций для каждой коллекции возвращаются 4 последних добавленных
+        слова, количество запросов к базе данных не зависит от количества коллекций.
+        """
+        client = auth_api_client(user)
+
+        def make_collections(amount):
+            collections = baker.make(
+                Collection, author=user, _quantity=amount, _fill_optional=True
+            )
+            for collection in collections:
+                for word in baker.make(
+                    Word, author=user, _quantity=5, _fill_optional=True
+                ):
+                    collection.words.add(word)
+                    word.image_associations.add(
+                        baker.make(ImageAssociation, author=user, image_url='image.jpg')
+                    )
+            return collections
+
+        def get_collections():
+            with CaptureQueriesContext(connection) as context:
+                response = client.get(self.endpoint)
+                if response.status_code == 307:
+                    response = client.get(response['Location'])
+            assert response.status_code == 200
+            return len(context.captured_queries), response.data['results']
+
+        make_collections(1)
+        queries_amount, _ = get_collections()
+        collections = make_collections(3)
+        run_commit_callbacks()
+        more_collections_queries_amount, results = get_collections()
+
+        assert more_collections_queries_amount == queries_amount
+        for collection in collections:
+            expected_slugs = list(
+                WordsInCollections.objects.filter(collection=collection)
+                .order_by('-created')
+                .values_list('word__slug', flat=True)[:4]
+            )
+            collection_data = next(
+                result for result in results if result['slug'] == collection.slug
+            )
+            assert [
+                word['slug'] for word in collection_data['last_4_words']
+            ] == expected_slugs
+
     def test_create(self, auth_api_client, user, collections):
         _, source_data, expected_data = collections(user, make=False, data=True)
 
@@ -3164,6 +3881,97 @@ class TestWordCollectionsEndpoints:
         assert response_content[objs_related_name]['count'] == len(objs)
         assert len(response_content[objs_related_name]['results']) == len(objs)
 
+    def test_related_objs_distinct(
+        self, auth_api_client, user, collections, learning_language
+    ):
+        """
+        Объекты слов коллекции возвращаются без дублей и без объектов других слов.
+        """
+        collection = collections(user, make=True, data=False)[0]
+        language = learning_language(user)
+        words = baker.make(Word, author=user, language=language, _quantity=3)
+        collection.words.set(words[:2])
+        translation = baker.make(WordTranslation, author=user, language=language)
+        translation.words.set(words)
+        baker.make(WordTranslation, author=user, language=language).words.set(words[2:])
+
+        response = auth_api_client(user).get(
+            f'{self.endpoint}{collection.slug}/translations/',
+        )
+        if response.status_code == 307:
+            response = auth_api_client(user).get(response['Location'])
+
+        response_content = json.loads(response.content)
+
+        assert response.status_code == 200
+        assert response_content['translations']['count'] == 1
+        assert response_content['translations']['results'][0]['id'] == str(
+            translation.id
+        )
+
+    def test_retrieve_words_aggregates_cache(
+        self,
+        auth_api_client,
+        user,
+        collections,
+        learning_language,
+        run_commit_callbacks,
+    ):
+        """
+        Агрегаты слов коллекции кэшируются и пересчитываются после изменения слов
+        коллекции.
+        """
+        collection = collections(user, make=True, data=False)[0]
+        language = learning_language(user)
+        words = baker.make(Word, author=user, language=language, _quantity=2)
+        collection.words.add(words[0])
+        image = baker.make(
+            ImageAssociation, author=user, image_url='https://example.com/1.png'
+        )
+        image.words.set(words)
+
+        def retrieve():
+            response = auth_api_client(user).get(f'{self.endpoint}{collection.slug}/')
+            if response.status_code == 307:
+                response = auth_api_client(user).get(response['Location'])
+            assert response.status_code == 200
+            return json.loads(response.content)
+
+        with CaptureQueriesContext(connection) as first_queries:
+            response_content = retrieve()
+        assert response_content['words_images_count'] == 1
+        assert response_content['words_languages'][0]['words_count'] == 1
+
+        with CaptureQueriesContext(connection) as second_queries:
+            retrieve()
+        assert len(second_queries) < len(first_queries)
+
+        collection.words.add(words[1])
+        run_commit_callbacks()
+
+        response_content = retrieve()
+        assert response_content['words_images_count'] == 2
+        assert response_content['words_languages'][0]['words_count'] == 2
+
+    def test_retrieve_sparse_fieldsets(self, auth_api_client, user, collections):
+        """
+        При запросе коллекции с параметром `expand` не возвращаются
+        нераскрытые тяжелые поля коллекции.
+        """
+        collection = collections(user, make=True, data=False)[0]
+
+        response = auth_api_client(user).get(
+            f'{self.endpoint}{collection.slug}/', {'expand': 'words_languages'}
+        )
+        if response.status_code == 307:
+            response = auth_api_client(user).get(response['Location'])
+        response_content = json.loads(response.content)
+
+        assert response.status_code == 200
+        assert 'words_languages' in response_content
+        assert 'words_images' not in response_content
+        assert response_content['title'] == collection.title
+
     # test_related_objs_search
     # test_related_objs_ordering
     # test_related_objs_filters
@@ -3233,6 +4041,48 @@ class TestLanguagesEndpoints:
         )
         assert len(response.data['results']) == len(objs)
 
+    def test_list_learning_words_counters(
+        self, auth_api_client, user, learning_languages, run_commit_callbacks
+    ):
+        """
+        Для каждого изучаемого языка возвращается количество слов всего и по
+        статусам активности, количество запросов не зависит от количества языков.
+        """
+        client = auth_api_client(user)
+
+        def get_languages():
+            with CaptureQueriesContext(connection) as context:
+                response = client.get(f'{self.endpoint}?no_words')
+                if response.status_code == 307:
+                    response = client.get(response['Location'])
+            assert response.status_code == 200
+            return len(context.captured_queries), response.data['results']
+
+        def add_words(learning_language):
+            for activity_status, amount in (('I', 3), ('A', 2), ('M', 1)):
+                baker.make(
+                    Word,
+                    author=user,
+                    language=learning_language.language,
+                    activity_status=activity_status,
+                    _quantity=amount,
+                )
+
+        add_words(learning_languages(user, data=False, _quantity=1)[0])
+        queries_amount, _ = get_languages()
+        for learning_language in learning_languages(user, data=False, _quantity=2):
+            add_words(learning_language)
+        run_commit_callbacks()
+        more_languages_queries_amount, results = get_languages()
+
+        assert more_languages_queries_amount == queries_amount
+        assert len(results) == 3
+        for result in results:
+            assert result['words_count'] == 6
+            assert result['inactive_words_count'] == 3
+            assert result['active_words_count'] == 2
+            assert result['mastered_words_count'] == 1
+
     def test_create(self, auth_api_client, user, languages):
         language_name = languages(name=True, extra_data={'learning_available': True})[0]
         source_data = [
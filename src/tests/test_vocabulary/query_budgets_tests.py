@@ -0,0 +1,18 @@
+import pytest
+
+from tests.query_budgets import get_routes_params
+
+pytestmark = [pytest.mark.django_db, pytest.mark.e2e, pytest.mark.query_budgets]
+
+
+@pytest.mark.parametrize('route', get_routes_params())
+def test_query_budget(
+    auth_api_client, user, large_vocabulary, check_query_budget, route
+):
+    """
+    Количество запросов к базе данных для маршрута с большим словарем
+    пользователя не превышает бюджет маршрута.
+    """
+    lookups = large_vocabulary(user)
+
+    check_query_budget(auth_api_client(user), route, **lookups)
@@ -0,0 +1,75 @@
+import pytest
+
+from model_bakery import baker
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from apps.vocabulary.models import (
+    Word,
+    WordCounter,
+    Collection,
+    CollectionCounter,
+    WordSearchDocument,
+    WordTranslation,
+)
+from apps.languages.models import Language
+
+pytestmark = [pytest.mark.commands]
+
+
+class TestRebuildWordCountersCommand:
+    @pytest.mark.django_db
+    def test_rebuild_command(self):
+        word = baker.make(Word, _fill_optional=True)
+        word.translations.add(
+            *baker.make(WordTranslation, _quantity=2, _fill_optional=True)
+        )
+        collection = baker.make(Collection, _fill_optional=True)
+        collection.words.add(word)
+        WordCounter.objects.all().delete()
+        CollectionCounter.objects.all().delete()
+
+        with pytest.raises(CommandError):
+            call_command('rebuildwordcounters', '--verify')
+
+        call_command('rebuildwordcounters')
+        call_command('rebuildwordcounters', '--verify')
+
+        assert WordCounter.objects.get(word=word).translations_count == 2
+        assert (
+            CollectionCounter.objects.get(collection=collection).translated_words_count
+            == 1
+        )
+
+
+class TestClearExtraObjectsCommand:
+    @pytest.mark.django_db
+    def test_clear_command(self):
+        baker.make(WordTranslation, _quantity=3, _fill_optional=True)
+        linked_translation = baker.make(WordTranslation, _fill_optional=True)
+        baker.make(Word, _fill_optional=True).translations.add(linked_translation)
+
+        call_command('clearextraobjects', batch_size=2)
+
+        assert list(WordTranslation.objects.values_list('pk', flat=True)) == [
+            linked_translation.pk
+        ]
+
+
+class TestGenerateVocabularyCommand:
+    @pytest.mark.django_db
+    def test_generated_data_reproducible(self):
+        baker.make(Language, learning_available=True, _quantity=2)
+        options = ('--users', '3', '--words', '20', '--seed', '7')
+
+        call_command('generatevocabulary', *options, '--prefix', 'first')
+        call_command('generatevocabulary', *options, '--prefix', 'second')
+
+        first_words = Word.objects.filter(author__username__startswith='first_')
+        second_words = Word.objects.filter(author__username__startswith='second_')
+        assert first_words.exists()
+        assert sorted(first_words.values_list('text', flat=True)) == sorted(
+            second_words.values_list('text', flat=True)
+        )
+        assert not WordSearchDocument.objects.filter(document='').exists()
+        call_command('rebuildwordcounters', '--verify')
@@ -1,9 +1,23 @@
 import pytest
 
 from model_bakery import baker
+from django.db import connection
 from django.db.models.signals import pre_save
+from django.test.utils import CaptureQueriesContext
 
-from apps.vocabulary.models import Word
+from apps.vocabulary.models import (
+    Word,
+    WordCounter,
+    Collection,
+    CollectionCounter,
+    ImageAssociation,
+    WordSearchDocument,
+    WordTranslation,
+    WordTranslations,
+    WordTag,
+    Definition,
+    get_vocabulary_version,
+)
 
 pytestmark = [pytest.mark.signals]
 
@@ -17,6 +31,195 @@ class TestSlugFiller:
 
         assert instance.slug != ''
 
+
+class TestWordCounters:
+    @pytest.mark.django_db
+    def test_counters_created_with_word(self):
+        word = baker.make(Word, _fill_optional=True)
+
+        assert WordCounter.objects.filter(word=word).exists()
+
+    @pytest.mark.django_db
+    def test_add_remove_related_objs(self):
+        word = baker.make(Word, _fill_optional=True)
+        translations = baker.make(WordTranslation, _quantity=2, _fill_optional=True)
+        tags = baker.make(WordTag, _quantity=3, _fill_optional=True)
+
+        word.translations.add(*translations)
+        word.tags.set(tags)
+        word.counters.refresh_from_db()
+
+        assert word.counters.translations_count == 2
+        assert word.counters.tags_count == 3
+
+        word.translations.remove(translations[0])
+        word.tags.clear()
+        word.counters.refresh_from_db()
+
+        assert word.counters.translations_count == 1
+        assert word.counters.tags_count == 0
+
+    @pytest.mark.django_db
+    def test_related_obj_delete(self):
+        word = baker.make(Word, _fill_optional=True)
+        tags = baker.make(WordTag, _quantity=2, _fill_optional=True)
+        word.tags.set(tags)
+
+        tags[0].delete()
+        word.counters.refresh_from_db()
+
+        assert word.counters.tags_count == 1
+
+    @pytest.mark.django_db
+    def test_intermediary_objs_create_delete(self):
+        word = baker.make(Word, _fill_optional=True)
+        translation = baker.make(WordTranslation, _fill_optional=True)
+
+        intermediary_obj = WordTranslations.objects.create(
+            word=word, translation=translation
+        )
+        word.counters.refresh_from_db()
+
+        assert word.counters.translations_count == 1
+
+        intermediary_obj.delete()
+        word.counters.refresh_from_db()
+
+        assert word.counters.translations_count == 0
+
+    @pytest.mark.django_db
+    def test_symmetrical_relations(self):
+        word, synonym = baker.make(Word, _quantity=2, _fill_optional=True)
+
+        word.synonyms.add(synonym)
+
+        assert WordCounter.objects.get(word=word).synonyms_count == 1
+        assert WordCounter.objects.get(word=synonym).synonyms_count == 1
+
+        synonym.delete()
+
+        assert WordCounter.objects.get(word=word).synonyms_count == 0
+
+
+class TestCollectionCounters:
+    @pytest.mark.django_db
+    def test_counters_created_with_collection(self):
+        collection = baker.make(Collection, _fill_optional=True)
+
+        assert CollectionCounter.objects.filter(collection=collection).exists()
+
+    @pytest.mark.django_db
+    def test_words_related_objs_change(self):
+        collection = baker.make(Collection, _fill_optional=True)
+        words = baker.make(Word, _quantity=2, _fill_optional=True)
+        translation = baker.make(WordTranslation, _fill_optional=True)
+        image = baker.make(ImageAssociation, _fill_optional=True)
+        collection.words.add(*words)
+
+        words[0].translations.add(translation)
+        image.words.set(words)
+        collection.counters.refresh_from_db()
+
+        assert collection.counters.translated_words_count == 1
+        assert collection.counters.illustrated_words_count == 2
+
+        translation.delete()
+        words[1].delete()
+        collection.counters.refresh_from_db()
+
+        assert collection.counters.translated_words_count == 0
+        assert collection.counters.illustrated_words_count == 1
+
+    @pytest.mark.django_db
+    def test_collection_words_change(self):
+        collection = baker.make(Collection, _fill_optional=True)
+        word = baker.make(Word, _fill_optional=True)
+        word.translations.add(baker.make(WordTranslation, _fill_optional=True))
+
+        word.collections.add(collection)
+        collection.counters.refresh_from_db()
+
+        assert collection.counters.translated_words_count == 1
+
+        collection.words.remove(word)
+        collection.counters.refresh_from_db()
+
+        assert collection.counters.translated_words_count == 0
+
+
+class TestWordSearchDocument:
+    @pytest.mark.django_db
+    def test_document_updated(self):
+        word = baker.make(Word, text='Word', _fill_optional=True)
+        translation = baker.make(WordTranslation, text='Слово', _fill_optional=True)
+
+        word.translations.add(translation)
+
+        assert WordSearchDocument.objects.get(word=word).document == 'word слово'
+
+        translation.text = 'Текст'
+        translation.save()
+
+        assert WordSearchDocument.objects.get(word=word).document == 'word текст'
+
+        word.translations.remove(translation)
+
+        assert WordSearchDocument.objects.get(word=word).document == 'word'
+
+
+class TestOrphansDeletion:
+    @pytest.mark.django_db
+    def test_unlinked_objects_deleted_after_commit(
+        self, django_capture_on_commit_callbacks
+    ):
+        word, other_word = baker.make(Word, _quantity=2, _fill_optional=True)
+        translations = baker.make(WordTranslation, _quantity=2, _fill_optional=True)
+        shared_translation = baker.make(WordTranslation, _fill_optional=True)
+        tag = baker.make(WordTag, _fill_optional=True)
+        definition = baker.make(Definition, _fill_optional=True)
+        word.translations.add(*translations, shared_translation)
+        other_word.translations.add(shared_translation)
+        word.tags.add(tag)
+        other_word.definitions.add(definition)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            word.delete()
+            other_word.definitions.remove(definition)
+
+        assert not WordTranslation.objects.filter(
+            pk__in=[translation.pk for translation in translations]
+        ).exists()
+        assert WordTranslation.objects.filter(pk=shared_translation.pk).exists()
+        assert not WordTag.objects.filter(pk=tag.pk).exists()
+        assert not Definition.objects.filter(pk=definition.pk).exists()
+
     # word post delete extra objs
 
     # user pre save set default settings
+
+
+class TestVocabularyModificationMarkers:
+    @pytest.mark.django_db
+    def test_marked_once_per_transaction(self, user, run_commit_callbacks):
+        word = baker.make(Word, author=user, _fill_optional=True)
+        run_commit_callbacks()
+        version = get_vocabulary_version(user.pk)
+
+        for translation in baker.make(
+            WordTranslation, author=user, _quantity=2, _fill_optional=True
+        ):
+            WordTranslations.objects.create(word=word, translation=translation)
+        word.tags.add(baker.make(WordTag, author=user, _fill_optional=True))
+
+        assert get_vocabulary_version(user.pk) == version
+
+        with CaptureQueriesContext(connection) as context:
+            run_commit_callbacks()
+
+        # single query fetches words authors
+        assert len(context) == 1
+        # user's version is incremented once
+        assert (
+            int(get_vocabulary_version(user.pk).split('.')[0])
+            == int(version.split('.')[0]) + 1
+        )
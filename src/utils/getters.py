@@ -1,9 +1,15 @@
 """Utils to get something."""
 
 import os
-from typing import Any, Type
+import uuid
+import random
+import operator
+from functools import reduce
+from typing import Any, Callable, Type
 
-from django.db.models import Model
+from django.db.models import F, Max, Min, Model, Q, Subquery, UUIDField, Window
+from django.db.models.functions import RowNumber
+from django.db.models.query import QuerySet
 from django.core.exceptions import ObjectDoesNotExist
 from django.contrib.auth import get_user_model
 
@@ -43,3 +49,170 @@ def get_yc_headers() -> dict[str, str]:
     """Returns headers for Yandex Translator API."""
     token = os.getenv('YC_YAM_TOKEN', default='')
     return {'Authorization': f'Bearer {token}'}
+
+
+def get_random_keys(queryset: QuerySet, amount: int) -> list[Any]:
+    """
+    Returns list of random values within queryset model primary keys range:
+    random UUIDs for UUID primary keys, random integers between minimal and
+    maximal keys otherwise (empty list if queryset is empty).
+    """
+    if isinstance(queryset.model._meta.pk, UUIDField):
+        return [uuid.UUID(int=random.getrandbits(128)) for _ in range(amount)]
+    keys_range = queryset.aggregate(min_key=Min('pk'), max_key=Max('pk'))
+    if keys_range['min_key'] is None:
+        return []
+    return [
+        random.randint(keys_range['min_key'], keys_range['max_key'])
+        for _ in range(amount)
+    ]
+
+
+def get_random_objs(
+    queryset: QuerySet, amount: int = 1, probes_rounds: int = 3
+) -> list[Type[Model]]:
+    """
+    Returns list of distinct random objects from passed queryset (all queryset
+    objects in random order if there are less of them than `amount`), queryset
+    objects are not counted.
+    Objects are sampled by random primary keys: every probe takes first not
+    sampled object with key greater or equal to random one using primary key
+    index, all probes of one round are made with single query. Probes missed
+    (same objects or keys beyond greatest one) are repeated in next rounds
+    until `amount` objects are sampled or round samples nothing. Objects still
+    missing then (queryset has less objects than `amount` or, rarely, probes
+    missed in every round) are taken from not sampled ones in random order.
+    Sampling is uniform over keys, not objects: objects following larger keys
+    gaps are more likely to be sampled.
+    """
+    objs = {}
+    for _ in range(probes_rounds):
+        keys = get_random_keys(queryset, amount - len(objs))
+        if not keys:
+            break
+        pks = queryset.exclude(pk__in=objs.keys()).order_by('pk').values('pk')
+        probes = (Q(pk=Subquery(pks.filter(pk__gte=key)[:1])) for key in keys)
+        sampled_amount = len(objs)
+        objs.update(
+            (obj.pk, obj) for obj in queryset.filter(reduce(operator.or_, probes))
+        )
+        if len(objs) in (amount, sampled_amount):
+            break
+
+    missing_amount = amount - len(objs)
+    if missing_amount:
+        objs.update(
+            (obj.pk, obj)
+            for obj in queryset.exclude(pk__in=objs.keys()).order_by('?')[
+                :missing_amount
+            ]
+        )
+    return random.sample(list(objs.values()), len(objs))
+
+
+def prefetch_top_n(
+    instances: list[Type[Model]],
+    queryset: QuerySet,
+    parent_fields: str | tuple[str, ...],
+    amount: int,
+    to_attr: str,
+    parent_key: Callable[[Type[Model]], Any] = operator.attrgetter('pk'),
+    related_field: str | None = None,
+) -> None:
+    """
+    Sets list of first `amount` queryset objects related to every passed instance
+    to `to_attr` instance attribute, fetching them for all instances with single
+    windowed query.
+    Queryset objects are partitioned by `parent_fields` values (ordered by queryset
+    ordering within partition) and matched with `parent_key(instance)` value
+    (tuple of values if several parent fields passed).
+    If `related_field` is passed, its value is set instead of queryset object
+    (useful to get related objects from intermediary models).
+    """
+    if not instances:
+        return None
+
+    single_field = isinstance(parent_fields, str)
+    if single_field:
+        parent_fields = (parent_fields,)
+    keys = [
+        (key,) if single_field else key
+        for key in (parent_key(instance) for instance in instances)
+    ]
+
+    ordering = queryset.query.order_by or queryset.model._meta.ordering
+    order_by = [
+        field
+        if not isinstance(field, str)
+        else F(field[1:]).desc()
+        if field.startswith('-')
+        else F(field).asc()
+        for field in ordering
+    ] + [F('pk').asc()]
+
+    parents_names = [f'top_n_parent_{index}' for index in range(len(parent_fields))]
+    rows = (
+        queryset.filter(
+            **{
+                f'{field}__in': {key[index] for key in keys}
+                for index, field in enumerate(parent_fields)
+            }
+        )
+        .annotate(
+            **{name: F(field) for name, field in zip(parents_names, parent_fields)},
+            top_n_position=Window(
+                expression=RowNumber(),
+                partition_by=[F(field) for field in parent_fields],
+                order_by=order_by,
+            ),
+        )
+        .filter(top_n_position__lte=amount)
+        .order_by('top_n_position')
+    )
+
+    objs_by_key = {key: [] for key in keys}
+    for row in rows:
+        key = tuple(getattr(row, name) for name in parents_names)
+        if key in objs_by_key:
+            objs_by_key[key].append(
+                getattr(row, related_field) if related_field else row
+            )
+
+    for instance, key in zip(instances, keys):
+        setattr(instance, to_attr, objs_by_key[key])
+    return None
+
+
+class UnionQuerySet:
+    """
+    Lazy UNION ALL of querysets with the same values fields. Filters are applied
+    to every merged queryset, ordering and slicing are applied to the union, so
+    it can be paginated with cursor pagination in single query.
+    """
+
+    def __init__(self, *querysets: QuerySet, ordering: tuple = ()) -> None:
+        self.querysets = querysets
+        self.ordering = ordering
+
+    def filter(self, *args, **kwargs) -> 'UnionQuerySet':
+        return UnionQuerySet(
+            *(queryset.filter(*args, **kwargs) for queryset in self.querysets),
+            ordering=self.ordering,
+        )
+
+    def order_by(self, *fields: str) -> 'UnionQuerySet':
+        return UnionQuerySet(*self.querysets, ordering=fields)
+
+    def count(self) -> int:
+        return sum(queryset.count() for queryset in self.querysets)
+
+    def union(self) -> QuerySet:
+        """Returns merged querysets union (nested ordering is not allowed)."""
+        first, *other = (queryset.order_by() for queryset in self.querysets)
+        return first.union(*other, all=True).order_by(*self.ordering)
+
+    def __getitem__(self, key: int | slice) -> QuerySet | dict:
+        return self.union()[key]
+
+    def __iter__(self):
+        return iter(self.union())
@@ -0,0 +1,55 @@
+"""Utils to run actions once per database transaction."""
+
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Iterable
+
+from django.db import transaction
+
+
+class TransactionCollector:
+    """
+    Collects values by keys during current transaction and passes them (dict of
+    sets) to `callback` once after transaction is committed, or immediately if
+    there is no transaction. Callback is registered once per transaction.
+    Registered callback is discarded when transaction is rolled back, values
+    collected with it are reset then, so they do not leak into next transaction
+    of the same thread.
+    """
+
+    def __init__(
+        self, callback: Callable[[dict[Any, set]], None], using: str | None = None
+    ) -> None:
+        self.callback = callback
+        self.using = using
+        self.local = threading.local()
+
+    def is_registered(self) -> bool:
+        """
+        Returns True if collected values are waiting for current transaction
+        commit.
+        """
+        flush = getattr(self.local, 'flush', None)
+        if flush is None:
+            return False
+        connection = transaction.get_connection(self.using)
+        return any(callback is flush for _, callback, *_ in connection.run_on_commit)
+
+    def add(self, key: Any, values: Iterable) -> None:
+        """Adds values to collected ones by key."""
+        if self.is_registered():
+            self.local.collected[key].update(values)
+            return
+
+        # values collected in ended (rolled back) transaction are reset
+        collected = defaultdict(set)
+        collected[key].update(values)
+
+        def flush() -> None:
+            if getattr(self.local, 'flush', None) is flush:
+                del self.local.flush, self.local.collected
+            self.callback(collected)
+
+        self.local.flush = flush
+        self.local.collected = collected
+        transaction.on_commit(flush, using=self.using)